@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+"""
+BENCHMARKS DEL MOTOR
+FV Engine
+
+Responsabilidad
+---------------
+
+Medir los caminos calientes del motor con entradas sintéticas fijas
+(sin red, sin UI) y compararlos contra una línea base versionada:
+
+    entradas.py   → panel / inversor / clima / proyecto fijos
+    casos.py      → qué se mide (CASOS)
+    ejecutor.py   → tiempo, throughput, memoria pico, comparación
+
+Uso
+---
+
+    python -m benchmarks                      # compara con linea_base.json
+    python -m benchmarks -k strings           # solo casos que contienen "strings"
+    python -m benchmarks --guardar-base       # actualiza la línea base
+    python -m benchmarks --estricto           # código 1 si hay regresiones
+
+La línea base depende de la máquina: se regenera al cambiar de
+entorno y se compara siempre en el mismo.
+"""
+
+from .ejecutor import (
+    MedicionCaso,
+    comparar_con_base,
+    ejecutar_benchmarks,
+)
+
+__all__ = [
+    "MedicionCaso",
+    "comparar_con_base",
+    "ejecutar_benchmarks",
+]
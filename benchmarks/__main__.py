@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .ejecutor import (
+    LINEA_BASE,
+    cargar_base,
+    comparar_con_base,
+    ejecutar_benchmarks,
+    guardar_base,
+)
+
+
+# ==========================================================
+# MAIN
+# ==========================================================
+
+def main():
+
+    ap = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks del motor FV")
+
+    ap.add_argument("-k", "--filtro", default=None, help="solo casos cuyo nombre contiene este texto")
+    ap.add_argument("--base", default=str(LINEA_BASE), help="JSON de línea base")
+    ap.add_argument("--guardar-base", action="store_true", help="escribe los resultados como línea base")
+    ap.add_argument("--salida", default="", help="escribe los resultados en este JSON")
+    ap.add_argument("--tolerancia", type=float, default=0.25, help="regresión si actual > base × (1 + tol)")
+    ap.add_argument("--estricto", action="store_true", help="código de salida 1 si hay regresiones")
+
+    args = ap.parse_args()
+
+    print("Midiendo...", file=sys.stderr)
+
+    resultados = ejecutar_benchmarks(args.filtro)
+
+    if args.salida:
+        Path(args.salida).write_text(json.dumps(resultados, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.guardar_base:
+        guardar_base(resultados, Path(args.base))
+        print(f"\nLínea base actualizada: {args.base}")
+        return
+
+    base = cargar_base(Path(args.base))
+
+    if base is None:
+        print(f"\nSin línea base en {args.base} (usar --guardar-base)")
+        return
+
+    filas = comparar_con_base(resultados, base, tolerancia=args.tolerancia, tolerancia_mem=args.tolerancia)
+
+    print(f"\n{'caso':<32} {'base min ms':>12} {'actual min ms':>14} {'×tiempo':>8} {'×mem':>6}  estado")
+
+    for f in filas:
+
+        if f["estado"] == "nuevo":
+            print(f"{f['nombre']:<32} {'-':>12} {'-':>14} {'-':>8} {'-':>6}  nuevo")
+            continue
+
+        print(
+            f"{f['nombre']:<32} {f['base_ms']:>12.2f} {f['actual_ms']:>14.2f} "
+            f"{f['ratio_tiempo']:>8.2f} {f['ratio_memoria']:>6.2f}  {f['estado']}"
+        )
+
+    regresiones = [f for f in filas if f["estado"] == "regresión"]
+
+    if regresiones and args.estricto:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+"""
+CASOS DE BENCHMARK
+
+Cada caso separa preparar() (no medido) de ejecutar(estado) (medido)
+y declara cuántas unidades procesa por ejecución, para reportar
+throughput (unidades/s) además del tiempo.
+"""
+
+import math
+import tempfile
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, List
+
+from . import entradas
+
+
+# ==========================================================
+# MODELO
+# ==========================================================
+
+@dataclass(frozen=True)
+class Caso:
+
+    nombre: str
+    preparar: Callable[[], Any]
+    ejecutar: Callable[[Any], Any]
+
+    unidades: float
+    unidad: str
+
+
+# ==========================================================
+# ENERGÍA / SOLAR
+# ==========================================================
+
+def _ejecutar_energia(inp):
+    from energy.orquestador_energia import ejecutar_motor_energia
+
+    r = ejecutar_motor_energia(inp)
+
+    if not r.ok:
+        raise ValueError(f"Motor de energía: {r.errores}")
+
+    return r
+
+
+def _ejecutar_solar(clima):
+    from energy.clima.simulacion_8760 import simular_clima_8760
+
+    return simular_clima_8760(clima, tilt=15, azimuth=180, modelo_cielo="perez")
+
+
+def _ejecutar_clima_sintetico(_):
+    from energy.clima.clima_sintetico import generar_clima_sintetico
+
+    return generar_clima_sintetico(entradas.LAT, entradas.LON, anio=entradas.ANIO, semilla=entradas.SEMILLA)
+
+
+def _preparar_serie_8760():
+    return _ejecutar_energia(entradas.entrada_energia()).energia_horaria_kwh
+
+
+def _ejecutar_agregacion(serie):
+    from energy.sistema.agregacion_8760 import agregar_energia_por_mes
+
+    return agregar_energia_por_mes(serie)
+
+
+# ==========================================================
+# ELÉCTRICO
+# ==========================================================
+
+_SERIES_POR_STRING = 14
+
+
+def _ejecutar_strings(n_strings: int, _estado=None):
+    from electrical.paneles.calculo_de_strings import calcular_strings_fv
+
+    r = calcular_strings_fv(
+        n_paneles_total=n_strings * _SERIES_POR_STRING,
+        panel=entradas.PANEL,
+        inversor=entradas.INVERSOR,
+        n_inversores=max(1, math.ceil(n_strings / (2 * entradas.INVERSOR.n_mppt))),
+        t_min_c=5.0,
+    )
+
+    if not r.ok:
+        raise ValueError(f"Strings: {r.errores}")
+
+    return r
+
+
+_CORRIENTES_A = [5.0 + 2.5 * i for i in range(50)]
+_LONGITUDES_M = [15.0, 60.0]
+
+
+def _ejecutar_conductores(_estado=None):
+    from electrical.conductores.calculo_conductores import tramo_conductor
+
+    return [
+        tramo_conductor(
+            nombre="BENCH",
+            i_diseno_a=i_a,
+            v_base_v=600.0,
+            l_m=l_m,
+            vd_obj_pct=2.0,
+        )
+        for i_a in _CORRIENTES_A
+        for l_m in _LONGITUDES_M
+    ]
+
+
+def _ejecutar_combinaciones(_estado=None):
+    from electrical.inversor.orquestador_inversor import sugerir_configuraciones_inversor
+
+    return sugerir_configuraciones_inversor(60.0, 1.2, max_inv=4)
+
+
+def _ejecutar_busqueda_strings(_estado=None):
+    from electrical.paneles.busqueda_strings import buscar_configuraciones_strings
+
+    return buscar_configuraciones_strings(
+        n_paneles_total=2000,
+        panel=entradas.PANEL,
+        inversor=entradas.INVERSOR,
+        t_min_c=5.0,
+    )
+
+
+# ==========================================================
+# VIDA ÚTIL
+# ==========================================================
+
+def _preparar_vida_util():
+    _, resultado = entradas.estudio_fijo()
+    return resultado.energia
+
+
+def _ejecutar_vida_util(energia):
+    from energy.sistema.vida_util import ParametrosDegradacion, simular_vida_util
+
+    v = simular_vida_util(energia.series, energia.cadena, ParametrosDegradacion(anios=25))
+
+    return v.mensual_kwh, v.anual_kwh
+
+
+# ==========================================================
+# FINANZAS
+# ==========================================================
+
+def _ejecutar_finanzas(estado):
+    from core.servicios.finanzas import ejecutar_finanzas
+
+    datos, resultado = estado
+
+    return ejecutar_finanzas(datos=datos, sizing=resultado.sizing, energia=resultado.energia)
+
+
+def _ejecutar_serializacion(estado):
+    from core.aplicacion.serializacion_resultado import deserializar_resultado, serializar_resultado
+
+    _, resultado = estado
+
+    return deserializar_resultado(serializar_resultado(resultado))
+
+
+# ==========================================================
+# REPORTES
+# ==========================================================
+
+def _preparar_charts():
+    _, resultado = entradas.estudio_fijo()
+    return resultado, tempfile.mkdtemp(prefix="bench_charts_")
+
+
+def _ejecutar_charts(estado):
+    from reportes.generar_charts import tareas_charts
+    from reportes.render_imagenes import renderizar_tareas
+
+    resultado, out_dir = estado
+
+    return renderizar_tareas(
+        tareas_charts(resultado, out_dir),
+        usar_cache=False,
+        paralelo=False,
+    )
+
+
+def _preparar_pdf():
+    from reportes.imagenes import generar_artefactos
+
+    datos, resultado = entradas.estudio_fijo()
+
+    out_dir = Path(tempfile.mkdtemp(prefix="bench_pdf_"))
+
+    paths = generar_artefactos(res=resultado, out_dir=out_dir)
+
+    return resultado, dict(datos.__dict__), paths
+
+
+def _ejecutar_pdf(estado):
+    from reportes.generar_pdf_profesional import generar_pdf_profesional
+
+    resultado, datos_pdf, paths = estado
+
+    return generar_pdf_profesional(resultado, datos_pdf, dict(paths))
+
+
+# ==========================================================
+# REGISTRO
+# ==========================================================
+
+CASOS: List[Caso] = [
+    Caso("clima_sintetico_8760", lambda: None, _ejecutar_clima_sintetico, 8760, "h"),
+    Caso("energia_8760", entradas.entrada_energia, _ejecutar_energia, 8760, "h"),
+    Caso("solar_posicion_poa_perez", entradas.clima_sintetico, _ejecutar_solar, 8760, "h"),
+    Caso("agregacion_mensual", _preparar_serie_8760, _ejecutar_agregacion, 8760, "h"),
+
+    Caso("strings_10", lambda: None, partial(_ejecutar_strings, 10), 10, "strings"),
+    Caso("strings_100", lambda: None, partial(_ejecutar_strings, 100), 100, "strings"),
+    Caso("strings_1000", lambda: None, partial(_ejecutar_strings, 1000), 1000, "strings"),
+
+    Caso("conductores_100_tramos", lambda: None, _ejecutar_conductores,
+         len(_CORRIENTES_A) * len(_LONGITUDES_M), "tramos"),
+
+    Caso("combinacion_inversores", lambda: None, _ejecutar_combinaciones, 1, "búsquedas"),
+    Caso("busqueda_strings_2000_paneles", lambda: None, _ejecutar_busqueda_strings, 1, "búsquedas"),
+
+    Caso("vida_util_25_anios", _preparar_vida_util, _ejecutar_vida_util, 25 * 8760, "h"),
+    Caso("finanzas_tir", entradas.estudio_fijo, _ejecutar_finanzas, 1, "estudios"),
+    Caso("serializacion_resultado", entradas.estudio_fijo, _ejecutar_serializacion, 1, "resultados"),
+
+    Caso("charts_render", _preparar_charts, _ejecutar_charts, 5, "figuras"),
+    Caso("pdf_completo", _preparar_pdf, _ejecutar_pdf, 1, "pdf"),
+]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+"""
+EJECUTOR DE BENCHMARKS
+
+Por caso:
+
+    preparar()                       (no medido)
+    1 ejecución de calentamiento     (imports, caches de catálogo)
+    N ejecuciones cronometradas      → mediana / mínimo (gc desactivado, como timeit)
+    1 ejecución con tracemalloc      → memoria pico (asignaciones Python + numpy)
+
+La comparación con la línea base usa el tiempo mínimo (menos sensible
+al ruido de la máquina que la mediana) y la memoria pico; un cociente
+por encima de (1 + tolerancia) se marca como regresión.
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .casos import CASOS, Caso
+
+
+LINEA_BASE = Path(__file__).resolve().parent / "linea_base.json"
+
+MIN_REPETICIONES = 5
+MAX_REPETICIONES = 1000
+TIEMPO_MIN_S = 0.5
+
+
+# ==========================================================
+# MODELOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class MedicionCaso:
+
+    nombre: str
+    repeticiones: int
+
+    mediana_s: float
+    minimo_s: float
+
+    throughput: float
+    unidad: str
+
+    pico_mem_kb: float
+
+
+# ==========================================================
+# MEDICIÓN
+# ==========================================================
+
+def _silencio():
+    # el pipeline imprime trazas de depuración
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def medir_caso(
+    caso: Caso,
+    *,
+    min_rep: int = MIN_REPETICIONES,
+    max_rep: int = MAX_REPETICIONES,
+    tiempo_min_s: float = TIEMPO_MIN_S,
+) -> MedicionCaso:
+
+    with _silencio():
+
+        estado = caso.preparar()
+
+        caso.ejecutar(estado)
+
+        tiempos: List[float] = []
+        t_total = 0.0
+
+        gc_activo = gc.isenabled()
+        gc.disable()
+
+        try:
+            while len(tiempos) < max_rep and (len(tiempos) < min_rep or t_total < tiempo_min_s):
+
+                t0 = time.perf_counter()
+                caso.ejecutar(estado)
+                dt = time.perf_counter() - t0
+
+                tiempos.append(dt)
+                t_total += dt
+        finally:
+            if gc_activo:
+                gc.enable()
+
+        tracemalloc.start()
+
+        try:
+            caso.ejecutar(estado)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    mediana = statistics.median(tiempos)
+
+    return MedicionCaso(
+        nombre=caso.nombre,
+        repeticiones=len(tiempos),
+        mediana_s=round(mediana, 6),
+        minimo_s=round(min(tiempos), 6),
+        throughput=round(caso.unidades / mediana, 2) if mediana > 0 else 0.0,
+        unidad=f"{caso.unidad}/s",
+        pico_mem_kb=round(pico / 1024, 1),
+    )
+
+
+def entorno() -> Dict[str, Any]:
+
+    import numpy as np
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def ejecutar_benchmarks(filtro: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Mide los CASOS (opcionalmente los que contienen `filtro`).
+    """
+
+    casos = [c for c in CASOS if not filtro or filtro in c.nombre]
+
+    if not casos:
+        raise ValueError(f"Ningún caso coincide con '{filtro}'")
+
+    mediciones: Dict[str, Any] = {}
+
+    for caso in casos:
+
+        m = medir_caso(caso)
+        mediciones[m.nombre] = asdict(m)
+
+        print(
+            f"  {m.nombre:<32} {m.mediana_s * 1000:10.2f} ms  "
+            f"{m.throughput:>14,.1f} {m.unidad:<14} {m.pico_mem_kb:>10,.0f} KB",
+            file=sys.stderr,
+        )
+
+    return {
+        "entorno": entorno(),
+        "casos": mediciones,
+    }
+
+
+# ==========================================================
+# LÍNEA BASE
+# ==========================================================
+
+def cargar_base(path: Path = LINEA_BASE) -> Optional[Dict[str, Any]]:
+
+    if not Path(path).exists():
+        return None
+
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def guardar_base(resultados: Dict[str, Any], path: Path = LINEA_BASE) -> None:
+    """
+    Fusiona con la base existente (un -k parcial no borra otros casos).
+    """
+
+    base = cargar_base(path) or {"casos": {}}
+
+    base["entorno"] = resultados["entorno"]
+    base["casos"] = {**base.get("casos", {}), **resultados["casos"]}
+
+    Path(path).write_text(json.dumps(base, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def comparar_con_base(
+    resultados: Dict[str, Any],
+    base: Dict[str, Any],
+    *,
+    tolerancia: float = 0.25,
+    tolerancia_mem: float = 0.25,
+) -> List[Dict[str, Any]]:
+    """
+    Una fila por caso medido con los cocientes actual / base.
+    """
+
+    filas: List[Dict[str, Any]] = []
+
+    for nombre, actual in resultados["casos"].items():
+
+        ref = base.get("casos", {}).get(nombre)
+
+        if ref is None:
+            filas.append({"nombre": nombre, "estado": "nuevo"})
+            continue
+
+        r_t = actual["minimo_s"] / ref["minimo_s"] if ref["minimo_s"] > 0 else 1.0
+        r_m = actual["pico_mem_kb"] / ref["pico_mem_kb"] if ref["pico_mem_kb"] > 0 else 1.0
+
+        regresion = r_t > 1 + tolerancia or r_m > 1 + tolerancia_mem
+
+        filas.append({
+            "nombre": nombre,
+            "estado": "regresión" if regresion else ("mejora" if r_t < 1 - tolerancia else "ok"),
+            "ratio_tiempo": round(r_t, 3),
+            "ratio_memoria": round(r_m, 3),
+            "base_ms": round(ref["minimo_s"] * 1000, 3),
+            "actual_ms": round(actual["minimo_s"] * 1000, 3),
+        })
+
+    return filas
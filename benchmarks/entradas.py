@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+"""
+ENTRADAS SINTÉTICAS FIJAS DE LOS BENCHMARKS
+
+Todo es determinista (semilla fija) y no requiere red: el clima viene
+de energy.clima.clima_sintetico y el estudio completo usa
+fuente_clima = "sintetico".
+"""
+
+from functools import lru_cache
+from typing import Any, Tuple
+
+from electrical.modelos.inversor import InversorSpec
+from electrical.modelos.paneles import PanelSpec
+
+
+LAT = 15.8
+LON = -87.2
+
+ANIO = 2019
+
+SEMILLA = 20240601
+
+
+PANEL = PanelSpec(
+    pmax_w=550.0,
+    vmp_v=41.9,
+    voc_v=49.6,
+    imp_a=13.13,
+    isc_a=13.99,
+    coef_voc_pct_c=-0.27,
+    coef_vmp_pct_c=-0.35,
+    coef_potencia_pct_c=-0.35,
+    noct_c=45.0,
+)
+
+INVERSOR = InversorSpec(
+    kw_ac=20.0,
+    n_mppt=2,
+    mppt_min_v=200.0,
+    mppt_max_v=1000.0,
+    vdc_max_v=1100.0,
+    imppt_max_a=30.0,
+)
+
+
+# ==========================================================
+# CLIMA
+# ==========================================================
+
+@lru_cache(maxsize=4)
+def clima_sintetico(lat: float = LAT, lon: float = LON, semilla: int = SEMILLA):
+    """
+    ResultadoClima 8760 determinista.
+    """
+
+    from energy.clima.clima_sintetico import generar_clima_sintetico
+
+    return generar_clima_sintetico(lat, lon, anio=ANIO, semilla=semilla)
+
+
+# ==========================================================
+# ENERGÍA
+# ==========================================================
+
+def entrada_energia(n_series: int = 14, n_strings: int = 4):
+    """
+    EnergiaInput de un generador sobre el clima sintético.
+    """
+
+    from energy.clima.simulacion_8760 import simular_clima_8760
+    from energy.contrato import EnergiaInput
+
+    clima_8760 = simular_clima_8760(clima_sintetico(), tilt=15, azimuth=180)
+
+    pdc_kw = n_series * n_strings * PANEL.pmax_w / 1000
+
+    return EnergiaInput(
+        n_series=n_series,
+        n_strings=n_strings,
+        pdc_kw=pdc_kw,
+        panel=PANEL,
+        pac_nominal_kw=INVERSOR.kw_ac,
+        clima=clima_8760,
+        tilt_deg=15,
+        azimut_deg=180,
+        perdidas_dc_frac=0.05,
+        sombras_frac=0.02,
+        eficiencia_inversor=0.97,
+        perdidas_ac_frac=0.02,
+    )
+
+
+# ==========================================================
+# PROYECTO COMPLETO
+# ==========================================================
+
+def datos_proyecto():
+
+    from core.dominio.modelo import Datosproyecto
+
+    p = Datosproyecto(
+        cliente="Benchmark",
+        ubicacion="Sintética",
+        lat=LAT,
+        lon=LON,
+        consumo_12m=[10000.0] * 12,
+        tarifa_energia=5.0,
+        cargos_fijos=0.0,
+        prod_base_kwh_kwp_mes=[120.0] * 12,
+        factores_fv_12m=[1.0] * 12,
+        cobertura_objetivo=1.0,
+        costo_usd_kwp=1000.0,
+        tcambio=24.5,
+        tasa_anual=0.1,
+        plazo_anios=10,
+        porcentaje_financiado=0.0,
+    )
+
+    p.equipos = {"panel_id": "canadian_450", "inversor_id": "inv_5kw_2mppt"}
+
+    p.sistema_fv = {
+        "modo": "multizona",
+        "zonas": [
+            {"nombre": "Zona 1", "modo": "paneles", "n_paneles": 10, "azimut": 180, "inclinacion": 15},
+        ],
+    }
+
+    p.electrico = {"vac": 240, "fases": 1, "fp": 1.0, "dist_dc_m": 15, "dist_ac_m": 25}
+
+    p.fuente_clima = "sintetico"
+
+    return p
+
+
+@lru_cache(maxsize=1)
+def estudio_fijo() -> Tuple[Any, Any]:
+    """
+    (datos, ResultadoProyecto) del proyecto sintético, calculado una vez.
+    """
+
+    import contextlib
+    import io
+
+    from core.aplicacion.dependencias import construir_dependencias
+    from core.aplicacion.orquestador_estudio import ejecutar_estudio
+
+    datos = datos_proyecto()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        resultado = ejecutar_estudio(datos, construir_dependencias())
+
+    if not resultado.ok:
+        raise ValueError(f"Estudio sintético inválido: {resultado.errores}")
+
+    return datos, resultado
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+"""
+ALMACÉN LOCAL DE ESTUDIOS (SQLite) — FV Engine
+==============================================
+
+Responsabilidad
+---------------
+
+Guardar estudios terminados (datos + ResultadoProyecto) en una base
+SQLite embebida, para consultar la cartera y reabrir cualquier
+estudio sin recalcular.
+
+Esquema (tabla estudios)
+------------------------
+
+    columnas indexadas   cliente, ubicacion, (lat, lon), kwp,
+                         kwh_kwp, tir_pct, payback_anios, fecha
+    huella               única (opcional): mismos inputs → reemplaza
+    blobs                datos      (serializacion_resultado)
+                         resultado  (serializacion_resultado)
+                         energia_horaria (float64 little-endian crudo)
+    entradas_ui          JSON con los inputs del wizard (reapertura)
+
+Concurrencia
+------------
+
+    ✔ modo WAL: lectores concurrentes con un escritor
+    ✔ una conexión por operación (seguro entre hilos de Streamlit)
+    ✔ inserción por lotes en una sola transacción (guardar_lote)
+
+Frontera
+--------
+
+Entrada:
+    Datosproyecto + ResultadoProyecto
+
+Salida:
+    EstudioGuardado (fila resumen) / EstudioAbierto (completo)
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.aplicacion.serializacion_resultado import deserializar_resultado, serializar_resultado
+
+
+RUTA_ALMACEN = Path("cache") / "estudios.sqlite"
+
+VERSION_ESQUEMA = 1
+
+TIMEOUT_BLOQUEO_S = 30.0
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS estudios (
+    id                   INTEGER PRIMARY KEY,
+    huella               TEXT,
+    proyecto_id          TEXT NOT NULL DEFAULT '',
+    cliente              TEXT NOT NULL DEFAULT '',
+    ubicacion            TEXT NOT NULL DEFAULT '',
+    lat                  REAL,
+    lon                  REAL,
+    kwp                  REAL,
+    produccion_anual_kwh REAL,
+    kwh_kwp              REAL,
+    tir_pct              REAL,
+    payback_anios        REAL,
+    capex_L              REAL,
+    fecha                TEXT NOT NULL,
+    entradas_ui          TEXT,
+    datos                BLOB NOT NULL,
+    resultado            BLOB NOT NULL,
+    energia_horaria      BLOB
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_estudios_huella ON estudios (huella) WHERE huella IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_estudios_cliente   ON estudios (cliente);
+CREATE INDEX IF NOT EXISTS ix_estudios_ubicacion ON estudios (ubicacion);
+CREATE INDEX IF NOT EXISTS ix_estudios_latlon    ON estudios (lat, lon);
+CREATE INDEX IF NOT EXISTS ix_estudios_kwp       ON estudios (kwp);
+CREATE INDEX IF NOT EXISTS ix_estudios_kwh_kwp   ON estudios (kwh_kwp);
+CREATE INDEX IF NOT EXISTS ix_estudios_tir       ON estudios (tir_pct);
+CREATE INDEX IF NOT EXISTS ix_estudios_payback   ON estudios (payback_anios);
+CREATE INDEX IF NOT EXISTS ix_estudios_fecha     ON estudios (fecha);
+"""
+
+_COLUMNAS_ORDEN = ("fecha", "cliente", "ubicacion", "kwp", "kwh_kwp", "tir_pct", "payback_anios")
+
+
+# ==========================================================
+# MODELOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class RegistroEstudio:
+    """
+    Estudio a guardar.
+
+    huella:
+        identifica los inputs; un estudio con la misma huella se
+        reemplaza en lugar de duplicarse.
+    """
+
+    datos: Any
+    resultado: Any
+
+    proyecto_id: str = ""
+    huella: Optional[str] = None
+    entradas_ui: Optional[Dict[str, Any]] = None
+    fecha: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class EstudioGuardado:
+    """
+    Fila resumen (sin blobs).
+    """
+
+    id: int
+    proyecto_id: str
+    cliente: str
+    ubicacion: str
+
+    lat: Optional[float]
+    lon: Optional[float]
+
+    kwp: Optional[float]
+    produccion_anual_kwh: Optional[float]
+    kwh_kwp: Optional[float]
+
+    tir_pct: Optional[float]
+    payback_anios: Optional[float]
+    capex_L: Optional[float]
+
+    fecha: str
+
+
+@dataclass(frozen=True)
+class EstudioAbierto:
+
+    resumen: EstudioGuardado
+
+    datos: Any
+    resultado: Any
+
+    entradas_ui: Optional[Dict[str, Any]]
+
+
+_CAMPOS_RESUMEN = tuple(f.name for f in fields(EstudioGuardado))
+
+
+# ==========================================================
+# EXTRACCIÓN DE INDICADORES
+# ==========================================================
+
+def _valor(obj: Any, clave: str) -> Any:
+
+    if obj is None:
+        return None
+
+    if isinstance(obj, dict):
+        return obj.get(clave)
+
+    return getattr(obj, clave, None)
+
+
+def _num(x: Any) -> Optional[float]:
+
+    try:
+        v = float(x)
+    except (TypeError, ValueError):
+        return None
+
+    return v if np.isfinite(v) else None
+
+
+def _fila(r: RegistroEstudio) -> Dict[str, Any]:
+
+    res = r.resultado
+    energia = _valor(res, "energia")
+    fin = _valor(res, "financiero")
+
+    horaria = _valor(energia, "energia_horaria_kwh")
+
+    return {
+        "huella": r.huella,
+        "proyecto_id": str(r.proyecto_id or ""),
+        "cliente": str(_valor(r.datos, "cliente") or ""),
+        "ubicacion": str(_valor(r.datos, "ubicacion") or ""),
+        "lat": _num(_valor(r.datos, "lat")),
+        "lon": _num(_valor(r.datos, "lon")),
+        "kwp": _num(_valor(_valor(res, "sizing"), "pdc_kw")),
+        "produccion_anual_kwh": _num(_valor(energia, "energia_util_anual")),
+        "kwh_kwp": _num(_valor(energia, "produccion_especifica_kwh_kwp")),
+        "tir_pct": _num(_valor(fin, "tir_pct")),
+        "payback_anios": _num(_valor(fin, "payback_anios")),
+        "capex_L": _num(_valor(fin, "capex_L")),
+        "fecha": r.fecha or datetime.now().isoformat(timespec="seconds"),
+        "entradas_ui": json.dumps(r.entradas_ui, ensure_ascii=False, default=str) if r.entradas_ui is not None else None,
+        "datos": serializar_resultado(r.datos),
+        "resultado": serializar_resultado(res),
+        "energia_horaria": (
+            np.asarray(horaria, dtype="<f8").tobytes() if horaria is not None and len(horaria) else None
+        ),
+    }
+
+
+# ==========================================================
+# ALMACÉN
+# ==========================================================
+
+class AlmacenResultados:
+    """
+    Uso:
+
+        alm = AlmacenResultados()
+        id_ = alm.guardar(datos, resultado)
+        alm.buscar(payback_max=5, ubicacion="Tegucigalpa")
+        alm.abrir(id_)
+    """
+
+    def __init__(self, ruta: Union[str, Path] = RUTA_ALMACEN) -> None:
+
+        self.ruta = Path(ruta)
+
+        self._inicializado = False
+
+    # ------------------------------------------------------
+    # CONEXIÓN
+    # ------------------------------------------------------
+
+    @contextmanager
+    def _conexion(self) -> Iterator[sqlite3.Connection]:
+
+        if not self._inicializado:
+            self.ruta.parent.mkdir(parents=True, exist_ok=True)
+
+        con = sqlite3.connect(self.ruta, timeout=TIMEOUT_BLOQUEO_S)
+
+        try:
+            if not self._inicializado:
+                self._migrar(con)
+                self._inicializado = True
+
+            with con:
+                yield con
+
+        finally:
+            con.close()
+
+    @staticmethod
+    def _migrar(con: sqlite3.Connection) -> None:
+
+        version = con.execute("PRAGMA user_version").fetchone()[0]
+
+        if version > VERSION_ESQUEMA:
+            raise ValueError(f"Almacén con esquema {version} más nuevo que el soportado ({VERSION_ESQUEMA})")
+
+        con.execute("PRAGMA journal_mode=WAL")
+
+        con.executescript(_ESQUEMA)
+
+        con.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+
+    # ------------------------------------------------------
+    # ESCRITURA
+    # ------------------------------------------------------
+
+    def guardar_lote(self, registros: Iterable[RegistroEstudio]) -> List[int]:
+        """
+        Inserta todos los registros en una transacción; devuelve los ids.
+        """
+
+        filas = [_fila(r) for r in registros]
+
+        if not filas:
+            return []
+
+        columnas = list(filas[0])
+
+        sql = (
+            f"INSERT INTO estudios ({', '.join(columnas)}) "
+            f"VALUES ({', '.join(':' + c for c in columnas)}) "
+            "ON CONFLICT(huella) WHERE huella IS NOT NULL DO UPDATE SET "
+            + ", ".join(f"{c} = excluded.{c}" for c in columnas if c != "huella")
+            + " RETURNING id"
+        )
+
+        ids: List[int] = []
+
+        with self._conexion() as con:
+            for f in filas:
+                ids.append(con.execute(sql, f).fetchone()[0])
+
+        return ids
+
+    def guardar(self, datos: Any, resultado: Any, **kwargs: Any) -> int:
+
+        return self.guardar_lote([RegistroEstudio(datos=datos, resultado=resultado, **kwargs)])[0]
+
+    def borrar(self, id_estudio: int) -> bool:
+
+        with self._conexion() as con:
+            return con.execute("DELETE FROM estudios WHERE id = ?", (int(id_estudio),)).rowcount > 0
+
+    # ------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------
+
+    def buscar(
+        self,
+        *,
+        cliente: Optional[str] = None,
+        ubicacion: Optional[str] = None,
+        texto: Optional[str] = None,
+        region: Optional[Tuple[float, float, float, float]] = None,
+        kwp_min: Optional[float] = None,
+        kwp_max: Optional[float] = None,
+        kwh_kwp_min: Optional[float] = None,
+        tir_min: Optional[float] = None,
+        payback_max: Optional[float] = None,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        orden: str = "fecha",
+        descendente: bool = True,
+        limite: Optional[int] = 100,
+    ) -> List[EstudioGuardado]:
+        """
+        Filtros combinados con AND; None = sin filtro.
+
+        cliente / ubicacion:  texto contenido (sin distinguir mayúsculas)
+        texto:                contenido en cliente O ubicación
+        region:               (lat_min, lat_max, lon_min, lon_max)
+        desde / hasta:        fechas ISO (inclusive)
+        """
+
+        if orden not in _COLUMNAS_ORDEN:
+            raise ValueError(f"orden inválido: {orden} (opciones: {', '.join(_COLUMNAS_ORDEN)})")
+
+        condiciones: List[str] = []
+        params: List[Any] = []
+
+        def filtro(sql: str, *valores: Any) -> None:
+            condiciones.append(sql)
+            params.extend(valores)
+
+        if cliente:
+            filtro("cliente LIKE ?", f"%{cliente}%")
+
+        if ubicacion:
+            filtro("ubicacion LIKE ?", f"%{ubicacion}%")
+
+        if texto:
+            filtro("(cliente LIKE ? OR ubicacion LIKE ?)", f"%{texto}%", f"%{texto}%")
+
+        if region is not None:
+            lat_min, lat_max, lon_min, lon_max = region
+            filtro("lat BETWEEN ? AND ? AND lon BETWEEN ? AND ?", lat_min, lat_max, lon_min, lon_max)
+
+        if kwp_min is not None:
+            filtro("kwp >= ?", kwp_min)
+
+        if kwp_max is not None:
+            filtro("kwp <= ?", kwp_max)
+
+        if kwh_kwp_min is not None:
+            filtro("kwh_kwp >= ?", kwh_kwp_min)
+
+        if tir_min is not None:
+            filtro("tir_pct >= ?", tir_min)
+
+        if payback_max is not None:
+            filtro("payback_anios <= ?", payback_max)
+
+        if desde:
+            filtro("fecha >= ?", desde)
+
+        if hasta:
+            # fecha sin hora → incluye el día completo
+            filtro("fecha <= ?", hasta if "T" in hasta else f"{hasta}T99")
+
+        sql = f"SELECT {', '.join(_CAMPOS_RESUMEN)} FROM estudios"
+
+        if condiciones:
+            sql += " WHERE " + " AND ".join(condiciones)
+
+        sql += f" ORDER BY {orden} {'DESC' if descendente else 'ASC'}, id DESC"
+
+        if limite is not None:
+            sql += " LIMIT ?"
+            params.append(int(limite))
+
+        with self._conexion() as con:
+            return [EstudioGuardado(*fila) for fila in con.execute(sql, params)]
+
+    def contar(self) -> int:
+
+        with self._conexion() as con:
+            return con.execute("SELECT COUNT(*) FROM estudios").fetchone()[0]
+
+    # ------------------------------------------------------
+    # REAPERTURA
+    # ------------------------------------------------------
+
+    def abrir(self, id_estudio: int, *, series_como_array: bool = False) -> EstudioAbierto:
+        """
+        Estudio completo tal como se guardó (sin recalcular).
+        """
+
+        with self._conexion() as con:
+            fila = con.execute(
+                f"SELECT {', '.join(_CAMPOS_RESUMEN)}, entradas_ui, datos, resultado "
+                "FROM estudios WHERE id = ?",
+                (int(id_estudio),),
+            ).fetchone()
+
+        if fila is None:
+            raise ValueError(f"Estudio {id_estudio} no existe")
+
+        n = len(_CAMPOS_RESUMEN)
+
+        entradas_ui, datos, resultado = fila[n:]
+
+        return EstudioAbierto(
+            resumen=EstudioGuardado(*fila[:n]),
+            datos=deserializar_resultado(datos),
+            resultado=deserializar_resultado(resultado, series_como_array=series_como_array),
+            entradas_ui=json.loads(entradas_ui) if entradas_ui else None,
+        )
+
+    def series_horarias(self, ids: Sequence[int]) -> Dict[int, np.ndarray]:
+        """
+        energia_horaria_kwh por estudio, sin deserializar el resultado.
+        """
+
+        if not ids:
+            return {}
+
+        marcas = ", ".join("?" * len(ids))
+
+        with self._conexion() as con:
+            filas = con.execute(
+                f"SELECT id, energia_horaria FROM estudios WHERE id IN ({marcas})",
+                [int(i) for i in ids],
+            ).fetchall()
+
+        return {
+            i: np.frombuffer(blob, dtype="<f8")
+            for i, blob in filas
+            if blob is not None
+        }
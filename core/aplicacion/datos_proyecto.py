@@ -166,6 +166,20 @@ def construir_datos_proyecto(ctx):
         "zonas": zonas_limpias,
     }
 
+    p.modelo_transposicion = str(sf.get("modelo_transposicion") or "isotropico")
+    p.pasos_por_hora = int(sf.get("pasos_por_hora") or 1)
+    p.modelo_termico = str(sf.get("modelo_termico") or "noct")
+
+    sombreado = sf.get("sombreado") or {}
+
+    if not isinstance(sombreado, dict):
+        raise ValueError("sombreado inválido")
+
+    p.sombreado = {
+        "horizonte": [[float(a), float(e)] for a, e in (sombreado.get("horizonte") or [])],
+        "obstaculos": list(sombreado.get("obstaculos") or []),
+    }
+
     # ======================================================
     # VALIDACIÓN FINAL
     # ======================================================
@@ -24,6 +24,7 @@ from core.aplicacion.multizona import ejecutar_multizona  # ✅ CORRECTO
 from electrical.orquestador_electrical import ejecutar_electrical
 from energy.orquestador_energia import ejecutar_energia
 from core.servicios.finanzas import ejecutar_finanzas
+from core.aplicacion.progreso import reportar_etapa
 
 # ==========================================================
 # INPUTS / CONTRATOS
@@ -156,7 +157,12 @@ class EnergiaAdapter:
         if paneles is None:
             raise ValueError("paneles es None en energía")
 
-        resultado = ejecutar_energia(datos, sizing, paneles)
+        resultado = ejecutar_energia(
+            datos,
+            sizing,
+            paneles,
+            al_iniciar_etapa=reportar_etapa,
+        )
 
         if resultado is None:
             raise ValueError("Energía devolvió None")
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+"""
+EJECUCIÓN DEL ESTUDIO EN SEGUNDO PLANO
+FV Engine
+
+Responsabilidad
+---------------
+
+Lanzar un estudio en un worker (hilo) y devolver un handle que la
+UI puede consultar entre reruns sin bloquear su propio hilo:
+
+    trabajo = lanzar_estudio(fn, executor)
+    trabajo.ultimo_evento()   → etapa / fracción
+    trabajo.cancelar()        → cancelación cooperativa
+    trabajo.terminado
+    trabajo.resultado()       → ResultadoProyecto (o relanza el error)
+
+fn recibe el reportero de progreso; normalmente es
+
+    lambda progreso: ejecutar_estudio(datos, deps, progreso=progreso)
+
+Este módulo NO conoce Streamlit.
+"""
+
+import threading
+from concurrent.futures import Executor, Future
+from typing import Callable, List, Optional
+
+from core.aplicacion.progreso import EstudioCancelado, EventoProgreso, Reportero
+from core.dominio.contrato import ResultadoProyecto
+
+
+# ==========================================================
+# HANDLE DEL TRABAJO
+# ==========================================================
+
+class TrabajoEstudio:
+
+    def __init__(self, etiqueta: str = ""):
+
+        self.etiqueta = etiqueta
+
+        self._eventos: List[EventoProgreso] = []
+        self._lock = threading.Lock()
+        self._cancelar = threading.Event()
+
+        self._future: Optional[Future] = None
+
+    # ------------------------------------------------------
+    # lado worker
+    # ------------------------------------------------------
+
+    def _reportar(self, evento: EventoProgreso) -> None:
+
+        with self._lock:
+            self._eventos.append(evento)
+
+        if self._cancelar.is_set():
+            raise EstudioCancelado(f"Cancelado antes de '{evento.etapa}'")
+
+    # ------------------------------------------------------
+    # lado UI
+    # ------------------------------------------------------
+
+    def eventos(self) -> List[EventoProgreso]:
+        with self._lock:
+            return list(self._eventos)
+
+    def ultimo_evento(self) -> Optional[EventoProgreso]:
+        with self._lock:
+            return self._eventos[-1] if self._eventos else None
+
+    def cancelar(self) -> None:
+        self._cancelar.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelar.is_set()
+
+    @property
+    def terminado(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def resultado(self, timeout: Optional[float] = None) -> ResultadoProyecto:
+        """
+        Resultado del estudio; relanza EstudioCancelado u otro error.
+        """
+
+        if self._future is None:
+            raise ValueError("Trabajo no lanzado")
+
+        return self._future.result(timeout=timeout)
+
+
+# ==========================================================
+# LANZAMIENTO
+# ==========================================================
+
+def lanzar_estudio(
+    fn: Callable[[Reportero], ResultadoProyecto],
+    executor: Executor,
+    *,
+    etiqueta: str = "",
+) -> TrabajoEstudio:
+
+    trabajo = TrabajoEstudio(etiqueta)
+
+    trabajo._future = executor.submit(fn, trabajo._reportar)
+
+    return trabajo
@@ -28,7 +28,7 @@ def ejecutar_multizona(entrada: EntradaPaneles) -> ResultadoPaneles:
     # CONSOLIDACIÓN
     # ======================================================
 
-    zonas_detalle = _build_zonas_detalle(resultados)
+    zonas_detalle = _build_zonas_detalle(resultados, getattr(entrada, "zonas", None))
 
     total_paneles, total_strings, total_pdc = _calcular_totales(resultados)
 
@@ -189,19 +189,30 @@ def _ejecutar_zonas(entrada: EntradaPaneles) -> list | ResultadoPaneles:
 # DETALLE ZONAS
 # ==========================================================
 
-def _build_zonas_detalle(resultados: List[ResultadoPaneles]) -> List[dict]:
+def _build_zonas_detalle(
+    resultados: List[ResultadoPaneles],
+    zonas_entrada: Optional[list] = None,
+) -> List[dict]:
 
     zonas = []
+    zonas_entrada = zonas_entrada or []
 
     for i, r in enumerate(resultados, 1):
+
+        z_in = zonas_entrada[i - 1] if i - 1 < len(zonas_entrada) else None
+
         zonas.append({
             "zona": i,
             "paneles": r.array.n_paneles_total if r.array else None,
             "pdc_kw": (r.array.potencia_dc_w / 1000) if r.array else None,
             "strings": len(r.strings) if r.strings else 0,
+            "n_series": r.recomendacion.n_series if r.recomendacion else None,
             "vdc": r.array.vdc_nom if r.array else None,
             "idc": r.array.idc_nom if r.array else None,
             "isc": r.array.isc_total if r.array else None,
+            # orientación (energía por zona)
+            "azimut": getattr(z_in, "azimut", None),
+            "inclinacion": getattr(z_in, "inclinacion", None),
         })
 
     return zonas
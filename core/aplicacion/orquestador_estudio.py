@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from core.dominio.modelo import Datosproyecto
 from core.dominio.contrato import ResultadoProyecto
 
 from core.aplicacion.dependencias import DependenciasEstudio
+from core.aplicacion.progreso import (
+    ETAPA_FIN,
+    EstudioCancelado,
+    Reportero,
+    reportar_etapa,
+    seguimiento,
+)
 
 
 # ==========================================================
 # ORQUESTADOR PRINCIPAL
 # ==========================================================
 def ejecutar_estudio(
+    datos: Datosproyecto,
+    deps: DependenciasEstudio,
+    *,
+    progreso: Optional[Reportero] = None,
+) -> ResultadoProyecto:
+    """
+    progreso:
+        recibe un EventoProgreso al inicio de cada etapa; puede
+        lanzar EstudioCancelado, que se propaga al llamador.
+    """
+
+    with seguimiento(progreso):
+        return _ejecutar_estudio(datos, deps)
+
+
+def _ejecutar_estudio(
     datos: Datosproyecto,
     deps: DependenciasEstudio
 ) -> ResultadoProyecto:
@@ -24,6 +49,8 @@ def ejecutar_estudio(
         # ==================================================
         # 1. SIZING
         # ==================================================
+        reportar_etapa("sizing")
+
         sizing = deps.sizing.ejecutar(datos)
 
         if sizing is None:
@@ -46,6 +73,8 @@ def ejecutar_estudio(
         # ==================================================
         from core.aplicacion.builder_paneles import construir_entrada_paneles
 
+        reportar_etapa("paneles")
+
         entrada_paneles = construir_entrada_paneles(datos, sizing)
 
         paneles = deps.paneles.ejecutar(entrada_paneles)
@@ -66,7 +95,7 @@ def ejecutar_estudio(
             )
 
         # ==================================================
-        # 3. ENERGÍA
+        # 3. ENERGÍA (clima / solar / energia se reportan en el adapter)
         # ==================================================
         energia = deps.energia.ejecutar(datos, sizing, paneles)
 
@@ -92,6 +121,8 @@ def ejecutar_estudio(
 
         if deps.electrical is not None:
 
+            reportar_etapa("electrical")
+
             electrical = deps.electrical.ejecutar(
                 datos=datos,
                 paneles=paneles,
@@ -120,6 +151,8 @@ def ejecutar_estudio(
 
         if deps.finanzas is not None:
 
+            reportar_etapa("finanzas")
+
             finanzas = deps.finanzas.ejecutar(
                 datos,
                 sizing,
@@ -144,6 +177,8 @@ def ejecutar_estudio(
         # ==================================================
         # RESULTADO FINAL
         # ==================================================
+        reportar_etapa(ETAPA_FIN)
+
         return ResultadoProyecto(
             sizing=sizing,
             paneles=paneles,
@@ -155,6 +190,9 @@ def ejecutar_estudio(
             errores=[]
         )
 
+    except EstudioCancelado:
+        raise
+
     except Exception as e:
 
         import traceback
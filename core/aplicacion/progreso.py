@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+"""
+PROGRESO Y CANCELACIÓN DEL ESTUDIO
+FV Engine
+
+Responsabilidad
+---------------
+
+Publicar eventos de avance por etapa del estudio y ofrecer puntos
+de cancelación cooperativa, sin cambiar la firma de los puertos
+(sizing / paneles / energía / electrical / finanzas).
+
+Mecanismo
+---------
+
+El orquestador activa un "reportero" en una ContextVar durante la
+ejecución. Cualquier capa (p. ej. el adapter de energía, que separa
+clima / solar / energía) llama reportar_etapa("...") :
+
+    sin reportero activo  → no hace nada
+    con reportero         → evento + comprobación de cancelación
+
+La ContextVar es por hilo, así varios estudios en paralelo (workers)
+no mezclan sus eventos.
+
+La cancelación es cooperativa: se atiende en el siguiente límite de
+etapa, nunca a mitad de una descarga o de la simulación.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+
+ETAPAS_ESTUDIO = (
+    "sizing",
+    "paneles",
+    "clima",
+    "solar",
+    "energia",
+    "electrical",
+    "finanzas",
+)
+
+ETAPA_FIN = "fin"
+
+
+# ==========================================================
+# MODELOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class EventoProgreso:
+
+    etapa: str
+    indice: int
+    total: int
+    t_s: float
+
+    @property
+    def fraccion(self) -> float:
+        return min(1.0, self.indice / self.total)
+
+
+class EstudioCancelado(Exception):
+    """
+    Lanzada en un límite de etapa cuando se pidió cancelar.
+    """
+
+
+Reportero = Callable[[EventoProgreso], None]
+
+
+_reportero: ContextVar[Optional[Reportero]] = ContextVar("reportero_estudio", default=None)
+
+
+# ==========================================================
+# API
+# ==========================================================
+
+@contextmanager
+def seguimiento(reportero: Optional[Reportero]) -> Iterator[None]:
+    """
+    Activa un reportero durante el bloque.
+
+    Con reportero None se conserva el que ya estuviera activo
+    (un estudio cacheado dentro de un worker sigue reportando).
+    """
+
+    if reportero is None:
+        yield
+        return
+
+    token = _reportero.set(reportero)
+
+    try:
+        yield
+    finally:
+        _reportero.reset(token)
+
+
+def reportar_etapa(etapa: str) -> None:
+    """
+    Marca el inicio de una etapa (o ETAPA_FIN).
+
+    El reportero puede lanzar EstudioCancelado.
+    """
+
+    reportero = _reportero.get()
+
+    if reportero is None:
+        return
+
+    total = len(ETAPAS_ESTUDIO)
+
+    if etapa == ETAPA_FIN:
+        indice = total
+    elif etapa in ETAPAS_ESTUDIO:
+        indice = ETAPAS_ESTUDIO.index(etapa)
+    else:
+        raise ValueError(f"Etapa desconocida: {etapa}")
+
+    reportero(EventoProgreso(etapa=etapa, indice=indice, total=total, t_s=time.monotonic()))
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+"""
+SERIALIZACIÓN BINARIA DE ResultadoProyecto — FV Engine
+======================================================
+
+Responsabilidad
+---------------
+
+Persistir y transferir un ResultadoProyecto completo (incluidas las
+series 8760) sin pickle y sin perder datos horarios.
+
+Formato (versión 2, little-endian)
+----------------------------------
+
+    ┌──────────────────────────────────────────────┐
+    │ cabecera fija  "<4sHHI"                      │
+    │   magia b"FVRP" · versión · reservado · n    │
+    ├──────────────────────────────────────────────┤
+    │ JSON UTF-8 (n bytes): árbol de escalares,    │
+    │ dataclasses, dicts y listas + tabla de       │
+    │ arrays {offset, n, dtype}                    │
+    ├──────────────────────────────────────────────┤
+    │ relleno hasta múltiplo de 8                  │
+    ├──────────────────────────────────────────────┤
+    │ arrays crudos, cada uno alineado a 8 bytes   │
+    └──────────────────────────────────────────────┘
+
+Codificación del árbol JSON:
+
+    dataclass        → {"__dc__": "modulo:Clase", "campos": {...}}
+    ndarray numérico → {"__arr__": i}                 (bloque binario i)
+    lista de floats  → {"__arr__": i, "lista": true}  (≥ MIN_ELEMENTOS_ARRAY)
+    tupla            → {"__tupla__": [...]}
+    dict no str      → {"__pares__": [[k, v], ...]}
+
+Lectura sin copia
+-----------------
+
+Los bloques binarios se leen con np.frombuffer sobre el buffer de
+entrada (vistas de solo lectura). Con series_como_array=True las
+listas de floats también se devuelven como esas vistas; por defecto
+se reconstruyen como listas para respetar el contrato original.
+
+Seguridad
+---------
+
+Solo se reconstruyen dataclasses de los paquetes del motor
+(PAQUETES_PERMITIDOS); cualquier otra clase es un error.
+
+Evolución de las dataclasses
+----------------------------
+
+Cada dataclass se reconstruye recorriendo sus campos actuales: los
+campos nuevos ausentes en el blob toman su default, las claves que ya
+no existen se descartan y un campo obligatorio ausente es ValueError.
+
+Versiones
+---------
+
+    1   formato inicial
+    2   Datosproyecto: vida_util_anios, lid_frac, degradacion_anual_frac,
+        modelo_degradacion, modelo_termico · PanelSpec: termico
+
+Las versiones anteriores se leen con los campos nuevos en su default
+(todos los agregados en la versión 2 lo tienen).
+"""
+
+import dataclasses
+import importlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+
+MAGIA = b"FVRP"
+VERSION_FORMATO = 2
+
+_CABECERA = struct.Struct("<4sHHI")
+
+ALINEACION = 8
+
+# listas de floats más cortas quedan en el JSON (12 meses, etc.)
+MIN_ELEMENTOS_ARRAY = 64
+
+PAQUETES_PERMITIDOS = ("core.", "electrical.", "energy.")
+
+
+# ==========================================================
+# HELPERS
+# ==========================================================
+
+def _relleno(n: int) -> int:
+    return (-n) % ALINEACION
+
+
+def _es_lista_float(obj: Any) -> bool:
+    return (
+        isinstance(obj, list)
+        and len(obj) >= MIN_ELEMENTOS_ARRAY
+        and all(type(x) is float for x in obj)
+    )
+
+
+def _clase_de(ruta: str):
+
+    modulo, _, nombre = ruta.partition(":")
+
+    if not modulo.startswith(PAQUETES_PERMITIDOS):
+        raise ValueError(f"Clase no permitida en el resultado: {ruta}")
+
+    cls = importlib.import_module(modulo)
+
+    for parte in nombre.split("."):
+        cls = getattr(cls, parte)
+
+    if not dataclasses.is_dataclass(cls):
+        raise ValueError(f"{ruta} no es una dataclass")
+
+    return cls
+
+
+# ==========================================================
+# CODIFICACIÓN
+# ==========================================================
+
+class _Codificador:
+
+    def __init__(self) -> None:
+        self.bloques: List[np.ndarray] = []
+
+    def _bloque(self, arr: np.ndarray) -> int:
+
+        if arr.dtype.kind not in "biuf":
+            raise ValueError(f"dtype de array no soportado: {arr.dtype}")
+
+        self.bloques.append(np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<")))
+
+        return len(self.bloques) - 1
+
+    def codificar(self, obj: Any) -> Any:
+
+        if obj is None or isinstance(obj, (bool, int, float, str)):
+            return obj
+
+        if isinstance(obj, np.generic):
+            return obj.item()
+
+        if isinstance(obj, np.ndarray):
+            return {"__arr__": self._bloque(obj)}
+
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+
+            cls = type(obj)
+
+            return {
+                "__dc__": f"{cls.__module__}:{cls.__qualname__}",
+                "campos": {
+                    f.name: self.codificar(getattr(obj, f.name))
+                    for f in dataclasses.fields(obj)
+                },
+            }
+
+        if _es_lista_float(obj):
+            return {"__arr__": self._bloque(np.asarray(obj, dtype="<f8")), "lista": True}
+
+        if isinstance(obj, list):
+            return [self.codificar(x) for x in obj]
+
+        if isinstance(obj, tuple):
+            return {"__tupla__": [self.codificar(x) for x in obj]}
+
+        if isinstance(obj, dict):
+
+            if all(isinstance(k, str) and not k.startswith("__") for k in obj):
+                return {k: self.codificar(v) for k, v in obj.items()}
+
+            return {"__pares__": [[self.codificar(k), self.codificar(v)] for k, v in obj.items()]}
+
+        raise ValueError(f"Tipo no serializable en el resultado: {type(obj).__name__}")
+
+
+def serializar_resultado(resultado: Any) -> bytes:
+    """
+    ResultadoProyecto (o cualquier dataclass del motor) → bytes.
+    """
+
+    cod = _Codificador()
+
+    arbol = cod.codificar(resultado)
+
+    # offsets relativos al inicio de la zona binaria
+    tabla = []
+    offset = 0
+
+    for b in cod.bloques:
+        tabla.append({"offset": offset, "n": int(b.size), "dtype": b.dtype.str, "forma": list(b.shape)})
+        offset += b.nbytes + _relleno(b.nbytes)
+
+    cabecera_json = json.dumps(
+        {"arbol": arbol, "arrays": tabla},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    partes = [
+        _CABECERA.pack(MAGIA, VERSION_FORMATO, 0, len(cabecera_json)),
+        cabecera_json,
+        b"\0" * _relleno(_CABECERA.size + len(cabecera_json)),
+    ]
+
+    for b in cod.bloques:
+        partes.append(b.tobytes())
+        partes.append(b"\0" * _relleno(b.nbytes))
+
+    return b"".join(partes)
+
+
+# ==========================================================
+# DECODIFICACIÓN
+# ==========================================================
+
+def _leer_cabecera(buf: memoryview):
+
+    if len(buf) < _CABECERA.size:
+        raise ValueError("Buffer demasiado corto para un resultado serializado")
+
+    magia, version, _, n = _CABECERA.unpack_from(buf, 0)
+
+    if magia != MAGIA:
+        raise ValueError("No es un resultado serializado (magia inválida)")
+
+    if version > VERSION_FORMATO:
+        raise ValueError(f"Versión de formato no soportada: {version} (máx. {VERSION_FORMATO})")
+
+    inicio_json = _CABECERA.size
+    fin_json = inicio_json + n
+
+    if len(buf) < fin_json:
+        raise ValueError("Resultado serializado truncado")
+
+    cab = json.loads(bytes(buf[inicio_json:fin_json]).decode("utf-8"))
+
+    return cab, fin_json + _relleno(fin_json)
+
+
+def _vistas(buf: memoryview, tabla: List[Dict[str, Any]], base: int) -> List[np.ndarray]:
+
+    vistas = []
+
+    for t in tabla:
+
+        dtype = np.dtype(t["dtype"])
+        inicio = base + int(t["offset"])
+
+        if inicio + int(t["n"]) * dtype.itemsize > len(buf):
+            raise ValueError("Resultado serializado truncado")
+
+        arr = np.frombuffer(buf, dtype=dtype, count=int(t["n"]), offset=inicio)
+
+        vistas.append(arr.reshape(t.get("forma") or (int(t["n"]),)))
+
+    return vistas
+
+
+def _reconstruir(cls, campos: Dict[str, Any], vistas: List[np.ndarray], series_como_array: bool) -> Any:
+    """
+    Instancia de la dataclass con los campos de su definición actual.
+
+    Un blob escrito antes de que la clase ganara o perdiera campos
+    sigue siendo legible:
+
+        campo ausente con default   → default / default_factory()
+        campo ausente sin default   → ValueError
+        clave desconocida           → se descarta
+    """
+
+    # sin __init__ / __post_init__: el objeto ya fue validado al crearse
+    inst = object.__new__(cls)
+
+    for f in dataclasses.fields(cls):
+
+        if f.name in campos:
+            valor = _decodificar(campos[f.name], vistas, series_como_array)
+        elif f.default is not dataclasses.MISSING:
+            valor = f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            valor = f.default_factory()
+        else:
+            raise ValueError(
+                f"Resultado serializado incompatible: {cls.__qualname__}.{f.name} "
+                "no está en el blob y no tiene valor por defecto"
+            )
+
+        object.__setattr__(inst, f.name, valor)
+
+    return inst
+
+
+def _decodificar(obj: Any, vistas: List[np.ndarray], series_como_array: bool) -> Any:
+
+    if isinstance(obj, list):
+        return [_decodificar(x, vistas, series_como_array) for x in obj]
+
+    if not isinstance(obj, dict):
+        return obj
+
+    if "__arr__" in obj:
+
+        arr = vistas[obj["__arr__"]]
+
+        if obj.get("lista") and not series_como_array:
+            return arr.tolist()
+
+        return arr
+
+    if "__dc__" in obj:
+        return _reconstruir(_clase_de(obj["__dc__"]), obj["campos"], vistas, series_como_array)
+
+    if "__tupla__" in obj:
+        return tuple(_decodificar(x, vistas, series_como_array) for x in obj["__tupla__"])
+
+    if "__pares__" in obj:
+        return {
+            _decodificar(k, vistas, series_como_array): _decodificar(v, vistas, series_como_array)
+            for k, v in obj["__pares__"]
+        }
+
+    return {k: _decodificar(v, vistas, series_como_array) for k, v in obj.items()}
+
+
+def deserializar_resultado(
+    data: Union[bytes, bytearray, memoryview],
+    *,
+    series_como_array: bool = False,
+) -> Any:
+    """
+    bytes → ResultadoProyecto.
+
+    Los ndarray (y las listas de floats con series_como_array=True)
+    son vistas de solo lectura sobre `data`: sin copia.
+    """
+
+    buf = memoryview(data)
+
+    cab, base = _leer_cabecera(buf)
+
+    vistas = _vistas(buf, cab["arrays"], base)
+
+    return _decodificar(cab["arbol"], vistas, series_como_array)
+
+
+# ==========================================================
+# ARCHIVOS
+# ==========================================================
+
+def guardar_resultado(resultado: Any, path: Union[str, Path]) -> Path:
+    """
+    Escritura atómica (tmp + os.replace).
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    tmp.write_bytes(serializar_resultado(resultado))
+
+    os.replace(tmp, path)
+
+    return path
+
+
+def cargar_resultado(path: Union[str, Path], *, series_como_array: bool = False) -> Any:
+
+    return deserializar_resultado(Path(path).read_bytes(), series_como_array=series_como_array)
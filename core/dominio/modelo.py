@@ -64,6 +64,32 @@ class Datosproyecto:
     # -------------------------------
     om_anual_pct: float = 0.0
 
+    # -------------------------------
+    # Vida útil / degradación
+    # -------------------------------
+    vida_util_anios: int = 25
+
+    # LID: pérdida del primer año (light-induced degradation)
+    lid_frac: float = 0.02
+    degradacion_anual_frac: float = 0.005
+
+    # "lineal" o "compuesto"
+    modelo_degradacion: str = "lineal"
+
+    # -------------------------------
+    # Simulación
+    # -------------------------------
+    modelo_transposicion: str = "isotropico"
+
+    # 1 = horario; 4 = 15 min; 12 = 5 min
+    pasos_por_hora: int = 1
+
+    # "pvgis" (red / cache) o "sintetico" (offline, determinista)
+    fuente_clima: str = "pvgis"
+
+    # temperatura de celda: "noct" | "faiman" | "pvsyst" | "sapm"
+    modelo_termico: str = "noct"
+
     # =====================================================
     # CAMPOS DEL PIPELINE (DICT CONTROLADO)
     # =====================================================
@@ -72,6 +98,9 @@ class Datosproyecto:
     equipos: Dict[str, Any] = field(default_factory=dict)
     electrico: Dict[str, Any] = field(default_factory=dict)
 
+    # horizonte [[az, el], ...] y obstáculos locales (energy/solar/sombreado)
+    sombreado: Dict[str, Any] = field(default_factory=dict)
+
     # =====================================================
     # VALIDACIÓN
     # =====================================================
@@ -149,6 +178,33 @@ class Datosproyecto:
                 if (n_paneles is None or n_paneles <= 0) and (area is None or area <= 0):
                     errores.append(f"Zona {i+1}: sin paneles ni área válida")
 
+        # -------------------------------
+        # SIMULACIÓN
+        # -------------------------------
+        if self.modelo_transposicion not in ("isotropico", "perez"):
+            errores.append(f"modelo_transposicion inválido: {self.modelo_transposicion}")
+
+        if self.pasos_por_hora not in (1, 2, 4, 6, 12):
+            errores.append(f"pasos_por_hora inválido: {self.pasos_por_hora}")
+
+        if self.fuente_clima not in ("pvgis", "sintetico"):
+            errores.append(f"fuente_clima inválida: {self.fuente_clima}")
+
+        if self.modelo_termico not in ("noct", "faiman", "pvsyst", "sapm"):
+            errores.append(f"modelo_termico inválido: {self.modelo_termico}")
+
+        # -------------------------------
+        # VIDA ÚTIL
+        # -------------------------------
+        if not (1 <= self.vida_util_anios <= 50):
+            errores.append(f"vida_util_anios inválido: {self.vida_util_anios}")
+
+        if not (0 <= self.lid_frac < 1) or not (0 <= self.degradacion_anual_frac < 1):
+            errores.append("lid_frac y degradacion_anual_frac deben estar en [0, 1)")
+
+        if self.modelo_degradacion not in ("lineal", "compuesto"):
+            errores.append(f"modelo_degradacion inválido: {self.modelo_degradacion}")
+
         # -------------------------------
         # ELÉCTRICO
         # -------------------------------
@@ -30,12 +30,22 @@ analizar_cobertura(
     potencia_panel_kw: float
     energia_1kwp_anual: float
     tarifa_energia: float
+    costo_kw: float
+
+)
+
+curva_cobertura(
+
+    dc_por_kwp_kw: 8760        (simulación del sitio)
+    carga_kwh: 8760            (perfil horario de consumo)
+    potencia_panel_kw, tarifa_energia, costo_usd_kwp, tcambio
 
 )
 
 SALIDA
 ------
 List[EscenarioCobertura]
+CurvaCobertura (arrays, una posición por tamaño)
 
 EscenarioCobertura:
     cobertura
@@ -50,7 +60,11 @@ EscenarioCobertura:
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+import numpy as np
+
+from energy.sistema.motor_vectorizado import ParametrosCadena
 
 
 # =========================================================
@@ -81,6 +95,7 @@ def analizar_cobertura(
     potencia_panel_kw: float,
     energia_1kwp_anual: float,
     tarifa_energia: float,
+    costo_kw: float = 1200,
 ) -> List[EscenarioCobertura]:
 
     coberturas = [
@@ -100,7 +115,6 @@ def analizar_cobertura(
 
         produccion = potencia_fv_kw * energia_1kwp_anual
 
-        costo_kw = 1200
         tarifa = tarifa_energia
 
         inversion = potencia_fv_kw * costo_kw
@@ -124,3 +138,246 @@ def analizar_cobertura(
         resultados.append(escenario)
 
     return resultados
+
+
+# =========================================================
+# CURVA DE COBERTURA (SIMULACIÓN HORARIA)
+# =========================================================
+
+@dataclass(frozen=True)
+class CurvaCobertura:
+    """
+    Resultado por tamaño de sistema (arrays de igual longitud).
+
+    Energías en kWh/año; inversión y ahorro en moneda local.
+
+    payback:
+        años; np.inf en los tamaños sin ahorro (no se recupera).
+    """
+
+    cobertura: np.ndarray
+    potencia_fv_kw: np.ndarray
+    paneles: np.ndarray
+
+    produccion_anual_kwh: np.ndarray
+    autoconsumo_kwh: np.ndarray
+    excedente_kwh: np.ndarray
+    clipping_kwh: np.ndarray
+
+    inversion: np.ndarray
+    ahorro_anual: np.ndarray
+    roi: np.ndarray
+    payback: np.ndarray
+
+    @property
+    def fraccion_autoconsumo(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                self.produccion_anual_kwh > 0,
+                self.autoconsumo_kwh / self.produccion_anual_kwh,
+                0.0,
+            )
+
+    def como_escenarios(self, consumo_anual_kwh: float) -> List[EscenarioCobertura]:
+        """
+        Vista compatible con analizar_cobertura (una fila por tamaño).
+        """
+
+        return [
+            EscenarioCobertura(
+                cobertura=float(self.cobertura[i]),
+                energia_objetivo_kwh=float(consumo_anual_kwh * self.cobertura[i]),
+                potencia_fv_kw=float(self.potencia_fv_kw[i]),
+                paneles=int(self.paneles[i]),
+                produccion_anual_kwh=float(self.produccion_anual_kwh[i]),
+                inversion=float(self.inversion[i]),
+                ahorro_anual=float(self.ahorro_anual[i]),
+                roi=float(self.roi[i]),
+                payback=float(self.payback[i]),
+            )
+            for i in range(len(self.cobertura))
+        ]
+
+
+def _ac_por_kwp(
+    dc_por_kwp_kw: np.ndarray,
+    dc_ac_ratio: float,
+    cad: ParametrosCadena,
+) -> np.ndarray:
+    """
+    AC horaria por kWp con clipping a relación DC/AC fija.
+
+    Con DC/AC fija el inversor escala con el generador, así que la
+    AC de cualquier tamaño es potencia_kw · (esta serie).
+    """
+
+    dc_neta = np.maximum(np.asarray(dc_por_kwp_kw, dtype=float), 0.0) * cad.factor_dc
+
+    return np.minimum(dc_neta * cad.eficiencia_inversor, 1.0 / dc_ac_ratio) * cad.factor_ac
+
+
+def curva_cobertura(
+    dc_por_kwp_kw: np.ndarray,
+    carga_kwh: np.ndarray,
+    *,
+    potencia_panel_kw: float,
+    tarifa_energia: float,
+    costo_usd_kwp: float,
+    tcambio: float = 1.0,
+    tarifa_excedente: float = 0.0,
+    coberturas: Optional[np.ndarray] = None,
+    dc_ac_ratio: float = 1.2,
+    perdidas_dc_frac: float = 0.05,
+    sombras_frac: float = 0.02,
+    eficiencia_inversor: float = 0.97,
+    perdidas_ac_frac: float = 0.02,
+) -> CurvaCobertura:
+    """
+    Evalúa todos los tamaños de la grilla de cobertura en una pasada.
+
+    Autoconsumo horario:  Σ_h min(P · y_h, L_h)
+
+    Ordenando las horas por r_h = L_h / y_h, para cada tamaño P las
+    horas con r_h >= P aportan P · y_h y el resto aporta L_h; con sumas
+    acumuladas cada tamaño es una búsqueda binaria.
+
+    coberturas:
+        fracción de la energía anual consumida (default 10 %–200 %, 1 %).
+    """
+
+    if dc_ac_ratio <= 0:
+        raise ValueError("dc_ac_ratio inválido")
+
+    if potencia_panel_kw <= 0:
+        raise ValueError("potencia_panel_kw inválido")
+
+    carga = np.maximum(np.asarray(carga_kwh, dtype=float), 0.0)
+
+    if len(carga) != len(dc_por_kwp_kw):
+        raise ValueError("carga_kwh y dc_por_kwp_kw deben tener la misma longitud")
+
+    if coberturas is None:
+        coberturas = np.round(np.arange(0.10, 2.0 + 1e-9, 0.01), 2)
+
+    cobertura = np.asarray(coberturas, dtype=float)
+
+    cad = ParametrosCadena(
+        pac_nominal_kw=1.0 / dc_ac_ratio,
+        perdidas_dc_frac=perdidas_dc_frac,
+        sombras_frac=sombras_frac,
+        eficiencia_inversor=eficiencia_inversor,
+        perdidas_ac_frac=perdidas_ac_frac,
+    )
+
+    # ------------------------------------------------------
+    # SERIES POR kWp
+    # ------------------------------------------------------
+
+    y = _ac_por_kwp(dc_por_kwp_kw, dc_ac_ratio, cad)
+
+    y_sin_clip = (
+        np.maximum(np.asarray(dc_por_kwp_kw, dtype=float), 0.0)
+        * cad.factor_dc * eficiencia_inversor * cad.factor_ac
+    )
+
+    rendimiento = float(y.sum())
+
+    if rendimiento <= 0:
+        raise ValueError("Rendimiento específico nulo")
+
+    consumo_anual = float(carga.sum())
+
+    # ------------------------------------------------------
+    # TAMAÑOS
+    # ------------------------------------------------------
+
+    potencia = cobertura * consumo_anual / rendimiento
+
+    paneles = np.ceil(potencia / potencia_panel_kw - 1e-9).astype(int)
+
+    # ------------------------------------------------------
+    # AUTOCONSUMO (saturación horaria)
+    # ------------------------------------------------------
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(y > 0, carga / y, np.inf)
+
+    orden = np.argsort(r)
+
+    r_ord = r[orden]
+
+    carga_acum = np.concatenate(([0.0], np.cumsum(carga[orden])))
+    y_acum = np.concatenate(([0.0], np.cumsum(y[orden])))
+
+    # horas con r_h < P → carga saturada
+    i = np.searchsorted(r_ord, potencia, side="left")
+
+    autoconsumo = carga_acum[i] + potencia * (y_acum[-1] - y_acum[i])
+
+    produccion = potencia * rendimiento
+    excedente = produccion - autoconsumo
+    clipping = potencia * (float(y_sin_clip.sum()) - rendimiento)
+
+    # ------------------------------------------------------
+    # FINANZAS
+    # ------------------------------------------------------
+
+    inversion = potencia * costo_usd_kwp * tcambio
+
+    ahorro = autoconsumo * tarifa_energia + excedente * tarifa_excedente
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi = np.where(inversion > 0, ahorro / inversion, 0.0)
+        payback = np.where(ahorro > 0, inversion / ahorro, np.inf)
+
+    return CurvaCobertura(
+        cobertura=cobertura,
+        potencia_fv_kw=potencia,
+        paneles=paneles,
+        produccion_anual_kwh=produccion,
+        autoconsumo_kwh=autoconsumo,
+        excedente_kwh=excedente,
+        clipping_kwh=clipping,
+        inversion=inversion,
+        ahorro_anual=ahorro,
+        roi=roi,
+        payback=payback,
+    )
+
+
+def curva_cobertura_proyecto(
+    datos,
+    energia,
+    *,
+    potencia_panel_kw: float,
+    perfil_diario=None,
+    desfase_utc_h: Optional[int] = None,
+    **kwargs,
+) -> CurvaCobertura:
+    """
+    Curva de cobertura con los datos del estudio:
+
+        • serie DC por kWp de la simulación (EnergiaResultado.series, UTC)
+        • consumo_12m repartido con perfil_consumo_horario (hora local
+          rotada a UTC; desfase por defecto = round(lon / 15))
+        • tarifa, costo_usd_kwp y tcambio de Datosproyecto
+    """
+
+    from core.servicios.consumo import desfase_utc_horas, perfil_consumo_horario
+    from core.servicios.optimizador_sizing import dc_por_kwp_desde_energia
+
+    if desfase_utc_h is None:
+        desfase_utc_h = desfase_utc_horas(datos.lon)
+
+    kwargs.setdefault("dc_ac_ratio", energia.dc_ac_ratio or 1.2)
+
+    return curva_cobertura(
+        dc_por_kwp_desde_energia(energia),
+        perfil_consumo_horario(datos.consumo_12m, perfil_diario, desfase_utc_h=desfase_utc_h),
+        potencia_panel_kw=potencia_panel_kw,
+        tarifa_energia=datos.tarifa_energia,
+        costo_usd_kwp=datos.costo_usd_kwp,
+        tcambio=datos.tcambio,
+        **kwargs,
+    )
+
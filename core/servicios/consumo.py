@@ -34,9 +34,29 @@ SALIDA
 consumo_anual_kwh(...) -> float
 consumo_promedio_mensual_kwh(...) -> float
 normalizar_cobertura(...) -> float
+perfil_consumo_horario(...) -> np.ndarray (8760)
+desfase_utc_horas(...) -> int
 """
 
-from typing import List
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+# =========================================================
+# PERFIL DIARIO POR DEFECTO
+# =========================================================
+
+# Forma típica comercial/residencial (fracción relativa por hora
+# LOCAL, 0–23 h). Solo la forma importa: se normaliza al total del mes.
+PERFIL_DIARIO_DEFAULT = (
+    0.55, 0.50, 0.48, 0.47, 0.48, 0.55,
+    0.70, 0.85, 1.00, 1.10, 1.15, 1.20,
+    1.20, 1.20, 1.15, 1.10, 1.05, 1.10,
+    1.20, 1.15, 1.00, 0.85, 0.70, 0.60,
+)
+
+_DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 # =========================================================
@@ -76,3 +96,57 @@ def normalizar_cobertura(cobertura: float) -> float:
     """
 
     return max(0.0, min(1.0, float(cobertura)))
+
+
+# =========================================================
+# PERFIL HORARIO (8760)
+# =========================================================
+
+def desfase_utc_horas(lon: float) -> int:
+    """
+    Desfase hora local − UTC (h) estimado por la longitud del sitio.
+    """
+
+    return int(round(float(lon) / 15.0))
+
+
+def perfil_consumo_horario(
+    consumo_12m: List[float],
+    perfil_diario: Optional[Sequence[float]] = None,
+    *,
+    desfase_utc_h: int = 0,
+) -> np.ndarray:
+    """
+    Reparte el consumo mensual en 8760 horas con una forma diaria.
+
+    perfil_diario está en hora local; las series FV (PVGIS, clima
+    sintético) están indexadas en UTC. Con desfase_utc_h (hora local
+    − UTC, p. ej. desfase_utc_horas(lon)) la forma se rota para que
+    la hora h del array sea la hora UTC h.
+
+    Cada mes conserva exactamente su consumo (kWh).
+    """
+
+    if len(consumo_12m) != 12:
+        raise ValueError("consumo_12m debe tener 12 valores")
+
+    forma = np.asarray(
+        PERFIL_DIARIO_DEFAULT if perfil_diario is None else perfil_diario,
+        dtype=float,
+    )
+
+    if len(forma) != 24 or (forma < 0).any() or forma.sum() <= 0:
+        raise ValueError("perfil_diario debe tener 24 valores no negativos")
+
+    forma = forma / forma.sum()
+
+    # hora UTC h ↔ hora local h + desfase
+    forma = np.roll(forma, -int(desfase_utc_h))
+
+    bloques = [
+        np.tile(forma, dias) * (float(consumo_12m[m] or 0.0) / dias)
+        for m, dias in enumerate(_DIAS_MES)
+    ]
+
+    return np.concatenate(bloques)
+
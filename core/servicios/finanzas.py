@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from core.dominio.modelo import Datosproyecto
 from core.dominio.contrato import ResultadoSizing
 from energy.resultado_energia import EnergiaResultado
+from energy.sistema.vida_util import (
+    ParametrosDegradacion,
+    simular_vida_util,
+    simular_vida_util_mensual,
+)
 
 def _normalizar_energia(energia):
 
@@ -199,6 +206,77 @@ def _evaluacion_mensual(tabla: list, cuota: float) -> dict:
     }
 
 
+# ==========================================================
+# 🔵 VIDA ÚTIL
+# ==========================================================
+
+def _degradacion(datos: Datosproyecto) -> ParametrosDegradacion:
+    return ParametrosDegradacion(
+        anios=int(getattr(datos, "vida_util_anios", 25)),
+        lid_frac=float(getattr(datos, "lid_frac", 0.02)),
+        degradacion_anual_frac=float(getattr(datos, "degradacion_anual_frac", 0.005)),
+        modelo=getattr(datos, "modelo_degradacion", "lineal"),
+    )
+
+
+def energia_fv_vida_util_12m(energia: EnergiaResultado, deg: ParametrosDegradacion) -> np.ndarray:
+    """
+    (años × 12) kWh FV por mes y año.
+
+    Con series horarias se re-simula el clipping de cada año; si no
+    (resultados antiguos) se escala la energía mensual del año base.
+    """
+
+    series = getattr(energia, "series", None)
+    cadena = getattr(energia, "cadena", None)
+
+    if series is not None and cadena is not None:
+        return simular_vida_util(series, cadena, deg).mensual_kwh
+
+    return simular_vida_util_mensual(_normalizar_energia(list(energia.energia_util_12m)), deg)
+
+
+def _ahorro_anual_vida_util(
+    energia_anios_12m: np.ndarray,
+    consumo_12m: List[float],
+    tarifa_energia: float,
+) -> np.ndarray:
+    """
+    Ahorro (L) de cada año: misma regla que simular_12_meses
+    (solo se valora la FV hasta el consumo del mes).
+    """
+
+    consumo = np.asarray(consumo_12m, dtype=float)
+
+    gen_util = np.minimum(energia_anios_12m, consumo[None, :])
+
+    return gen_util.sum(axis=1) * float(tarifa_energia)
+
+
+def _payback(capex: float, ahorros: np.ndarray) -> Optional[float]:
+    """
+    Años hasta recuperar el capex con ahorros acumulados
+    (interpolado dentro del año).
+
+    None si no se recupera dentro de la vida útil (en el almacén
+    queda NULL y los filtros payback_max no lo incluyen).
+    """
+
+    if capex <= 0:
+        return 0.0
+
+    acumulado = np.cumsum(ahorros)
+
+    i = int(np.searchsorted(acumulado, capex))
+
+    if i >= len(ahorros) or ahorros[i] <= 0:
+        return None
+
+    previo = acumulado[i - 1] if i > 0 else 0.0
+
+    return float(i + (capex - previo) / ahorros[i])
+
+
 # ==========================================================
 # 🔵 TIR
 # ==========================================================
@@ -256,9 +334,12 @@ def ejecutar_finanzas(
 
     om_mensual_val = om_mensual(capex, datos.om_anual_pct)
 
+    # años × 12 con LID / degradación; la tabla operativa es el año 1
+    energia_anios_12m = energia_fv_vida_util_12m(energia, _degradacion(datos))
+
     tabla_12m = simular_12_meses(
         consumo_12m=datos.consumo_12m,
-        energia_fv_12m=energia_fv_12m,
+        energia_fv_12m=energia_anios_12m[0].tolist(),
         tarifa_energia=datos.tarifa_energia,
         cargos_fijos=datos.cargos_fijos,
         cuota_mensual=cuota,
@@ -272,12 +353,16 @@ def ejecutar_finanzas(
     # 🔥 INDICADORES FINANCIEROS
     # ==========================================================
 
+    ahorros = _ahorro_anual_vida_util(
+        energia_anios_12m,
+        datos.consumo_12m,
+        datos.tarifa_energia,
+    )
+
     roi = (ahorro_anual / capex) * 100 if capex > 0 else 0.0
-    payback = capex / ahorro_anual if ahorro_anual > 0 else 0.0
+    payback = _payback(capex, ahorros)
 
-    flujos = [-capex]
-    for _ in range(10):
-        flujos.append(ahorro_anual)
+    flujos = [-capex] + ahorros.tolist()
 
     tir = _tir(flujos) * 100
 
@@ -290,4 +375,6 @@ def ejecutar_finanzas(
         "roi_pct": roi,
         "payback_anios": payback,
         "tir_pct": tir,
+        "energia_fv_anual_vida_kwh": energia_anios_12m.sum(axis=1).tolist(),
+        "ahorro_anual_vida_L": ahorros.tolist(),
     }
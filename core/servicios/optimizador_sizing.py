@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+"""
+OPTIMIZADOR DE SIZING (PANELES × INVERSOR × N INVERSORES)
+=========================================================
+
+Responsabilidad
+---------------
+
+Explorar muchas combinaciones de generador e inversor sobre la
+simulación real del sitio (no sobre un rendimiento fijo por kWp)
+y devolver el frente de Pareto energía útil vs CAPEX.
+
+Pipeline:
+
+    serie DC por kWp del sitio (motor 8760, se calcula UNA vez)
+            ↓
+    perfil mensual ordenado (energy.sistema.curva_clipping)
+            ↓
+    candidatos (n_paneles, inversor, n_inversores)
+            ↓
+    energía AC + clipping + finanzas (vectorizado)
+            ↓
+    frente de Pareto
+
+Reglas
+------
+
+    ✔ misma orientación/panel que la simulación de referencia
+    ✔ mismas pérdidas que la simulación (EnergiaResultado.cadena)
+    ✔ clipping exacto hora a hora por candidato
+    ❌ no valida strings ni ventana MPPT (eso es electrical.paneles)
+"""
+
+from dataclasses import dataclass, field, replace
+from math import ceil
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.dominio.modelo import Datosproyecto
+from electrical.catalogos import get_inversor, ids_inversores
+from energy.sistema.curva_clipping import evaluar_candidatos, factores_ac_mensuales, preparar_perfil_dc
+from energy.sistema.motor_vectorizado import ParametrosCadena
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class CandidatoSizing:
+    """
+    payback_anios:
+        None si el ahorro neto no recupera el CAPEX.
+    """
+
+    n_paneles: int
+    inversor_id: str
+    n_inversores: int
+
+    pdc_kw: float
+    pac_kw: float
+    dc_ac_ratio: float
+
+    energia_util_anual_kwh: float
+    clipping_anual_kwh: float
+    energia_util_12m: List[float]
+
+    capex_L: float
+    ahorro_anual_L: float
+    payback_anios: Optional[float]
+
+
+@dataclass(frozen=True)
+class ResultadoOptimizacion:
+
+    frente_pareto: List[CandidatoSizing]
+    n_evaluados: int
+
+    mejor_payback: Optional[CandidatoSizing] = None
+
+    meta: Dict[str, object] = field(default_factory=dict)
+
+
+# ==========================================================
+# ENTRADA DESDE LA SIMULACIÓN
+# ==========================================================
+
+def dc_por_kwp_desde_energia(energia) -> np.ndarray:
+    """
+    Serie DC bruta por kWp instalado a partir de un EnergiaResultado.
+    """
+
+    series = getattr(energia, "series", None)
+
+    if series is None:
+        raise ValueError("EnergiaResultado sin series horarias")
+
+    if energia.pdc_instalada_kw <= 0:
+        raise ValueError("pdc_instalada_kw inválido")
+
+    return np.asarray(series.dc_bruta_kw, dtype=float) / energia.pdc_instalada_kw
+
+
+# ==========================================================
+# CANDIDATOS
+# ==========================================================
+
+def _grilla_paneles(
+    consumo_anual: float,
+    rendimiento_kwh_kwp: float,
+    panel_w: float,
+    max_tamanos: int,
+) -> np.ndarray:
+    """
+    Tamaños entre 10 % y 200 % de cobertura del consumo anual.
+    """
+
+    if rendimiento_kwh_kwp <= 0 or consumo_anual <= 0:
+        raise ValueError("No se puede construir la grilla de paneles")
+
+    def n_para(cobertura):
+        kwp = consumo_anual * cobertura / rendimiento_kwh_kwp
+        return max(1, int(ceil(kwp * 1000 / panel_w)))
+
+    n_min, n_max = n_para(0.10), n_para(2.00)
+
+    paso = max(1, int(ceil((n_max - n_min + 1) / max_tamanos)))
+
+    return np.arange(n_min, n_max + 1, paso)
+
+
+def _frente_pareto(capex: np.ndarray, energia: np.ndarray) -> np.ndarray:
+    """
+    Índices no dominados (menor CAPEX, mayor energía).
+    """
+
+    orden = np.lexsort((-energia, capex))
+
+    mejor = -np.inf
+    frente = []
+
+    for i in orden:
+        if energia[i] > mejor:
+            frente.append(i)
+            mejor = energia[i]
+
+    return np.array(frente, dtype=int)
+
+
+# ==========================================================
+# API PRINCIPAL
+# ==========================================================
+
+def optimizar_sizing(
+    datos: Datosproyecto,
+    dc_por_kwp_kw: np.ndarray,
+    panel,
+    *,
+    cadena: ParametrosCadena,
+    costo_inversor_usd_kw: float,
+    inversores_ids: Optional[Sequence[str]] = None,
+    n_paneles: Optional[Sequence[int]] = None,
+    n_inversores_max: int = 4,
+    dc_ac_min: float = 0.9,
+    dc_ac_max: float = 1.6,
+    tolerancia_payback_frac: float = 0.01,
+    max_tamanos: int = 200,
+) -> ResultadoOptimizacion:
+    """
+    Evalúa todos los candidatos (n_paneles, inversor, n_inversores).
+
+    dc_por_kwp_kw:
+        serie 8760 de DC bruta por kWp (dc_por_kwp_desde_energia).
+
+    cadena:
+        pérdidas y eficiencia de la simulación de referencia
+        (EnergiaResultado.cadena); su pac_nominal_kw se ignora.
+
+    costo_inversor_usd_kw:
+        adicional de CAPEX por kW AC instalado (además de
+        datos.costo_usd_kwp, que ya incluye el BOS típico). Sin él
+        la capacidad AC sería gratis y el mejor payback tendería
+        al mayor número de inversores.
+
+    tolerancia_payback_frac:
+        candidatos con payback dentro de esta fracción del mínimo se
+        consideran empatados; entre ellos gana el de menor CAPEX.
+    """
+
+    if n_inversores_max < 1:
+        raise ValueError("n_inversores_max debe ser >= 1")
+
+    if costo_inversor_usd_kw < 0:
+        raise ValueError("costo_inversor_usd_kw debe ser >= 0")
+
+    if tolerancia_payback_frac < 0:
+        raise ValueError("tolerancia_payback_frac debe ser >= 0")
+
+    base = replace(cadena, pac_nominal_kw=1.0)
+
+    perfil = preparar_perfil_dc(dc_por_kwp_kw, base)
+
+    consumo_12m = np.asarray(datos.consumo_12m, dtype=float)
+
+    if len(consumo_12m) != 12:
+        raise ValueError("consumo_12m debe tener 12 valores")
+
+    # ------------------------------------------------------
+    # GRILLA DE CANDIDATOS
+    # ------------------------------------------------------
+
+    if n_paneles is None:
+        f_ac = factores_ac_mensuales(base, len(dc_por_kwp_kw))
+        rendimiento = float((perfil.dc_neta_12m_por_kwp * f_ac).sum()) * base.eficiencia_inversor
+        n_paneles = _grilla_paneles(consumo_12m.sum(), rendimiento, panel.pmax_w, max_tamanos)
+
+    n_pan = np.asarray(n_paneles, dtype=int)
+
+    ids = list(inversores_ids) if inversores_ids else ids_inversores()
+    kw_inv = np.array([float(get_inversor(i).kw_ac) for i in ids])
+
+    n_inv = np.arange(1, n_inversores_max + 1)
+
+    P, I, K = np.meshgrid(
+        np.arange(len(n_pan)), np.arange(len(ids)), n_inv, indexing="ij"
+    )
+
+    P, I, K = P.ravel(), I.ravel(), K.ravel()
+
+    pdc = n_pan[P] * panel.pmax_w / 1000.0
+    pac = kw_inv[I] * K
+    ratio = pdc / pac
+
+    ok = (ratio >= dc_ac_min) & (ratio <= dc_ac_max)
+
+    P, I, K, pdc, pac, ratio = P[ok], I[ok], K[ok], pdc[ok], pac[ok], ratio[ok]
+
+    if len(pdc) == 0:
+        return ResultadoOptimizacion(frente_pareto=[], n_evaluados=0)
+
+    # ------------------------------------------------------
+    # ENERGÍA
+    # ------------------------------------------------------
+
+    ener = evaluar_candidatos(perfil, pdc, pac, base)
+
+    energia_anual = ener.ac_anual
+
+    # ------------------------------------------------------
+    # FINANZAS
+    # ------------------------------------------------------
+
+    capex = (
+        pdc * datos.costo_usd_kwp
+        + pac * costo_inversor_usd_kw
+    ) * datos.tcambio
+
+    ahorro = np.minimum(ener.ac_12m, consumo_12m[None, :]).sum(axis=1) * datos.tarifa_energia
+
+    flujo = ahorro - capex * datos.om_anual_pct
+
+    with np.errstate(divide="ignore"):
+        payback = np.where(flujo > 0, capex / flujo, np.inf)
+
+    # ------------------------------------------------------
+    # SALIDA
+    # ------------------------------------------------------
+
+    def _candidato(j: int) -> CandidatoSizing:
+        return CandidatoSizing(
+            n_paneles=int(n_pan[P[j]]),
+            inversor_id=ids[I[j]],
+            n_inversores=int(K[j]),
+            pdc_kw=float(pdc[j]),
+            pac_kw=float(pac[j]),
+            dc_ac_ratio=float(ratio[j]),
+            energia_util_anual_kwh=float(energia_anual[j]),
+            clipping_anual_kwh=float(ener.clipping_anual[j]),
+            energia_util_12m=ener.ac_12m[j].tolist(),
+            capex_L=float(capex[j]),
+            ahorro_anual_L=float(ahorro[j]),
+            payback_anios=float(payback[j]) if np.isfinite(payback[j]) else None,
+        )
+
+    frente = [_candidato(j) for j in _frente_pareto(capex, energia_anual)]
+
+    mejor = None
+
+    if np.isfinite(payback).any():
+
+        # paybacks casi iguales son ruido: gana el menor CAPEX
+        empatados = np.flatnonzero(payback <= payback.min() * (1.0 + tolerancia_payback_frac))
+
+        mejor = _candidato(int(empatados[np.argmin(capex[empatados])]))
+
+    return ResultadoOptimizacion(
+        frente_pareto=frente,
+        n_evaluados=int(len(pdc)),
+        mejor_payback=mejor,
+        meta={
+            "inversores": ids,
+            "n_tamanos": int(len(n_pan)),
+            "dc_ac_rango": (dc_ac_min, dc_ac_max),
+            "tolerancia_payback_frac": tolerancia_payback_frac,
+        },
+    )
+
+
+def optimizar_sizing_proyecto(
+    datos: Datosproyecto,
+    energia,
+    panel,
+    *,
+    costo_inversor_usd_kw: float,
+    **kwargs,
+) -> ResultadoOptimizacion:
+    """
+    Optimización sobre la simulación del estudio: serie DC por kWp
+    y pérdidas (EnergiaResultado.series / .cadena).
+    """
+
+    cadena = getattr(energia, "cadena", None)
+
+    if cadena is None:
+        raise ValueError("EnergiaResultado sin parámetros de cadena")
+
+    return optimizar_sizing(
+        datos,
+        dc_por_kwp_desde_energia(energia),
+        panel,
+        cadena=cadena,
+        costo_inversor_usd_kw=costo_inversor_usd_kw,
+        **kwargs,
+    )
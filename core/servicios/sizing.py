@@ -16,6 +16,10 @@ from electrical.catalogos import get_panel, get_inversor
 from electrical.inversor.orquestador_inversor import ejecutar_inversor_desde_sizing
 
 
+# respaldo sin coordenadas válidas
+RENDIMIENTO_DEFECTO_KWH_KWP = 1500.0
+
+
 # ==========================================================
 # HELPERS
 # ==========================================================
@@ -106,9 +110,37 @@ def _leer_consumo(p: Datosproyecto):
 # GENERADOR (NORMAL)
 # ==========================================================
 
-def _dimensionar_generador(panel, modo, valor, consumo_anual):
+def _energia_por_kwp_anual(p: Datosproyecto) -> float:
+    """
+    kWh/kWp·año preliminar del sitio (cielo despejado, sin PVGIS).
+
+    Sin coordenadas válidas se usa RENDIMIENTO_DEFECTO_KWH_KWP.
+    """
+
+    lat = float(getattr(p, "lat", 0.0) or 0.0)
+    lon = float(getattr(p, "lon", 0.0) or 0.0)
+
+    if lat == 0 and lon == 0:
+        return RENDIMIENTO_DEFECTO_KWH_KWP
+
+    from energy.solar.rendimiento_preliminar import estimar_rendimiento_preliminar
+
+    sf = getattr(p, "sistema_fv", None) or {}
+
+    try:
+        r = estimar_rendimiento_preliminar(
+            lat,
+            lon,
+            tilt_deg=float(sf.get("inclinacion", getattr(p, "tilt_deg", 15.0))),
+            azimut_deg=float(sf.get("azimut", getattr(p, "azimut_deg", 180.0))),
+        )
+    except ValueError:
+        return RENDIMIENTO_DEFECTO_KWH_KWP
+
+    return r.kwh_kwp_anual if r.kwh_kwp_anual > 0 else RENDIMIENTO_DEFECTO_KWH_KWP
+
 
-    energia_por_kwp_anual = 1500.0
+def _dimensionar_generador(panel, modo, valor, consumo_anual, energia_por_kwp_anual):
 
     if modo == "cobertura":
 
@@ -257,7 +289,8 @@ def calcular_sizing_unificado(p: Datosproyecto) -> ResultadoSizing:
             panel,
             modo,
             valor,
-            consumo_anual
+            consumo_anual,
+            _energia_por_kwp_anual(p) if modo == "cobertura" else RENDIMIENTO_DEFECTO_KWH_KWP,
         )
 
     # ======================================================
@@ -22,6 +22,9 @@ API pública expuesta:
     catalogo_paneles()      ← usado por UI
     catalogo_inversores()   ← usado por UI
 
+    firma_catalogo()        ← clave de caches derivados
+    invalidar_catalogo()
+
 Consumido por:
     core.servicios.sizing
     electrical.paneles
@@ -35,6 +38,8 @@ from .catalogos import (
     ids_inversores,
     catalogo_paneles,
     catalogo_inversores,
+    firma_catalogo,
+    invalidar_catalogo,
 )
 
 __all__ = [
@@ -44,4 +49,6 @@ __all__ = [
     "ids_inversores",
     "catalogo_paneles",
     "catalogo_inversores",
+    "firma_catalogo",
+    "invalidar_catalogo",
 ]
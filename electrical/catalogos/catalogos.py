@@ -25,6 +25,9 @@ API pública del catálogo:
     catalogo_paneles()      ← para UI
     catalogo_inversores()   ← para UI
 
+    firma_catalogo()        ← clave de caches derivados
+    invalidar_catalogo()
+
 Consumido por:
     core.servicios.sizing
     electrical.paneles
@@ -42,13 +45,14 @@ Este módulo NO:
 """
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from electrical.modelos.paneles import PanelSpec as Panel
 from electrical.modelos.inversor import InversorSpec as Inversor
 
 # loader real
 from .catalogos_yaml import (
+    _read_yaml_cached,
     _paneles,
     _inversores,
 )
@@ -95,12 +99,82 @@ _YAML_PANELES = _DATA_DIR / "paneles.yaml"
 _YAML_INVERSORES = _DATA_DIR / "inversores.yaml"
 
 
+# ==========================================================
+# Firma e invalidación
+# ==========================================================
+
+# se incrementa en cada invalidación explícita o cambio de YAML
+_generacion = 0
+_firma_yaml: Optional[Tuple] = None
+
+
+def _firma_archivos() -> Tuple:
+
+    firma = []
+
+    for path in (_YAML_PANELES, _YAML_INVERSORES):
+
+        if path.exists():
+            st = path.stat()
+            firma.append((st.st_mtime_ns, st.st_size))
+        else:
+            firma.append(None)
+
+    return tuple(firma)
+
+
+def invalidar_catalogo() -> None:
+    """
+    Descarta los YAML cacheados; la próxima consulta relee disco.
+    """
+
+    global _generacion
+
+    _read_yaml_cached.cache_clear()
+    _paneles.cache_clear()
+    _inversores.cache_clear()
+
+    _generacion += 1
+
+
+def _sincronizar() -> None:
+    """
+    Invalida el catálogo si los YAML cambiaron en disco.
+    """
+
+    global _firma_yaml
+
+    firma = _firma_archivos()
+
+    if firma != _firma_yaml:
+
+        if _firma_yaml is not None:
+            invalidar_catalogo()
+
+        _firma_yaml = firma
+
+
+def firma_catalogo() -> Tuple:
+    """
+    Identifica la versión vigente del catálogo.
+
+    Los caches derivados (matriz de compatibilidad, índices de UI)
+    la usan como clave: cambia al editar un YAML o al invalidar.
+    """
+
+    _sincronizar()
+
+    return (_generacion,) + _firma_yaml
+
+
 # ==========================================================
 # Merge catálogo base + YAML
 # ==========================================================
 
 def _merge_paneles() -> Dict[str, Panel]:
 
+    _sincronizar()
+
     out = dict(_PANELES)
 
     if _YAML_PANELES.exists():
@@ -111,6 +185,8 @@ def _merge_paneles() -> Dict[str, Panel]:
 
 def _merge_inversores() -> Dict[str, Inversor]:
 
+    _sincronizar()
+
     out = dict(_INVERSORES)
 
     if _YAML_INVERSORES.exists():
@@ -31,7 +31,7 @@ from typing import Any, Dict
 import yaml
 from functools import lru_cache
 
-from electrical.modelos.paneles import PanelSpec
+from electrical.modelos.paneles import CoeficientesTermicos, PanelSpec
 from electrical.modelos.inversor import InversorSpec
 
 
@@ -131,6 +131,40 @@ def _validate_inversor(iid: str, inv: Dict[str, Any]):
         _req_num(dc, k, f"inversores.{iid}.entrada_dc")
 
 
+# ==========================================================
+# Coeficientes térmicos (Faiman / PVsyst / SAPM)
+# ==========================================================
+
+def _coeficientes_termicos(pid: str, termico: Dict[str, Any]) -> CoeficientesTermicos:
+
+    base = CoeficientesTermicos()
+    ctx = f"paneles.{pid}.termico"
+
+    faiman = termico.get("faiman") or {}
+    pvsyst = termico.get("pvsyst") or {}
+    sapm = termico.get("sapm") or {}
+
+    c = CoeficientesTermicos(
+        faiman_u0=_opt_num(faiman, "u0", f"{ctx}.faiman", base.faiman_u0),
+        faiman_u1=_opt_num(faiman, "u1", f"{ctx}.faiman", base.faiman_u1),
+        pvsyst_uc=_opt_num(pvsyst, "uc", f"{ctx}.pvsyst", base.pvsyst_uc),
+        pvsyst_uv=_opt_num(pvsyst, "uv", f"{ctx}.pvsyst", base.pvsyst_uv),
+        absorcion=_opt_num(pvsyst, "absorcion", f"{ctx}.pvsyst", base.absorcion),
+        eficiencia_modulo=_opt_num(pvsyst, "eficiencia", f"{ctx}.pvsyst", base.eficiencia_modulo),
+        sapm_a=_opt_num(sapm, "a", f"{ctx}.sapm", base.sapm_a),
+        sapm_b=_opt_num(sapm, "b", f"{ctx}.sapm", base.sapm_b),
+        sapm_dt=_opt_num(sapm, "dt", f"{ctx}.sapm", base.sapm_dt),
+    )
+
+    if c.faiman_u0 <= 0 or c.pvsyst_uc <= 0:
+        raise ValueError(f"{ctx}: u0 / uc deben ser > 0")
+
+    if not (0 < c.absorcion <= 1) or not (0 <= c.eficiencia_modulo < 1):
+        raise ValueError(f"{ctx}: absorcion en (0, 1] y eficiencia en [0, 1)")
+
+    return c
+
+
 # ==========================================================
 # Carga paneles
 # ==========================================================
@@ -166,6 +200,7 @@ def _paneles() -> Dict[str, PanelSpec]:
             coef_vmp_pct_c=coef_vmp,
             coef_potencia_pct_c=coef_pmax,
             noct_c=noct_c,
+            termico=_coeficientes_termicos(pid, termico),
         )
 
     return out
@@ -8,6 +8,7 @@ Exporta los contratos de datos usados por el motor eléctrico.
 
 Modelos disponibles:
     PanelSpec
+    CoeficientesTermicos
     InversorSpec
 
 Consumido por:
@@ -19,10 +20,11 @@ Consumido por:
     electrical.nec
 """
 
-from .paneles import PanelSpec
+from .paneles import CoeficientesTermicos, PanelSpec
 from .inversor import InversorSpec
 
 __all__ = [
     "PanelSpec",
+    "CoeficientesTermicos",
     "InversorSpec",
 ]
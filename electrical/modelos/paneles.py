@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 """
@@ -13,6 +13,7 @@ Entrada:
 
 Salida:
     PanelSpec
+    CoeficientesTermicos
     ParametrosCableado
 
 Consumido por:
@@ -28,6 +29,34 @@ No contiene lógica ni cálculos.
 """
 
 
+# ==========================================================
+# COEFICIENTES TÉRMICOS DEL MÓDULO
+# ==========================================================
+
+@dataclass(frozen=True)
+class CoeficientesTermicos:
+    """
+    Parámetros de los modelos de temperatura de celda con viento
+    (energy/panel_energia/modelo_termico). Valores por defecto:
+    montaje en rack abierto, vidrio/polímero.
+    """
+
+    # Faiman: T = Ta + E / (u0 + u1·v)
+    faiman_u0: float = 25.0
+    faiman_u1: float = 6.84
+
+    # PVsyst: T = Ta + α·E·(1 − η) / (Uc + Uv·v)
+    pvsyst_uc: float = 29.0
+    pvsyst_uv: float = 0.0
+    absorcion: float = 0.9
+    eficiencia_modulo: float = 0.10
+
+    # SAPM: T = Ta + E·exp(a + b·v) + E/1000·ΔT
+    sapm_a: float = -3.56
+    sapm_b: float = -0.075
+    sapm_dt: float = 3.0
+
+
 # ==========================================================
 # ESPECIFICACIÓN DEL PANEL FV
 # ==========================================================
@@ -52,6 +81,9 @@ class PanelSpec:
     coef_potencia_pct_c: float   
     noct_c: float                
 
+    # modelos térmicos con viento (Faiman / PVsyst / SAPM)
+    termico: CoeficientesTermicos = field(default_factory=CoeficientesTermicos)
+
 
 # ==========================================================
 # PARÁMETROS DE CABLEADO
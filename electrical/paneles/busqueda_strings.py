@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+"""
+BÚSQUEDA VECTORIZADA DE CONFIGURACIONES DE STRINGS — FV Engine
+==============================================================
+
+Responsabilidad
+---------------
+
+Explorar todas las distribuciones de strings de un generador sobre
+uno o varios inversores y devolver las K mejores, evaluando los
+candidatos en bloque con NumPy.
+
+A diferencia de calculo_de_strings (una sola longitud de string,
+un solo número de inversores), aquí se consideran:
+
+    • dos grupos de MPPT con longitudes de string distintas
+    • varios números de inversores
+    • límite de corriente por MPPT (imppt_max_a)
+
+Espacio de búsqueda
+-------------------
+
+Cada candidato es:
+
+    n_inversores
+    grupo A: m_a MPPT con s_a strings de L_a paneles
+    grupo B: m_b MPPT con s_b strings de L_b paneles
+
+Los strings en paralelo de un mismo MPPT tienen siempre la misma
+longitud; la mezcla de longitudes es ENTRE MPPT.
+
+Para cada (n_inv, L_a, L_b, s_a, s_b, m_a) el grupo B se llena con
+el máximo de MPPT que admiten los paneles restantes, así que la
+grilla no crece con m_b.
+
+Puntuación (menor = mejor)
+--------------------------
+
+    margen de tensión   distancia a la ventana MPPT / Vdc máx.
+    sobrantes           paneles sin asignar / total
+    utilización MPPT    fracción de entradas MPPT sin usar
+    desajuste           diferencia de tensión entre grupos
+    DC/AC (opcional)    desvío respecto al objetivo
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    PanelSpec + InversorSpec + n_paneles_total + temperaturas
+
+Salida:
+    ResultadoBusquedaStrings
+
+Reglas arquitectónicas
+----------------------
+
+    ✔ solo eléctrica DC (tensión / corriente)
+    ✔ mismos límites de temperatura que calculo_de_strings
+    ❌ no calcula energía
+    ❌ no asigna strings a posiciones físicas (ver _distribuir)
+"""
+
+from dataclasses import dataclass, field
+from math import ceil
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from electrical.modelos.inversor import InversorSpec
+from electrical.modelos.paneles import PanelSpec
+from electrical.paneles.calculo_de_strings import BoundsCalc, _bounds
+
+
+# ==========================================================
+# CONFIGURACIÓN
+# ==========================================================
+
+# margen relativo a partir del cual la tensión se considera holgada
+MARGEN_REFERENCIA = 0.10
+
+# strings en paralelo por MPPT si el inversor no declara imppt_max_a
+MAX_STRINGS_POR_MPPT = 4
+
+# inversores explorados por encima del mínimo cuando no se indican
+RANGO_INVERSORES_AUTO = 4
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class PesosBusqueda:
+    """
+    Pesos de cada término de la puntuación.
+    """
+
+    margen_v: float = 1.0
+    sobrantes: float = 4.0
+    utilizacion_mppt: float = 0.5
+    desajuste: float = 1.0
+    dc_ac: float = 1.0
+
+
+@dataclass(frozen=True)
+class GrupoStrings:
+    """
+    MPPT que comparten la misma longitud y número de strings.
+    """
+
+    n_series: int
+    strings_por_mppt: int
+    n_mppt: int
+
+    @property
+    def n_strings(self) -> int:
+        return self.strings_por_mppt * self.n_mppt
+
+    @property
+    def n_paneles(self) -> int:
+        return self.n_series * self.n_strings
+
+
+@dataclass(frozen=True)
+class ConfiguracionStrings:
+
+    n_inversores: int
+    grupos: Tuple[GrupoStrings, ...]
+
+    n_paneles_usados: int
+    sobrantes: int
+
+    margen_v_frac: float
+    utilizacion_mppt: float
+    carga_corriente: float
+    desajuste_frac: float
+    dc_ac_ratio: float
+
+    score: float
+
+
+@dataclass(frozen=True)
+class ResultadoBusquedaStrings:
+
+    ok: bool
+    errores: List[str]
+
+    configuraciones: List[ConfiguracionStrings]
+    bounds: BoundsCalc
+
+    n_evaluadas: int = 0
+    meta: dict = field(default_factory=dict)
+
+
+# ==========================================================
+# AUXILIARES
+# ==========================================================
+
+def _strings_max_por_mppt(panel: PanelSpec, inv: InversorSpec, tope: int) -> int:
+    """
+    Strings en paralelo admitidos por la corriente de un MPPT.
+    """
+
+    if inv.imppt_max_a is None:
+        return tope
+
+    return min(tope, int(inv.imppt_max_a // panel.imp_a))
+
+
+def _rango_inversores(
+    n_inversores: Union[int, Sequence[int], None],
+    n_total: int,
+    inv: InversorSpec,
+    s_max: int,
+    n_max: int,
+) -> np.ndarray:
+
+    if n_inversores is None:
+        k_min = max(1, ceil(n_total / (inv.n_mppt * s_max * n_max)))
+        return np.arange(k_min, k_min + RANGO_INVERSORES_AUTO)
+
+    k = np.atleast_1d(np.asarray(n_inversores, dtype=int))
+
+    if (k < 1).any():
+        raise ValueError("n_inversores debe ser >= 1")
+
+    return np.unique(k)
+
+
+def _resultado_vacio(errores: List[str], bounds: BoundsCalc) -> ResultadoBusquedaStrings:
+    return ResultadoBusquedaStrings(
+        ok=False,
+        errores=errores,
+        configuraciones=[],
+        bounds=bounds,
+    )
+
+
+# ==========================================================
+# API PRINCIPAL
+# ==========================================================
+
+def buscar_configuraciones_strings(
+    *,
+    n_paneles_total: int,
+    panel: PanelSpec,
+    inversor: InversorSpec,
+    t_min_c: float,
+    t_oper_c: float = 55.0,
+    n_inversores: Union[int, Sequence[int], None] = None,
+    top_k: int = 10,
+    max_strings_por_mppt: int = MAX_STRINGS_POR_MPPT,
+    dc_ac_objetivo: Optional[float] = None,
+    pesos: PesosBusqueda = PesosBusqueda(),
+) -> ResultadoBusquedaStrings:
+    """
+    Devuelve las top_k configuraciones ordenadas por puntuación.
+
+    n_inversores:
+        entero, lista de candidatos o None (rango automático desde
+        el mínimo que admite la capacidad de entrada del inversor).
+    """
+
+    if n_paneles_total <= 0:
+        return _resultado_vacio(["Paneles inválidos"], BoundsCalc(0, 0))
+
+    if top_k < 1:
+        raise ValueError("top_k debe ser >= 1")
+
+    n_min, n_max, voc_frio, vmp_oper = _bounds(panel, inversor, t_min_c, t_oper_c)
+
+    if n_max < n_min:
+        return _resultado_vacio(["No hay rango válido"], BoundsCalc(0, 0))
+
+    bounds = BoundsCalc(n_min, n_max)
+
+    s_max = _strings_max_por_mppt(panel, inversor, max_strings_por_mppt)
+
+    if s_max < 1:
+        return _resultado_vacio(
+            ["Corriente de un string supera imppt_max_a del inversor"], bounds
+        )
+
+    N = int(n_paneles_total)
+    K = _rango_inversores(n_inversores, N, inversor, s_max, n_max)
+
+    # ------------------------------------------------------
+    # GRILLA (n_inv, L_a, L_b, s_a, s_b, m_a)
+    # ------------------------------------------------------
+
+    largos = np.arange(n_min, n_max + 1)
+    ia, ib = np.triu_indices(len(largos))
+
+    s = np.arange(1, s_max + 1)
+    m = np.arange(1, int(K.max()) * inversor.n_mppt + 1)
+
+    # ejes en broadcasting: (n_inv, par, s_a, s_b, m_a)
+    k_ = K[:, None, None, None, None]
+    la = largos[ia][None, :, None, None, None]
+    lb = largos[ib][None, :, None, None, None]
+    sa = s[None, None, :, None, None]
+    sb = s[None, None, None, :, None]
+    ma = m[None, None, None, None, :]
+
+    n_mppt_total = k_ * inversor.n_mppt
+
+    usados_a = ma * sa * la
+
+    # mismo largo → B solo si tiene distinto número de strings
+    uniforme = (la == lb) & (sa == sb)
+
+    valido = (
+        (ma <= n_mppt_total)
+        & (usados_a <= N)
+        & ((la < lb) | (sa >= sb))
+    )
+
+    # ------------------------------------------------------
+    # LLENADO DEL GRUPO B
+    # ------------------------------------------------------
+
+    restantes = np.maximum(N - usados_a, 0)
+
+    mb = np.minimum(n_mppt_total - ma, restantes // (sb * lb))
+    mb = np.where(uniforme, 0, np.maximum(mb, 0))
+
+    # grupo B vacío en un candidato mixto = duplicado de un uniforme
+    valido &= uniforme | (mb > 0)
+
+    i_k, i_par, i_sa, i_sb, i_m = np.nonzero(valido)
+
+    if len(i_k) == 0:
+        return _resultado_vacio(["Sin configuraciones válidas"], bounds)
+
+    mb = mb[i_k, i_par, i_sa, i_sb, i_m]
+
+    k_ = K[i_k]
+    la = largos[ia][i_par]
+    lb = largos[ib][i_par]
+    sa = s[i_sa]
+    sb = s[i_sb]
+    ma = m[i_m]
+
+    n_mppt_total = k_ * inversor.n_mppt
+
+    pan_a = ma * sa * la
+    pan_b = mb * sb * lb
+    usados = pan_a + pan_b
+
+    # ------------------------------------------------------
+    # MÉTRICAS
+    # ------------------------------------------------------
+
+    sobrantes = N - usados
+
+    mppt_usados = ma + mb
+    utilizacion = mppt_usados / n_mppt_total
+
+    if inversor.imppt_max_a:
+        limite_a = float(inversor.imppt_max_a)
+    else:
+        limite_a = max_strings_por_mppt * panel.imp_a
+
+    carga = (ma * sa + mb * sb) * panel.imp_a / (mppt_usados * limite_a)
+
+    def _margen(n):
+        inferior = (n * vmp_oper - inversor.mppt_min_v) / inversor.mppt_min_v
+        superior = (inversor.vdc_max_v - n * voc_frio) / inversor.vdc_max_v
+        return np.minimum(inferior, superior)
+
+    margen = np.where(mb > 0, np.minimum(_margen(la), _margen(lb)), _margen(la))
+
+    # diferencia de tensión entre grupos, ponderada por el grupo menor
+    desajuste = (lb - la) / lb * 2 * np.minimum(pan_a, pan_b) / usados
+
+    dc_ac = usados * panel.pmax_w / (1000.0 * k_ * inversor.kw_ac)
+
+    # ------------------------------------------------------
+    # PUNTUACIÓN
+    # ------------------------------------------------------
+
+    score = (
+        pesos.margen_v * (1 - np.clip(margen / MARGEN_REFERENCIA, 0, 1))
+        + pesos.sobrantes * sobrantes / N
+        + pesos.utilizacion_mppt * (1 - utilizacion)
+        + pesos.desajuste * desajuste
+    )
+
+    if dc_ac_objetivo:
+        score = score + pesos.dc_ac * np.abs(dc_ac - dc_ac_objetivo) / dc_ac_objetivo
+
+    n = min(top_k, len(score))
+
+    mejores = np.argpartition(score, n - 1)[:n]
+    mejores = mejores[np.argsort(score[mejores], kind="stable")]
+
+    # ------------------------------------------------------
+    # SALIDA
+    # ------------------------------------------------------
+
+    def _config(j: int) -> ConfiguracionStrings:
+
+        grupos = [GrupoStrings(int(la[j]), int(sa[j]), int(ma[j]))]
+
+        if mb[j] > 0:
+            grupos.append(GrupoStrings(int(lb[j]), int(sb[j]), int(mb[j])))
+
+        return ConfiguracionStrings(
+            n_inversores=int(k_[j]),
+            grupos=tuple(grupos),
+            n_paneles_usados=int(usados[j]),
+            sobrantes=int(sobrantes[j]),
+            margen_v_frac=float(margen[j]),
+            utilizacion_mppt=float(utilizacion[j]),
+            carga_corriente=float(carga[j]),
+            desajuste_frac=float(desajuste[j]),
+            dc_ac_ratio=float(dc_ac[j]),
+            score=float(score[j]),
+        )
+
+    return ResultadoBusquedaStrings(
+        ok=True,
+        errores=[],
+        configuraciones=[_config(int(j)) for j in mejores],
+        bounds=bounds,
+        n_evaluadas=int(len(score)),
+        meta={
+            "n_inversores": K.tolist(),
+            "strings_max_por_mppt": s_max,
+        },
+    )
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-from math import ceil, floor
 from typing import List, Optional
 
 from electrical.modelos.paneles import PanelSpec
 from electrical.modelos.inversor import InversorSpec
+from electrical.paneles.limites_tension import (
+    calcular_limites_tension,
+    corregir_tension,
+)
 
 
 # =========================================================
@@ -47,29 +50,21 @@ class StringsResultado:
 
 
 # =========================================================
-# TEMPERATURA
+# TEMPERATURA / LIMITES (fuente única: limites_tension)
 # =========================================================
 
 def _voc_frio(voc, coef, t_min):
-    return voc * (1 + coef / 100 * (t_min - 25))
+    return corregir_tension(voc, coef, t_min)
 
 
 def _vmp_temp(vmp, coef, t_oper):
-    return vmp * (1 + coef / 100 * (t_oper - 25))
+    return corregir_tension(vmp, coef, t_oper)
 
 
-# =========================================================
-# LIMITES
-# =========================================================
-
 def _bounds(panel, inv, t_min, t_oper):
-    voc = _voc_frio(panel.voc_v, panel.coef_voc_pct_c, t_min)
-    vmp = _vmp_temp(panel.vmp_v, panel.coef_vmp_pct_c, t_oper)
-
-    n_min = ceil(inv.mppt_min_v / vmp)
-    n_max = floor(inv.vdc_max_v / voc)
+    lim = calcular_limites_tension(panel, inv, t_min, t_oper)
 
-    return max(1, n_min), max(1, n_max), voc, vmp
+    return lim.n_min, lim.n_max, lim.voc_frio_v, lim.vmp_oper_v
 
 
 # =========================================================
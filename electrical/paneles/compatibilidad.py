@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+"""
+MATRIZ DE COMPATIBILIDAD PANEL × INVERSOR — FV Engine
+=====================================================
+
+Responsabilidad
+---------------
+
+Precalcular, para todo el catálogo, los límites de string de cada
+par panel / inversor a varias temperaturas mínimas de diseño:
+
+    n_min        ceil(mppt_min / Vmp a T_oper)            (P, I)
+    n_max        floor(vdc_max / Voc a T_min)             (P, I, T)
+    n_max_mppt   floor(mppt_max / Vmp a T_min)            (P, I, T)
+    strings_max_por_mppt   imppt_max / Imp                (P, I)
+
+Derivados:
+
+    compatible   n_max ≥ n_min
+    ajuste_mppt  existe un n en [n_min, min(n_max, n_max_mppt)]
+                 (el string también cabe en la ventana MPPT en frío)
+
+Las pantallas de selección filtran pares con una consulta a arrays
+en lugar de recalcular límites en cada rerun (consultar_pares):
+
+    rango n_series · ajuste MPPT · corriente por MPPT · DC/AC objetivo
+
+Cache
+-----
+
+La matriz se cachea con clave firma_catalogo(): editar un YAML o
+llamar invalidar_catalogo() genera una matriz nueva en la próxima
+consulta.
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    catálogo (electrical.catalogos) + temperaturas de diseño
+
+Salida:
+    MatrizCompatibilidad
+
+Consumido por:
+    ui.seleccion_equipos
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from electrical.catalogos import (
+    firma_catalogo,
+    get_inversor,
+    get_panel,
+    ids_inversores,
+    ids_paneles,
+)
+from electrical.paneles.limites_tension import (
+    corregir_tension,
+    n_series_max,
+    n_series_min,
+)
+
+
+# temperaturas mínimas de diseño precalculadas por defecto (°C)
+TEMPERATURAS_DISENO_C = (-10.0, -5.0, 0.0, 5.0, 10.0, 15.0)
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class MatrizCompatibilidad:
+
+    paneles_ids: Tuple[str, ...]
+    inversores_ids: Tuple[str, ...]
+    temperaturas_c: Tuple[float, ...]
+    t_oper_c: float
+
+    n_min: np.ndarray
+    n_max: np.ndarray
+    n_max_mppt: np.ndarray
+    strings_max_por_mppt: np.ndarray
+
+    pmax_w: np.ndarray
+    kw_ac: np.ndarray
+
+    indice_paneles: Dict[str, int]
+    indice_inversores: Dict[str, int]
+
+    firma: Tuple
+
+    @property
+    def compatible(self) -> np.ndarray:
+        return self.n_max >= self.n_min[:, :, None]
+
+    @property
+    def ajuste_mppt(self) -> np.ndarray:
+        return np.minimum(self.n_max, self.n_max_mppt) >= self.n_min[:, :, None]
+
+    def indice_temperatura(self, t_min_c: float) -> int:
+
+        try:
+            return self.temperaturas_c.index(float(t_min_c))
+        except ValueError:
+            raise ValueError(
+                f"Temperatura {t_min_c} °C no precalculada en la matriz"
+            ) from None
+
+    def limites(self, panel_id: str, inversor_id: str, t_min_c: float) -> Tuple[int, int]:
+        """
+        (n_min, n_max) de un par a la temperatura indicada.
+        """
+
+        p = self.indice_paneles[panel_id]
+        i = self.indice_inversores[inversor_id]
+        t = self.indice_temperatura(t_min_c)
+
+        return int(self.n_min[p, i]), int(self.n_max[p, i, t])
+
+    def pares_compatibles(
+        self,
+        t_min_c: float,
+        *,
+        exigir_ajuste_mppt: bool = True,
+    ) -> List[Tuple[str, str]]:
+
+        t = self.indice_temperatura(t_min_c)
+
+        ok = self.ajuste_mppt if exigir_ajuste_mppt else self.compatible
+
+        p, i = np.nonzero(ok[:, :, t])
+
+        return [(self.paneles_ids[a], self.inversores_ids[b]) for a, b in zip(p, i)]
+
+
+@dataclass(frozen=True)
+class ParCompatible:
+
+    panel_id: str
+    inversor_id: str
+
+    n_series_min: int
+    n_series_max: int
+    strings_max_por_mppt: Optional[int]
+
+    ajuste_mppt: bool
+    ajuste_corriente: bool
+
+    # solo con n_paneles
+    n_inversores: Optional[int] = None
+    dc_ac_ratio: Optional[float] = None
+    ajuste_dc_ac: Optional[bool] = None
+
+    @property
+    def valido(self) -> bool:
+        return (
+            self.ajuste_mppt
+            and self.ajuste_corriente
+            and self.ajuste_dc_ac is not False
+        )
+
+
+# ==========================================================
+# CONSTRUCCIÓN
+# ==========================================================
+
+def construir_matriz(
+    paneles_ids: Sequence[str],
+    inversores_ids: Sequence[str],
+    temperaturas_min_c: Sequence[float] = TEMPERATURAS_DISENO_C,
+    t_oper_c: float = 55.0,
+    *,
+    firma: Tuple = (),
+) -> MatrizCompatibilidad:
+    """
+    Evalúa todos los pares en bloque (broadcasting P × I × T).
+    """
+
+    paneles = [get_panel(pid) for pid in paneles_ids]
+    inversores = [get_inversor(iid) for iid in inversores_ids]
+
+    def col(objs, attr):
+        return np.array([float(getattr(o, attr)) for o in objs])[:, None, None]
+
+    def fila(objs, attr):
+        return np.array([float(getattr(o, attr)) for o in objs])[None, :, None]
+
+    T = np.asarray(temperaturas_min_c, dtype=float)[None, None, :]
+
+    vmp, coef_vmp = col(paneles, "vmp_v"), col(paneles, "coef_vmp_pct_c")
+    voc, coef_voc = col(paneles, "voc_v"), col(paneles, "coef_voc_pct_c")
+    imp = col(paneles, "imp_a")
+
+    vmp_oper = corregir_tension(vmp, coef_vmp, t_oper_c)
+    vmp_frio = corregir_tension(vmp, coef_vmp, T)
+    voc_frio = corregir_tension(voc, coef_voc, T)
+
+    n_min = n_series_min(fila(inversores, "mppt_min_v"), vmp_oper)[:, :, 0]
+    n_max = n_series_max(fila(inversores, "vdc_max_v"), voc_frio)
+    n_max_mppt = np.floor(fila(inversores, "mppt_max_v") / vmp_frio).astype(int)
+
+    # sin imppt_max_a declarado → sin límite de strings en paralelo
+    imppt = np.array([
+        np.inf if i.imppt_max_a is None else float(i.imppt_max_a)
+        for i in inversores
+    ])[None, :, None]
+
+    strings_max = np.floor(imppt / imp)[:, :, 0]
+
+    pmax_w = col(paneles, "pmax_w")[:, 0, 0]
+    kw_ac = fila(inversores, "kw_ac")[0, :, 0]
+
+    for a in (n_min, n_max, n_max_mppt, strings_max, pmax_w, kw_ac):
+        a.setflags(write=False)
+
+    return MatrizCompatibilidad(
+        paneles_ids=tuple(paneles_ids),
+        inversores_ids=tuple(inversores_ids),
+        temperaturas_c=tuple(float(t) for t in temperaturas_min_c),
+        t_oper_c=float(t_oper_c),
+        n_min=n_min,
+        n_max=n_max,
+        n_max_mppt=n_max_mppt,
+        strings_max_por_mppt=strings_max,
+        pmax_w=pmax_w,
+        kw_ac=kw_ac,
+        indice_paneles={pid: k for k, pid in enumerate(paneles_ids)},
+        indice_inversores={iid: k for k, iid in enumerate(inversores_ids)},
+        firma=firma,
+    )
+
+
+# ==========================================================
+# CACHE LIGADO AL CATÁLOGO
+# ==========================================================
+
+@lru_cache(maxsize=16)
+def _matriz_cacheada(
+    firma: Tuple,
+    temperaturas_min_c: Tuple[float, ...],
+    t_oper_c: float,
+) -> MatrizCompatibilidad:
+
+    return construir_matriz(
+        ids_paneles(),
+        ids_inversores(),
+        temperaturas_min_c,
+        t_oper_c,
+        firma=firma,
+    )
+
+
+def matriz_compatibilidad(
+    temperaturas_min_c: Sequence[float] = TEMPERATURAS_DISENO_C,
+    t_oper_c: float = 55.0,
+) -> MatrizCompatibilidad:
+    """
+    Matriz del catálogo vigente (se reconstruye solo si cambió).
+    """
+
+    return _matriz_cacheada(
+        firma_catalogo(),
+        tuple(float(t) for t in temperaturas_min_c),
+        float(t_oper_c),
+    )
+
+
+def limpiar_cache_compatibilidad() -> None:
+    _matriz_cacheada.cache_clear()
+
+
+# ==========================================================
+# CONSULTA (filtro / orden para UI)
+# ==========================================================
+
+ORDENES_CONSULTA = ("dc_ac", "n_series", "catalogo")
+
+
+def consultar_pares(
+    *,
+    t_min_c: float,
+    t_oper_c: float = 55.0,
+    panel_id: Optional[str] = None,
+    inversor_id: Optional[str] = None,
+    n_paneles: Optional[int] = None,
+    dc_ac_objetivo: Optional[float] = None,
+    tolerancia_dc_ac: float = 0.15,
+    solo_validos: bool = True,
+    ordenar_por: str = "dc_ac",
+) -> List[ParCompatible]:
+    """
+    Filtra y ordena pares panel / inversor sobre la matriz cacheada.
+
+    panel_id / inversor_id:
+        fijan una fila o columna (None = todo el catálogo).
+
+    n_paneles + dc_ac_objetivo:
+        número de inversores = round(Pdc / (kW_ac · objetivo)) ≥ 1;
+        el par ajusta si |DC/AC − objetivo| ≤ tolerancia_dc_ac.
+
+    ordenar_por:
+        "dc_ac"     → menor desvío al objetivo primero
+        "n_series"  → rango de string más amplio primero
+        "catalogo"  → orden de ids
+    """
+
+    if ordenar_por not in ORDENES_CONSULTA:
+        raise ValueError(f"ordenar_por inválido: {ordenar_por}")
+
+    temperaturas = TEMPERATURAS_DISENO_C
+
+    if float(t_min_c) not in temperaturas:
+        temperaturas = temperaturas + (float(t_min_c),)
+
+    m = matriz_compatibilidad(temperaturas, t_oper_c)
+    t = m.indice_temperatura(t_min_c)
+
+    P = np.arange(len(m.paneles_ids))
+    I = np.arange(len(m.inversores_ids))
+
+    if panel_id is not None:
+        P = np.array([m.indice_paneles[panel_id]])
+
+    if inversor_id is not None:
+        I = np.array([m.indice_inversores[inversor_id]])
+
+    p, i = (x.ravel() for x in np.meshgrid(P, I, indexing="ij"))
+
+    n_min = m.n_min[p, i]
+    n_max = np.minimum(m.n_max[p, i, t], m.n_max_mppt[p, i, t])
+    s_max = m.strings_max_por_mppt[p, i]
+
+    ajuste_mppt = n_max >= n_min
+    ajuste_corriente = s_max >= 1
+
+    valido = ajuste_mppt & ajuste_corriente
+
+    n_inv = ratio = ajuste_dc_ac = None
+
+    if n_paneles and dc_ac_objetivo:
+
+        pdc_kw = n_paneles * m.pmax_w[p] / 1000.0
+
+        n_inv = np.maximum(1, np.round(pdc_kw / (m.kw_ac[i] * dc_ac_objetivo))).astype(int)
+        ratio = pdc_kw / (n_inv * m.kw_ac[i])
+
+        ajuste_dc_ac = np.abs(ratio - dc_ac_objetivo) <= tolerancia_dc_ac
+        valido &= ajuste_dc_ac
+
+    sel = np.flatnonzero(valido) if solo_validos else np.arange(len(p))
+
+    if ordenar_por == "dc_ac" and ratio is not None:
+        sel = sel[np.argsort(np.abs(ratio[sel] - dc_ac_objetivo), kind="stable")]
+
+    elif ordenar_por == "n_series":
+        sel = sel[np.argsort(-(n_max[sel] - n_min[sel]), kind="stable")]
+
+    def _opt(a, j, tipo):
+        return None if a is None else tipo(a[j])
+
+    return [
+        ParCompatible(
+            panel_id=m.paneles_ids[p[j]],
+            inversor_id=m.inversores_ids[i[j]],
+            n_series_min=int(n_min[j]),
+            n_series_max=int(n_max[j]),
+            strings_max_por_mppt=(
+                int(s_max[j]) if np.isfinite(s_max[j]) else None
+            ),
+            ajuste_mppt=bool(ajuste_mppt[j]),
+            ajuste_corriente=bool(ajuste_corriente[j]),
+            n_inversores=_opt(n_inv, j, int),
+            dc_ac_ratio=_opt(ratio, j, float),
+            ajuste_dc_ac=_opt(ajuste_dc_ac, j, bool),
+        )
+        for j in sel
+    ]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""
+LÍMITES DE TENSIÓN POR TEMPERATURA — FV Engine
+==============================================
+
+Responsabilidad
+---------------
+
+Fuente única de la corrección térmica de Voc / Vmp y de los
+límites de longitud de string (n_min, n_max) para un par
+panel / inversor.
+
+    Voc frío  = Voc · (1 + coef_voc/100 · (T_min  − 25))
+    Vmp oper  = Vmp · (1 + coef_vmp/100 · (T_oper − 25))
+
+    n_min = ceil(mppt_min / Vmp oper)
+    n_max = floor(vdc_max / Voc frío)
+
+Los coeficientes SIEMPRE salen del PanelSpec (%/°C del catálogo).
+
+Las funciones aceptan escalares o arrays NumPy con broadcasting,
+así la matriz de compatibilidad del catálogo usa exactamente la
+misma aritmética que el cálculo de strings.
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    PanelSpec + InversorSpec + temperaturas de diseño
+
+Salida:
+    LimitesTension
+
+Consumido por:
+    electrical.paneles.calculo_de_strings
+    electrical.paneles.string_auto
+    electrical.paneles.compatibilidad
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from electrical.modelos.inversor import InversorSpec
+from electrical.modelos.paneles import PanelSpec
+
+
+T_REFERENCIA_C = 25.0
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class LimitesTension:
+
+    n_min: int
+    n_max: int
+
+    voc_frio_v: float
+    vmp_oper_v: float
+
+    @property
+    def rango_valido(self) -> bool:
+        return self.n_max >= self.n_min
+
+
+# ==========================================================
+# CORRECCIÓN TÉRMICA
+# ==========================================================
+
+def corregir_tension(v, coef_pct_c, t_c):
+    """
+    Tensión corregida por temperatura (escalar o array).
+    """
+
+    return v * (1 + coef_pct_c / 100 * (t_c - T_REFERENCIA_C))
+
+
+def voc_frio_v(panel: PanelSpec, t_min_c):
+    return corregir_tension(panel.voc_v, panel.coef_voc_pct_c, t_min_c)
+
+
+def vmp_temp_v(panel: PanelSpec, t_c):
+    return corregir_tension(panel.vmp_v, panel.coef_vmp_pct_c, t_c)
+
+
+# ==========================================================
+# LÍMITES DE STRING
+# ==========================================================
+
+def n_series_min(mppt_min_v, vmp_oper_v):
+    return np.maximum(1, np.ceil(mppt_min_v / vmp_oper_v)).astype(int)
+
+
+def n_series_max(vdc_max_v, voc_frio):
+    return np.maximum(1, np.floor(vdc_max_v / voc_frio)).astype(int)
+
+
+def calcular_limites_tension(
+    panel: PanelSpec,
+    inversor: InversorSpec,
+    t_min_c: float,
+    t_oper_c: float = 55.0,
+) -> LimitesTension:
+    """
+    Límites de longitud de string para un par panel / inversor.
+    """
+
+    voc = voc_frio_v(panel, t_min_c)
+    vmp = vmp_temp_v(panel, t_oper_c)
+
+    return LimitesTension(
+        n_min=int(n_series_min(inversor.mppt_min_v, vmp)),
+        n_max=int(n_series_max(inversor.vdc_max_v, voc)),
+        voc_frio_v=float(voc),
+        vmp_oper_v=float(vmp),
+    )
@@ -1,25 +1,24 @@
+from electrical.paneles.limites_tension import calcular_limites_tension, voc_frio_v
+
+
 # ==========================================================
 # HELPERS
 # ==========================================================
 
-def _calcular_voc_frio(voc, t_min_c, coef=0.003):
-    return voc * (1 + coef * (25 - t_min_c))
+def _calcular_voc_frio(panel, t_min_c):
+    return voc_frio_v(panel, t_min_c)
 
 
 def _limites_string(panel, inversor, t_min_c):
 
-    voc_frio = _calcular_voc_frio(panel.voc_v, t_min_c)
-
     # 🔥 VALIDACIÓN DOMINIO
     if not hasattr(inversor, "vdc_max_v"):
         raise ValueError("Inversor sin atributo vdc_max_v")
 
-    vmax = inversor.vdc_max_v
-
-    max_series = int(vmax / voc_frio)
-    min_series = max(1, int(inversor.mppt_min_v / panel.vmp_v))
+    # coeficientes del panel (antes 0.003 fijo)
+    lim = calcular_limites_tension(panel, inversor, t_min_c)
 
-    return min_series, max_series
+    return lim.n_min, lim.n_max
 
 
 def _evaluar_config(n_paneles_total, n_series):
@@ -77,7 +76,7 @@ def _validar_config(config, panel, inversor):
         warnings.append("Vmp fuera de rango MPPT")
 
     # 🔹 Voc frío límite
-    voc_frio = _calcular_voc_frio(panel.voc_v, 10)
+    voc_frio = _calcular_voc_frio(panel, 10)
     voc_string = n_series * voc_frio
 
     if voc_string > inversor.vdc_max_v:
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+"""
+CACHE LOCAL DE CLIMA — DOMINIO CLIMA (FV Engine)
+================================================
+
+Responsabilidad
+---------------
+
+Persistir en disco la respuesta horaria cruda de PVGIS para que
+estudios posteriores en el mismo sitio no repitan la descarga.
+
+Pipeline representado:
+
+    (lat, lon, años)
+        ↓
+    clave redondeada
+        ↓
+    archivo .json.gz en CACHE_DIR
+
+Frontera del módulo
+-------------------
+
+Entrada:
+    clave de sitio + lista "outputs.hourly" de PVGIS
+
+Salida:
+    lista "outputs.hourly" (o None si no existe en cache)
+
+Reglas arquitectónicas
+----------------------
+
+    ✔ Solo infraestructura (lectura/escritura de archivos)
+    ✔ Escritura atómica (tmp + replace) → segura entre procesos
+    ❌ No interpreta variables climáticas
+    ❌ No depende de requests ni de UI
+"""
+
+import gzip
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, List, Optional
+
+
+# ==========================================================
+# CONFIGURACIÓN
+# ==========================================================
+
+CACHE_DIR = Path("cache") / "clima"
+
+# 2 decimales ≈ 1 km → por debajo de la resolución de PVGIS
+DECIMALES_COORD = 2
+
+
+# ==========================================================
+# CLAVE DE SITIO
+# ==========================================================
+
+def redondear_coord(valor: float, decimales: int = DECIMALES_COORD) -> float:
+    """
+    Redondea una coordenada para deduplicar sitios equivalentes.
+    """
+
+    return round(float(valor), decimales) + 0.0
+
+
+def clave_clima(
+    lat: float,
+    lon: float,
+    startyear: int,
+    endyear: int,
+    decimales: int = DECIMALES_COORD,
+) -> str:
+    """
+    Clave estable de cache para un sitio y rango de años.
+    """
+
+    lat_r = redondear_coord(lat, decimales)
+    lon_r = redondear_coord(lon, decimales)
+
+    return f"{lat_r:.{decimales}f}_{lon_r:.{decimales}f}_{int(startyear)}_{int(endyear)}"
+
+
+def _ruta(clave: str, cache_dir: Optional[Path]) -> Path:
+    base = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    return base / f"pvgis_{clave}.json.gz"
+
+
+def ruta_bloqueo_clima(clave: str, cache_dir: Optional[Path] = None) -> Path:
+    """
+    Archivo de lock entre procesos para la descarga de `clave`.
+    """
+
+    base = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    return base / f"pvgis_{clave}.lock"
+
+
+# ==========================================================
+# LECTURA
+# ==========================================================
+
+def leer_cache_clima(
+    clave: str,
+    cache_dir: Optional[Path] = None,
+) -> Optional[List[dict]]:
+    """
+    Devuelve la lista horaria cacheada o None si no existe
+    (o si el archivo está corrupto).
+    """
+
+    path = _ruta(clave, cache_dir)
+
+    if not path.exists():
+        return None
+
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data: Any = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, list) or not data:
+        return None
+
+    return data
+
+
+def existe_cache_clima(clave: str, cache_dir: Optional[Path] = None) -> bool:
+    return _ruta(clave, cache_dir).exists()
+
+
+# ==========================================================
+# ESCRITURA
+# ==========================================================
+
+def guardar_cache_clima(
+    clave: str,
+    hourly: List[dict],
+    cache_dir: Optional[Path] = None,
+) -> Path:
+    """
+    Guarda la lista horaria de PVGIS de forma atómica.
+    """
+
+    path = _ruta(clave, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(hourly, f, separators=(",", ":"))
+
+    os.replace(tmp, path)
+
+    return path
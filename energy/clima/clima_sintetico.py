@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+"""
+GENERADOR DE CLIMA SINTÉTICO — DOMINIO CLIMA (FV Engine)
+========================================================
+
+Responsabilidad
+---------------
+
+Producir un ResultadoClima 8760 válido para cualquier sitio y año,
+sin red, para benchmarks, pruebas de carga y demostraciones offline.
+
+Pipeline representado:
+
+    (lat, lon, año, semilla)
+        ↓
+    posición solar (arrays) → GHI de cielo despejado (Haurwitz)
+        ↓
+    índice de cielo claro: nubosidad diaria AR(1) + ruido horario
+        ↓
+    GHI → DHI / DNI (correlación de Erbs sobre kt)
+        ↓
+    temperatura (ciclo anual + diario) y viento (Weibull + ciclo diario)
+        ↓
+    ResultadoClima (fuente = "sintetico")
+
+Reglas
+------
+
+    ✔ determinista: misma (lat, lon, año, semilla) → mismo clima
+    ✔ totalmente vectorizado (milisegundos)
+    ✔ timestamps UTC en HH:10, igual que PVGIS seriescalc
+    ✔ años bisiestos: se omite el 29 de febrero (8760 h)
+    ❌ no reproduce el clima real de un sitio: solo su forma física
+
+Frontera del módulo
+-------------------
+
+Entrada:
+    lat, lon, año, ParametrosClimaSintetico
+
+Salida:
+    ResultadoClima (mismo contrato que lector_pvgis)
+"""
+
+import zlib
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import numpy as np
+
+from energy.solar.cielo_despejado import ghi_haurwitz
+from energy.solar.modelo_perez import irradiancia_extraterrestre
+from energy.solar.posicion_solar import calcular_posicion_solar_arrays
+
+from .resultado_clima import ClimaHora, ResultadoClima
+
+
+ANIO_DEFECTO = 2019
+
+# por debajo de esta elevación toda la irradiancia se trata como difusa
+ELEVACION_MIN_DIRECTA_DEG = 3.0
+
+
+# ==========================================================
+# PARÁMETROS
+# ==========================================================
+
+@dataclass(frozen=True)
+class ParametrosClimaSintetico:
+    """
+    nubosidad:         fracción media de cielo cubierto (0–1)
+    persistencia:      correlación día a día de la nubosidad (AR(1))
+    ruido_horario:     desviación del índice de cielo claro hora a hora
+    temp_media_c:      None → según latitud
+    amplitud_anual_c:  None → según latitud
+    """
+
+    nubosidad: float = 0.35
+    persistencia: float = 0.6
+    ruido_horario: float = 0.08
+
+    temp_media_c: Optional[float] = None
+    amplitud_anual_c: Optional[float] = None
+    amplitud_diaria_c: float = 8.0
+
+    viento_medio_ms: float = 2.5
+
+
+def _validar(p: ParametrosClimaSintetico, lat: float, lon: float) -> None:
+
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("Coordenadas fuera de rango")
+
+    if not (0 <= p.nubosidad <= 1):
+        raise ValueError("nubosidad debe estar entre 0 y 1")
+
+    if not (0 <= p.persistencia < 1):
+        raise ValueError("persistencia debe estar en [0, 1)")
+
+    if p.ruido_horario < 0 or p.amplitud_diaria_c < 0 or p.viento_medio_ms < 0:
+        raise ValueError("ruido_horario, amplitud_diaria_c y viento_medio_ms deben ser ≥ 0")
+
+
+def semilla_sitio(lat: float, lon: float, anio: int) -> int:
+    """
+    Semilla estable entre procesos (hash() de Python no lo es).
+    """
+
+    return zlib.crc32(f"{lat:.2f}|{lon:.2f}|{int(anio)}".encode())
+
+
+# ==========================================================
+# CALENDARIO
+# ==========================================================
+
+def _calendario(anio: int):
+    """
+    (timestamps datetime64, día del año 1–365, hora UTC decimal).
+    """
+
+    inicio = np.datetime64(f"{int(anio)}-01-01T00:10")
+    fin = np.datetime64(f"{int(anio) + 1}-01-01T00:10")
+
+    ts = np.arange(inicio, fin, np.timedelta64(1, "h"))
+
+    md = ts.astype("datetime64[D]") - ts.astype("datetime64[M]")
+    mes = ts.astype("datetime64[M]").astype(int) % 12
+
+    ts = ts[~((mes == 1) & (md.astype(int) == 28))]
+
+    dia = np.repeat(np.arange(1, 366), 24)
+    hora = (ts - ts.astype("datetime64[D]")).astype("timedelta64[s]").astype(np.int64) / 3600.0
+
+    return ts, dia, hora
+
+
+# ==========================================================
+# COMPONENTES
+# ==========================================================
+
+def _indice_cielo_claro(rng: np.random.Generator, p: ParametrosClimaSintetico) -> np.ndarray:
+    """
+    kc horario: nubosidad diaria AR(1) (latente normal → logística)
+    más ruido horario suavizado.
+    """
+
+    e = rng.standard_normal(365)
+
+    z = np.empty(365)
+    z[0] = e[0]
+
+    a = p.persistencia
+    b = np.sqrt(1 - a * a)
+
+    for i in range(1, 365):
+        z[i] = a * z[i - 1] + b * e[i]
+
+    # centro de la logística ajustado para que la media ≈ 1 − nubosidad
+    centro = np.log(max(p.nubosidad, 1e-3) / max(1 - p.nubosidad, 1e-3))
+
+    cubierto = 1.0 / (1.0 + np.exp(-(1.6 * z + centro)))
+
+    kc_dia = 1.0 - 0.8 * cubierto
+
+    ruido = rng.standard_normal(8760)
+    ruido = np.convolve(ruido, np.ones(3) / np.sqrt(3), mode="same")
+
+    kc = np.repeat(kc_dia, 24) * (1.0 + p.ruido_horario * ruido)
+
+    return np.clip(kc, 0.05, 1.05), kc_dia
+
+
+def _fraccion_difusa_erbs(kt: np.ndarray) -> np.ndarray:
+
+    return np.select(
+        [kt <= 0.22, kt <= 0.80],
+        [
+            1.0 - 0.09 * kt,
+            0.9511 - 0.1604 * kt + 4.388 * kt**2 - 16.638 * kt**3 + 12.336 * kt**4,
+        ],
+        default=0.165,
+    )
+
+
+def _temperatura(
+    rng: np.random.Generator,
+    p: ParametrosClimaSintetico,
+    lat: float,
+    lon: float,
+    dia: np.ndarray,
+    hora_utc: np.ndarray,
+    kc_dia: np.ndarray,
+) -> np.ndarray:
+
+    t_media = p.temp_media_c if p.temp_media_c is not None else 30.0 - 0.3 * abs(lat)
+    a_anual = p.amplitud_anual_c if p.amplitud_anual_c is not None else min(15.0, 0.3 * abs(lat))
+
+    # máximo anual a fines de julio (norte) o de enero (sur)
+    dia_max = 200 if lat >= 0 else 17
+
+    anual = a_anual * np.cos(2 * np.pi * (dia - dia_max) / 365.0)
+
+    # máximo diario ≈ 15 h solar; los días despejados oscilan más
+    hora_solar = (hora_utc + lon / 15.0) % 24
+    amplitud = 0.5 * p.amplitud_diaria_c * (0.4 + 0.6 * np.repeat(kc_dia, 24))
+
+    diario = amplitud * np.cos(2 * np.pi * (hora_solar - 15.0) / 24.0)
+
+    ruido = np.convolve(rng.normal(0.0, 0.6, 8760), np.ones(6) / 6 ** 0.5, mode="same")
+
+    return t_media + anual + diario + ruido
+
+
+def _viento(rng: np.random.Generator, p: ParametrosClimaSintetico, lon: float, hora_utc: np.ndarray) -> np.ndarray:
+
+    # Weibull k = 2 → media = escala · Γ(1.5) ≈ 0.886 · escala
+    escala = p.viento_medio_ms / 0.8862
+
+    base = np.repeat(escala * rng.weibull(2.0, 365), 24)
+
+    hora_solar = (hora_utc + lon / 15.0) % 24
+    diario = 1.0 + 0.3 * np.cos(2 * np.pi * (hora_solar - 14.0) / 24.0)
+
+    return np.maximum(base * diario * rng.uniform(0.85, 1.15, 8760), 0.0)
+
+
+# ==========================================================
+# API
+# ==========================================================
+
+def series_clima_sintetico(
+    lat: float,
+    lon: float,
+    *,
+    anio: int = ANIO_DEFECTO,
+    semilla: Optional[int] = None,
+    parametros: Optional[ParametrosClimaSintetico] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Series 8760 como arrays: timestamp, ghi, dni, dhi, temp_amb_c, viento_ms.
+    """
+
+    p = parametros or ParametrosClimaSintetico()
+
+    _validar(p, lat, lon)
+
+    if semilla is None:
+        semilla = semilla_sitio(lat, lon, anio)
+
+    rng = np.random.default_rng(semilla)
+
+    ts, dia, hora = _calendario(anio)
+
+    pos = calcular_posicion_solar_arrays(lat, lon, dia, hora)
+
+    cos_z = np.cos(np.radians(pos.zenith_deg))
+
+    # ------------------------------------------------------
+    # IRRADIANCIA
+    # ------------------------------------------------------
+
+    kc, kc_dia = _indice_cielo_claro(rng, p)
+
+    ghi = ghi_haurwitz(pos.zenith_deg) * kc
+
+    extra_h = irradiancia_extraterrestre(dia) * np.maximum(cos_z, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kt = np.where(extra_h > 0, ghi / extra_h, 0.0)
+
+    fd = _fraccion_difusa_erbs(np.clip(kt, 0.0, 1.0))
+
+    directa = pos.elevation_deg > ELEVACION_MIN_DIRECTA_DEG
+
+    dhi = np.where(directa, ghi * fd, ghi)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dni = np.where(directa, (ghi - dhi) / cos_z, 0.0)
+
+    # ------------------------------------------------------
+    # AMBIENTE
+    # ------------------------------------------------------
+
+    temp = _temperatura(rng, p, lat, lon, dia, hora, kc_dia)
+    viento = _viento(rng, p, lon, hora)
+
+    return {
+        "timestamp": ts,
+        "ghi": ghi,
+        "dni": np.maximum(dni, 0.0),
+        "dhi": dhi,
+        "temp_amb_c": temp,
+        "viento_ms": viento,
+    }
+
+
+def generar_clima_sintetico(
+    lat: float,
+    lon: float,
+    *,
+    anio: int = ANIO_DEFECTO,
+    semilla: Optional[int] = None,
+    parametros: Optional[ParametrosClimaSintetico] = None,
+) -> ResultadoClima:
+    """
+    ResultadoClima 8760 sintético (mismo contrato que PVGIS).
+
+    semilla:
+        None → derivada de (lat, lon, año): el mismo sitio produce
+        siempre el mismo clima.
+    """
+
+    p = parametros or ParametrosClimaSintetico()
+
+    if semilla is None:
+        semilla = semilla_sitio(lat, lon, anio)
+
+    s = series_clima_sintetico(lat, lon, anio=anio, semilla=semilla, parametros=p)
+
+    t0 = datetime(int(anio), 1, 1, 0, 10)
+    minutos = (s["timestamp"] - np.datetime64(t0)).astype("timedelta64[m]").astype(np.int64)
+
+    horas = [
+        ClimaHora(
+            timestamp=t0 + timedelta(minutes=int(m)),
+            ghi_wm2=g,
+            dni_wm2=b,
+            dhi_wm2=d,
+            temp_amb_c=ta,
+            viento_ms=v,
+        )
+        for m, g, b, d, ta, v in zip(
+            minutos,
+            s["ghi"].tolist(),
+            s["dni"].tolist(),
+            s["dhi"].tolist(),
+            s["temp_amb_c"].tolist(),
+            s["viento_ms"].tolist(),
+        )
+    ]
+
+    return ResultadoClima(
+        latitud=float(lat),
+        longitud=float(lon),
+        horas=horas,
+        fuente="sintetico",
+        meta={
+            "anio": int(anio),
+            "semilla": int(semilla),
+            "n_horas": len(horas),
+            "parametros": asdict(p),
+        },
+    )
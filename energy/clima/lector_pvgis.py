@@ -12,6 +12,10 @@ al contrato interno del dominio clima (ResultadoClima).
 
 Pipeline representado:
 
+    vuelo único por sitio (hilos + lock de archivo entre procesos)
+        ↓
+    cache local (si existe)
+        ↓
     PVGIS API
         ↓
     parsing JSON
@@ -32,7 +36,8 @@ Salida:
     ResultadoClima
 
 Dependencias:
-    • requests (infraestructura)
+    • requests (infraestructura; importado solo al descargar)
+    • cache_clima (infraestructura)
     • resultado_clima (dominio)
 
 Reglas arquitectónicas
@@ -47,11 +52,15 @@ Reglas arquitectónicas
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Tuple, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Tuple, List, Optional
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 from .resultado_clima import ResultadoClima, ClimaHora
+from .cache_clima import clave_clima, leer_cache_clima, guardar_cache_clima, ruta_bloqueo_clima
+from .vuelo_unico import VueloUnico, bloqueo_archivo
 
 
 # ==========================================================
@@ -76,6 +85,9 @@ class EntradaClimaPVGIS:
 
 PVGIS_URL = "https://re.jrc.ec.europa.eu/api/seriescalc"
 
+# descargas en curso en este proceso (una por clave)
+_VUELOS = VueloUnico()
+
 
 # ==========================================================
 # MAPEO DE RADIACIÓN
@@ -119,28 +131,10 @@ def _mapear_radiacion(h: dict) -> Tuple[float, float, float]:
     return float(ghi), float(dni), float(dhi)
 
 # ==========================================================
-# FUNCIÓN PRINCIPAL
+# PARÁMETROS / REQUEST
 # ==========================================================
 
-def descargar_clima_pvgis(
-    entrada: EntradaClimaPVGIS
-) -> ResultadoClima:
-    """
-    Descarga y construye un ResultadoClima desde PVGIS.
-
-    Parámetros
-    ----------
-    entrada:
-        Coordenadas y rango temporal
-
-    Retorna
-    -------
-    ResultadoClima validado estructuralmente
-    """
-
-    # ------------------------------------------------------
-    # VALIDACIÓN DE ENTRADA
-    # ------------------------------------------------------
+def _validar_entrada(entrada: EntradaClimaPVGIS) -> None:
 
     if not (-90 <= entrada.lat <= 90):
         raise ValueError(f"Latitud inválida: {entrada.lat}")
@@ -148,11 +142,13 @@ def descargar_clima_pvgis(
     if not (-180 <= entrada.lon <= 180):
         raise ValueError(f"Longitud inválida: {entrada.lon}")
 
-    # ------------------------------------------------------
-    # PARAMETROS PVGIS
-    # ------------------------------------------------------
 
-    params = {
+def parametros_pvgis(entrada: EntradaClimaPVGIS) -> dict:
+    """
+    Parámetros de consulta seriescalc (horizontal, sin cálculo FV).
+    """
+
+    return {
         "lat": entrada.lat,
         "lon": entrada.lon,
         "outputformat": "json",
@@ -164,12 +160,27 @@ def descargar_clima_pvgis(
         "aspect": 0,
     }
 
-    # ------------------------------------------------------
-    # REQUEST
-    # ------------------------------------------------------
+
+def solicitar_hourly_pvgis(
+    params: dict,
+    *,
+    session: Optional[requests.Session] = None,
+    url: str = PVGIS_URL,
+    timeout_s: float = 60,
+) -> List[dict]:
+    """
+    Ejecuta la consulta HTTP y devuelve la lista "outputs.hourly".
+
+    Si se entrega una sesión se reutiliza su pool de conexiones
+    (y su política de reintentos).
+    """
+
+    import requests
+
+    cliente = session if session is not None else requests
 
     try:
-        r = requests.get(PVGIS_URL, params=params, timeout=60)
+        r = cliente.get(url, params=params, timeout=timeout_s)
 
         if r.status_code != 200:
             raise RuntimeError(f"Error PVGIS: {r.status_code} - {r.text}")
@@ -179,10 +190,6 @@ def descargar_clima_pvgis(
 
     data = r.json()
 
-    # ------------------------------------------------------
-    # VALIDACIÓN RESPUESTA
-    # ------------------------------------------------------
-
     if "outputs" not in data or "hourly" not in data["outputs"]:
         raise RuntimeError("Formato de respuesta PVGIS inválido")
 
@@ -191,9 +198,20 @@ def descargar_clima_pvgis(
     if not hourly:
         raise RuntimeError("PVGIS devolvió lista vacía")
 
-    # ------------------------------------------------------
-    # CONSTRUCCIÓN DEL CLIMA
-    # ------------------------------------------------------
+    return hourly
+
+
+# ==========================================================
+# CONSTRUCCIÓN DEL CLIMA
+# ==========================================================
+
+def construir_clima_pvgis(
+    hourly: List[dict],
+    entrada: EntradaClimaPVGIS,
+) -> ResultadoClima:
+    """
+    Convierte la lista horaria cruda de PVGIS en ResultadoClima.
+    """
 
     horas: List[ClimaHora] = []
 
@@ -236,10 +254,6 @@ def descargar_clima_pvgis(
     if ghi_total <= 0:
         raise RuntimeError("Clima inválido: GHI total = 0")
 
-    # ------------------------------------------------------
-    # SALIDA
-    # ------------------------------------------------------
-
     return ResultadoClima(
         latitud=entrada.lat,
         longitud=entrada.lon,
@@ -252,6 +266,122 @@ def descargar_clima_pvgis(
         }
     )
 
+
+# ==========================================================
+# FUNCIÓN PRINCIPAL
+# ==========================================================
+
+def _descargar(
+    entrada: EntradaClimaPVGIS,
+    clave: str,
+    *,
+    session: Optional[requests.Session],
+    url: str,
+    usar_cache: bool,
+    cache_dir: Optional[Path],
+) -> ResultadoClima:
+
+    # ------------------------------------------------------
+    # CACHE LOCAL
+    # ------------------------------------------------------
+
+    hourly = leer_cache_clima(clave, cache_dir) if usar_cache else None
+
+    if hourly is not None:
+        clima = construir_clima_pvgis(hourly, entrada)
+        clima.meta["cache"] = True
+        return clima
+
+    if not usar_cache:
+        hourly = solicitar_hourly_pvgis(parametros_pvgis(entrada), session=session, url=url)
+
+        clima = construir_clima_pvgis(hourly, entrada)
+        clima.meta["cache"] = False
+        return clima
+
+    # ------------------------------------------------------
+    # REQUEST (un proceso por sitio; el resto espera el cache)
+    # ------------------------------------------------------
+
+    with bloqueo_archivo(ruta_bloqueo_clima(clave, cache_dir)):
+
+        hourly = leer_cache_clima(clave, cache_dir)
+
+        if hourly is not None:
+            clima = construir_clima_pvgis(hourly, entrada)
+            clima.meta["cache"] = True
+            return clima
+
+        hourly = solicitar_hourly_pvgis(
+            parametros_pvgis(entrada),
+            session=session,
+            url=url,
+        )
+
+        clima = construir_clima_pvgis(hourly, entrada)
+
+        guardar_cache_clima(clave, hourly, cache_dir)
+
+    clima.meta["cache"] = False
+
+    return clima
+
+
+def descargar_clima_pvgis(
+    entrada: EntradaClimaPVGIS,
+    *,
+    session: Optional[requests.Session] = None,
+    url: str = PVGIS_URL,
+    usar_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+) -> ResultadoClima:
+    """
+    Descarga y construye un ResultadoClima desde PVGIS.
+
+    Parámetros
+    ----------
+    entrada:
+        Coordenadas y rango temporal
+
+    session:
+        Sesión HTTP reutilizable (pool + reintentos). Opcional.
+
+    url:
+        Endpoint seriescalc (configurable para servidores locales).
+
+    usar_cache:
+        Si True, consulta/llena el cache local de clima.
+
+    Concurrencia
+    ------------
+    Las llamadas simultáneas para la misma clave (lat, lon y años
+    redondeados) comparten una sola descarga: entre hilos reciben
+    el mismo ResultadoClima; entre procesos, un lock de archivo
+    hace que solo uno descargue y los demás lean su cache.
+
+    Retorna
+    -------
+    ResultadoClima validado estructuralmente
+    """
+
+    _validar_entrada(entrada)
+
+    clave = clave_clima(entrada.lat, entrada.lon, entrada.startyear, entrada.endyear)
+
+    vuelo = (clave, str(ruta_bloqueo_clima(clave, cache_dir)), url, usar_cache)
+
+    return _VUELOS.ejecutar(
+        vuelo,
+        lambda: _descargar(
+            entrada,
+            clave,
+            session=session,
+            url=url,
+            usar_cache=usar_cache,
+            cache_dir=cache_dir,
+        ),
+    )
+
 """
 ResultadoClima
     ├─ latitud
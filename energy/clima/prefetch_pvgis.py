@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+"""
+PREFETCH DE CLIMA PVGIS — DOMINIO CLIMA (FV Engine)
+===================================================
+
+Responsabilidad
+---------------
+
+Descargar por adelantado el clima de muchos sitios (portafolio)
+y dejarlo en el cache local, de forma concurrente y tolerante
+a fallos transitorios de red.
+
+Pipeline representado:
+
+    lista de coordenadas
+        ↓
+    redondeo + deduplicación
+        ↓
+    filtro de sitios ya cacheados
+        ↓
+    descarga concurrente (sesión compartida con pool + reintentos)
+        ↓
+    validación (construir_clima_pvgis)
+        ↓
+    cache_clima
+
+Frontera del módulo
+-------------------
+
+Entrada:
+    Iterable[(lat, lon)]
+
+Salida:
+    ResultadoPrefetch
+
+Reglas arquitectónicas
+----------------------
+
+    ✔ Infraestructura de clima (red + cache)
+    ✔ URL configurable → se puede probar contra un servidor local
+    ❌ No contiene lógica solar ni energética
+    ❌ No depende de UI (streamlit)
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache_clima import (
+    DECIMALES_COORD,
+    clave_clima,
+    existe_cache_clima,
+    guardar_cache_clima,
+    redondear_coord,
+    ruta_bloqueo_clima,
+)
+from .lector_pvgis import (
+    PVGIS_URL,
+    EntradaClimaPVGIS,
+    construir_clima_pvgis,
+    parametros_pvgis,
+    solicitar_hourly_pvgis,
+)
+from .vuelo_unico import bloqueo_archivo
+
+
+# ==========================================================
+# RESULTADO
+# ==========================================================
+
+@dataclass(frozen=True)
+class ResultadoPrefetch:
+    """
+    Resumen del prefetch (claves de cache por estado).
+    """
+
+    descargados: List[str] = field(default_factory=list)
+    en_cache: List[str] = field(default_factory=list)
+    errores: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errores
+
+
+# ==========================================================
+# SESIÓN HTTP
+# ==========================================================
+
+def crear_sesion_pvgis(
+    *,
+    pool: int = 8,
+    reintentos: int = 3,
+    backoff_s: float = 0.5,
+) -> requests.Session:
+    """
+    Sesión con pool de conexiones y reintentos con backoff exponencial.
+
+    Reintenta errores de conexión y respuestas 429/5xx.
+    """
+
+    retry = Retry(
+        total=reintentos,
+        connect=reintentos,
+        read=reintentos,
+        status=reintentos,
+        backoff_factor=backoff_s,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+    adapter = HTTPAdapter(
+        pool_connections=pool,
+        pool_maxsize=pool,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+# ==========================================================
+# DEDUPLICACIÓN
+# ==========================================================
+
+def _sitios_unicos(
+    coordenadas: Iterable[Tuple[float, float]],
+    decimales: int,
+) -> List[Tuple[float, float]]:
+
+    vistos = set()
+    out: List[Tuple[float, float]] = []
+
+    for lat, lon in coordenadas:
+
+        sitio = (redondear_coord(lat, decimales), redondear_coord(lon, decimales))
+
+        if sitio in vistos:
+            continue
+
+        vistos.add(sitio)
+        out.append(sitio)
+
+    return out
+
+
+# ==========================================================
+# DESCARGA UNITARIA
+# ==========================================================
+
+def _descargar_sitio(
+    entrada: EntradaClimaPVGIS,
+    clave: str,
+    *,
+    session: requests.Session,
+    url: str,
+    timeout_s: float,
+    cache_dir: Optional[Path],
+) -> str:
+
+    # otro proceso (estudio o prefetch) puede estar bajando el mismo sitio
+    with bloqueo_archivo(ruta_bloqueo_clima(clave, cache_dir)):
+
+        if existe_cache_clima(clave, cache_dir):
+            return clave
+
+        hourly = solicitar_hourly_pvgis(
+            parametros_pvgis(entrada),
+            session=session,
+            url=url,
+            timeout_s=timeout_s,
+        )
+
+        # valida antes de cachear (no se guardan respuestas corruptas)
+        construir_clima_pvgis(hourly, entrada)
+
+        guardar_cache_clima(clave, hourly, cache_dir)
+
+    return clave
+
+
+# ==========================================================
+# API PRINCIPAL
+# ==========================================================
+
+def prefetch_clima_pvgis(
+    coordenadas: Iterable[Tuple[float, float]],
+    *,
+    startyear: int = 2019,
+    endyear: int = 2019,
+    max_concurrencia: int = 4,
+    reintentos: int = 3,
+    backoff_s: float = 0.5,
+    timeout_s: float = 60,
+    url: str = PVGIS_URL,
+    cache_dir: Optional[Path] = None,
+    decimales: int = DECIMALES_COORD,
+    session: Optional[requests.Session] = None,
+) -> ResultadoPrefetch:
+    """
+    Llena el cache local de clima para todos los sitios indicados.
+
+    Parámetros
+    ----------
+    coordenadas:
+        Pares (lat, lon). Se redondean y deduplican.
+
+    max_concurrencia:
+        Número máximo de descargas simultáneas (acotado para
+        respetar el límite de peticiones de PVGIS).
+
+    url:
+        Endpoint seriescalc. Permite usar un servidor local
+        con respuestas grabadas.
+
+    Retorna
+    -------
+    ResultadoPrefetch con claves descargadas, ya cacheadas y errores.
+    """
+
+    if max_concurrencia <= 0:
+        raise ValueError("max_concurrencia debe ser >= 1")
+
+    sitios = _sitios_unicos(coordenadas, decimales)
+
+    en_cache: List[str] = []
+    pendientes: List[Tuple[EntradaClimaPVGIS, str]] = []
+
+    for lat, lon in sitios:
+
+        entrada = EntradaClimaPVGIS(
+            lat=lat,
+            lon=lon,
+            startyear=startyear,
+            endyear=endyear,
+        )
+
+        clave = clave_clima(lat, lon, startyear, endyear, decimales)
+
+        if existe_cache_clima(clave, cache_dir):
+            en_cache.append(clave)
+        else:
+            pendientes.append((entrada, clave))
+
+    if not pendientes:
+        return ResultadoPrefetch(descargados=[], en_cache=en_cache, errores={})
+
+    propia = session is None
+
+    if propia:
+        session = crear_sesion_pvgis(
+            pool=max_concurrencia,
+            reintentos=reintentos,
+            backoff_s=backoff_s,
+        )
+
+    descargados: List[str] = []
+    errores: Dict[str, str] = {}
+
+    try:
+
+        with ThreadPoolExecutor(max_workers=max_concurrencia) as pool:
+
+            futuros = {
+                pool.submit(
+                    _descargar_sitio,
+                    entrada,
+                    clave,
+                    session=session,
+                    url=url,
+                    timeout_s=timeout_s,
+                    cache_dir=cache_dir,
+                ): clave
+                for entrada, clave in pendientes
+            }
+
+            for fut in as_completed(futuros):
+
+                clave = futuros[fut]
+
+                try:
+                    descargados.append(fut.result())
+                except Exception as e:
+                    errores[clave] = str(e)
+
+    finally:
+        if propia:
+            session.close()
+
+    return ResultadoPrefetch(
+        descargados=sorted(descargados),
+        en_cache=en_cache,
+        errores=errores,
+    )
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 # ----------------------------------------------------------
 # DEPENDENCIAS
 # ----------------------------------------------------------
 
 from energy.solar.posicion_solar import (
-    calcular_posicion_solar,
-    SolarInput,
+    SolarPositionArrays,
+    calcular_posicion_solar_arrays,
+    calendario_desde_timestamps,
 )
 
 from energy.solar.irradiancia_plano import (
-    calcular_irradiancia_plano,
-    IrradianciaInput
+    calcular_irradiancia_plano_arrays,
+    MODELO_ISOTROPICO,
 )
 
+from energy.solar.sombreado import MascaraSombreado
+
 from .resultado_clima import ResultadoClima, validar_clima_8760
 
 
@@ -33,6 +38,105 @@ class EstadoSolarHora:
     zenith: float
     azimuth: float
 
+    viento_ms: float = 1.0
+
+
+# ==========================================================
+# GEOMETRÍA COMPARTIDA (INDEPENDIENTE DE LA ORIENTACIÓN)
+# ==========================================================
+
+@dataclass(frozen=True)
+class GeometriaSolar8760:
+    """
+    Series de clima + posición solar (+ sombreado) de un sitio.
+
+    No depende de la inclinación/azimut del plano: se calcula una
+    vez y se reutiliza para todas las zonas de un proyecto.
+    """
+
+    dia_del_anio: np.ndarray
+    ghi: np.ndarray
+    dni: np.ndarray
+    dhi: np.ndarray
+    temp_amb_c: np.ndarray
+
+    posicion: SolarPositionArrays
+
+    fraccion_sombra: Optional[np.ndarray] = None
+
+    viento_ms: Optional[np.ndarray] = None
+
+
+def preparar_geometria_8760(
+    clima: ResultadoClima,
+    *,
+    mascara: Optional[MascaraSombreado] = None,
+) -> GeometriaSolar8760:
+
+    validar_clima_8760(clima)
+
+    n = len(clima.horas)
+
+    timestamps = [h.timestamp for h in clima.horas]
+
+    ghi = np.fromiter((h.ghi_wm2 for h in clima.horas), float, n)
+    dni = np.fromiter((h.dni_wm2 for h in clima.horas), float, n)
+    dhi = np.fromiter((h.dhi_wm2 for h in clima.horas), float, n)
+    temp = np.fromiter((h.temp_amb_c for h in clima.horas), float, n)
+    viento = np.fromiter((h.viento_ms for h in clima.horas), float, n)
+
+    dia, hora = calendario_desde_timestamps(timestamps)
+
+    pos = calcular_posicion_solar_arrays(
+        clima.latitud,
+        clima.longitud,
+        dia,
+        hora,
+    )
+
+    sombra = None
+
+    if mascara is not None:
+        sombra = mascara.fraccion_sombra(pos.azimuth_deg, pos.elevation_deg)
+
+    return GeometriaSolar8760(
+        dia_del_anio=dia,
+        ghi=ghi,
+        dni=dni,
+        dhi=dhi,
+        temp_amb_c=temp,
+        posicion=pos,
+        fraccion_sombra=sombra,
+        viento_ms=viento,
+    )
+
+
+def calcular_poa_8760(
+    geo: GeometriaSolar8760,
+    tilt: float,
+    azimuth: float,
+    *,
+    modelo_cielo: str = MODELO_ISOTROPICO,
+) -> np.ndarray:
+    """
+    POA (W/m²) de un plano a partir de la geometría compartida.
+    """
+
+    irr = calcular_irradiancia_plano_arrays(
+        geo.dni,
+        geo.dhi,
+        geo.ghi,
+        geo.posicion.zenith_deg,
+        geo.posicion.azimuth_deg,
+        tilt,
+        azimuth,
+        modelo=modelo_cielo,
+        dia_del_anio=geo.dia_del_anio,
+        fraccion_sombra_directa=geo.fraccion_sombra,
+    )
+
+    return irr.poa_total
+
 
 # ==========================================================
 # RESULTADO
@@ -44,6 +148,19 @@ class ResultadoClima8760:
     horas: List[EstadoSolarHora]
     poa_total_kwh_m2: float
 
+    # ------------------------------------------------------
+    # SERIES (mismo orden que horas) para motores vectorizados
+    # ------------------------------------------------------
+
+    poa_wm2: Optional[np.ndarray] = None
+    temp_amb_c: Optional[np.ndarray] = None
+    viento_ms: Optional[np.ndarray] = None
+
+    modelo_cielo: str = MODELO_ISOTROPICO
+
+    # geometría del sitio, reutilizable para otras orientaciones
+    geometria: Optional[GeometriaSolar8760] = None
+
 
 # ==========================================================
 # ORQUESTADOR
@@ -52,66 +169,57 @@ class ResultadoClima8760:
 def simular_clima_8760(
     clima: ResultadoClima,
     tilt: float,
-    azimuth: float
+    azimuth: float,
+    *,
+    modelo_cielo: str = MODELO_ISOTROPICO,
+    mascara: Optional[MascaraSombreado] = None,
+    geometria: Optional[GeometriaSolar8760] = None,
 ) -> ResultadoClima8760:
+    """
+    Posición solar + POA de las 8760 horas en una pasada vectorizada.
 
-    validar_clima_8760(clima)
+    modelo_cielo:
+        "isotropico" (por defecto) o "perez".
 
-    horas: List[EstadoSolarHora] = []
-    poa_total_kwh_m2 = 0.0
+    mascara:
+        máscara de sombreado del sitio (opcional); se consulta con la
+        posición solar y atenúa la directa y la circunsolar.
 
-    for hora in clima.horas:
+    geometria:
+        geometría ya calculada del mismo sitio (evita recalcularla).
+    """
 
-        # --------------------------------------------------
-        # 1. POSICIÓN SOLAR
-        # --------------------------------------------------
+    geo = geometria or preparar_geometria_8760(clima, mascara=mascara)
 
-        pos = calcular_posicion_solar(
-            SolarInput(
-                latitud_deg=clima.latitud,
-                longitud_deg=clima.longitud,
-                fecha_hora=hora.timestamp
-            )
-        )
+    poa = calcular_poa_8760(geo, tilt, azimuth, modelo_cielo=modelo_cielo)
 
-        # --------------------------------------------------
-        # 2. POA
-        # --------------------------------------------------
-
-        irr = calcular_irradiancia_plano(
-            IrradianciaInput(
-                dni=hora.dni_wm2,
-                dhi=hora.dhi_wm2,
-                ghi=hora.ghi_wm2,
-                solar_zenith_deg=pos.zenith_deg,
-                solar_azimuth_deg=pos.azimuth_deg,
-                panel_tilt_deg=tilt,
-                panel_azimuth_deg=azimuth
-            )
-        )
-
-        poa = max(0.0, irr.poa_total)
-
-        # --------------------------------------------------
-        # 3. ACUMULACIÓN ENERGÍA
-        # --------------------------------------------------
+    pos = geo.posicion
 
-        poa_total_kwh_m2 += poa / 1000.0
+    viento = geo.viento_ms if geo.viento_ms is not None else np.ones_like(poa)
 
-        # --------------------------------------------------
-        # 4. ESTADO
-        # --------------------------------------------------
-
-        horas.append(
-            EstadoSolarHora(
-                poa_wm2=poa,
-                temp_amb_c=hora.temp_amb_c,
-                zenith=pos.zenith_deg,
-                azimuth=pos.azimuth_deg
-            )
+    horas = [
+        EstadoSolarHora(
+            poa_wm2=p,
+            temp_amb_c=t,
+            zenith=z,
+            azimuth=a,
+            viento_ms=v,
+        )
+        for p, t, z, a, v in zip(
+            poa.tolist(),
+            geo.temp_amb_c.tolist(),
+            pos.zenith_deg.tolist(),
+            pos.azimuth_deg.tolist(),
+            viento.tolist(),
         )
+    ]
 
     return ResultadoClima8760(
         horas=horas,
-        poa_total_kwh_m2=poa_total_kwh_m2
+        poa_total_kwh_m2=float(poa.sum()) / 1000.0,
+        poa_wm2=poa,
+        temp_amb_c=geo.temp_amb_c,
+        viento_ms=geo.viento_ms,
+        modelo_cielo=modelo_cielo,
+        geometria=geo,
     )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+"""
+VUELO ÚNICO (SINGLE-FLIGHT) — DOMINIO CLIMA (FV Engine)
+=======================================================
+
+Responsabilidad
+---------------
+
+Coalescer peticiones concurrentes de la misma clave para que solo
+una ejecute la operación costosa (descarga PVGIS) y las demás
+reciban el mismo resultado.
+
+Dos niveles:
+
+    hilos (mismo proceso)
+        VueloUnico.ejecutar: el primer hilo ejecuta, el resto espera
+        el mismo objeto (o la misma excepción)
+
+    procesos (mismo disco)
+        bloqueo_archivo: lock exclusivo sobre un archivo .lock; el
+        proceso que entra segundo encuentra el cache ya escrito
+
+Reglas
+------
+
+    ✔ los errores no se recuerdan: la siguiente petición reintenta
+    ✔ el lock de archivo tiene timeout: si vence, se continúa sin él
+      (peor caso = descarga duplicada, nunca un bloqueo permanente)
+    ❌ no conoce PVGIS ni el formato del cache
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+TIMEOUT_BLOQUEO_S = 120.0
+
+INTERVALO_SONDEO_S = 0.05
+
+
+# ==========================================================
+# HILOS
+# ==========================================================
+
+class _Vuelo:
+
+    def __init__(self) -> None:
+        self.terminado = threading.Event()
+        self.resultado: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class VueloUnico:
+    """
+    Una ejecución en curso por clave; las llamadas concurrentes con
+    la misma clave esperan y comparten su resultado.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._vuelos: Dict[Hashable, _Vuelo] = {}
+
+    def ejecutar(self, clave: Hashable, fn: Callable[[], Any]) -> Any:
+
+        with self._lock:
+
+            vuelo = self._vuelos.get(clave)
+            lider = vuelo is None
+
+            if lider:
+                vuelo = self._vuelos[clave] = _Vuelo()
+
+        if not lider:
+
+            vuelo.terminado.wait()
+
+            if vuelo.error is not None:
+                raise vuelo.error
+
+            return vuelo.resultado
+
+        try:
+            vuelo.resultado = fn()
+            return vuelo.resultado
+
+        except BaseException as e:
+            vuelo.error = e
+            raise
+
+        finally:
+            with self._lock:
+                del self._vuelos[clave]
+
+            vuelo.terminado.set()
+
+    def en_vuelo(self) -> int:
+
+        with self._lock:
+            return len(self._vuelos)
+
+
+# ==========================================================
+# PROCESOS
+# ==========================================================
+
+def _intentar_bloqueo(fd: int) -> bool:
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+
+    except OSError:
+        return False
+
+
+def _liberar(fd: int) -> None:
+
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def bloqueo_archivo(path: Path, timeout_s: float = TIMEOUT_BLOQUEO_S) -> Iterator[bool]:
+    """
+    Lock exclusivo entre procesos sobre `path` (se crea si no existe).
+
+    Devuelve True si se obtuvo el lock; False si venció el timeout
+    (el bloque se ejecuta igualmente).
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        limite = time.monotonic() + timeout_s
+
+        obtenido = _intentar_bloqueo(fd)
+
+        while not obtenido and time.monotonic() < limite:
+            time.sleep(INTERVALO_SONDEO_S)
+            obtenido = _intentar_bloqueo(fd)
+
+        try:
+            yield obtenido
+        finally:
+            if obtenido:
+                _liberar(fd)
+
+    finally:
+        os.close(fd)
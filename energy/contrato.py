@@ -1,5 +1,33 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from energy.sistema.perfil_perdidas import PerfilPerdida, error_perfil
+
+
+# ======================================================
+# ZONA (MULTIZONA / GRUPO MPPT)
+# ======================================================
+
+@dataclass(frozen=True)
+class ZonaEnergia:
+    """
+    Parte del generador con orientación y strings propios.
+
+    poa_wm2: serie 8760 ya transpuesta a la orientación de la zona.
+    """
+
+    nombre: str
+    n_series: int
+    n_strings: int
+
+    tilt_deg: float
+    azimut_deg: float
+
+    poa_wm2: Any
+
+    @property
+    def n_paneles(self) -> int:
+        return self.n_series * self.n_strings
 
 
 # ======================================================
@@ -20,11 +48,21 @@ class EnergiaInput:
     tilt_deg: float
     azimut_deg: float
 
-    # 🔥 CAMBIO AQUÍ
-    perdidas_dc_frac: float
-    sombras_frac: float
+    # escalar, 12 valores mensuales o serie horaria (perfil_perdidas)
+    perdidas_dc_frac: PerfilPerdida
+    sombras_frac: PerfilPerdida
     eficiencia_inversor: float
-    perdidas_ac_frac: float
+    perdidas_ac_frac: PerfilPerdida
+
+    # 1 = horario; 4 = 15 min; 12 = 5 min (clipping sub-horario)
+    pasos_por_hora: int = 1
+
+    # "noct" | "faiman" | "pvsyst" | "sapm" (energy/panel_energia/modelo_termico)
+    modelo_termico: str = "noct"
+
+    # multizona: cada zona con su POA; la DC se suma antes del inversor.
+    # Si está vacío se usa n_series / n_strings con la POA de clima.
+    zonas: Optional[List[ZonaEnergia]] = None
 
     def validar(self):
         errores = []
@@ -68,17 +106,34 @@ class EnergiaInput:
         # -----------------------------------------
         # 🔥 VALIDACIÓN DE FRACCIONES
         # -----------------------------------------
+        n_horas = len(self.clima.horas) if getattr(self.clima, "horas", None) else None
+
         for nombre, valor in [
             ("perdidas_dc_frac", self.perdidas_dc_frac),
             ("sombras_frac", self.sombras_frac),
             ("perdidas_ac_frac", self.perdidas_ac_frac),
         ]:
-            if not (0 <= valor <= 1):
-                errores.append(f"{nombre} debe estar entre 0 y 1")
+            error = error_perfil(valor, nombre, n_horas)
+
+            if error:
+                errores.append(error)
 
         if not (0 < self.eficiencia_inversor <= 1):
             errores.append("eficiencia_inversor inválida (0–1)")
 
+        if self.pasos_por_hora not in (1, 2, 4, 6, 12):
+            errores.append("pasos_por_hora inválido (1, 2, 4, 6 o 12)")
+
+        if self.modelo_termico not in ("noct", "faiman", "pvsyst", "sapm"):
+            errores.append(f"modelo_termico inválido: {self.modelo_termico}")
+
+        for z in self.zonas or []:
+            if z.n_series <= 0 or z.n_strings <= 0:
+                errores.append(f"Zona {z.nombre}: configuración de strings inválida")
+
+            if z.poa_wm2 is None or len(z.poa_wm2) != len(self.clima.horas):
+                errores.append(f"Zona {z.nombre}: serie POA inválida")
+
         return errores
 
 
@@ -1,31 +1,23 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, List, Optional
 
-from energy.contrato import EnergiaInput
+from energy.contrato import EnergiaInput, ZonaEnergia
 from energy.resultado_energia import EnergiaResultado
 from energy.sistema.agregacion_8760 import agregar_energia_por_mes
 
-# MODELOS
-from energy.panel_energia.modelo_termico import (
-    calcular_temperatura_celda, ModeloTermicoInput
-)
-from energy.panel_energia.potencia_panel import (
-    calcular_potencia_panel, PotenciaPanelInput
-)
-from energy.panel_energia.potencia_string import (
-    calcular_potencia_string, PotenciaStringInput
-)
-from energy.panel_energia.potencia_arreglo import (
-    calcular_potencia_arreglo, PotenciaArregloInput
-)
+import numpy as np
 
 from energy.solar.orquestador_solar import ejecutar_solar
 from energy.solar.entrada_solar import EntradaSolar
 
-from energy.sistema.modelo_energetico_inversor import calcular_inversor, InversorInput
-from energy.sistema.perdidas_fisicas import aplicar_perdidas_fisicas, PerdidasInput
-from energy.sistema.perdidas_ac import aplicar_perdidas_ac, PerdidasACInput
+from energy.sistema.motor_vectorizado import (
+    GrupoDC,
+    ParametrosCadena,
+    SeriesEnergia,
+    simular_horario_grupos,
+    simular_subhorario_grupos,
+)
 
 
 # ==========================================================
@@ -82,95 +74,116 @@ def _calcular_poa(h, inp):
 
     return max(0.0, solar.poa_total_wm2)
 
-def _calcular_temperatura(poa, h, inp):
-    return calcular_temperatura_celda(
-        ModeloTermicoInput(
-            irradiancia_poa_wm2=poa,
-            temperatura_ambiente_c=h.temp_amb_c,
-            noct_c=inp.panel.noct_c
-        )
-    ).temperatura_celda_c
-
-
-def _calcular_panel(poa, t_cell, inp):
-    return calcular_potencia_panel(
-        PotenciaPanelInput(
-            irradiancia_poa_wm2=poa,
-            temperatura_celda_c=t_cell,
-            p_panel_w=inp.panel.pmax_w,
-            vmp_panel_v=inp.panel.vmp_v,
-            voc_panel_v=inp.panel.voc_v,
-            imp_panel_a=inp.panel.imp_a,
-            isc_panel_a=inp.panel.isc_a,
-            coef_potencia=inp.panel.coef_potencia_pct_c / 100,
-            coef_vmp=inp.panel.coef_vmp_pct_c / 100,
-            coef_voc=inp.panel.coef_voc_pct_c / 100,
-        )
-    )
+def _series_clima(inp):
+    """
+    POA, temperatura ambiente y viento como arrays (8760).
 
+    Usa las series ya calculadas por simulacion_8760 si existen.
+    """
 
-def _calcular_string(panel, inp):
-    return calcular_potencia_string(
-        PotenciaStringInput(
-            n_series=inp.n_series,
-            p_panel_w=panel.pmp_w,
-            vmp_panel_v=panel.vmp_v,
-            voc_panel_v=panel.voc_v,
-            imp_panel_a=panel.imp_a,
-            isc_panel_a=panel.isc_a,
-        )
+    clima = inp.clima
+    horas = clima.horas
+
+    poa = getattr(clima, "poa_wm2", None)
+    temp = getattr(clima, "temp_amb_c", None)
+    viento = getattr(clima, "viento_ms", None)
+
+    if poa is None:
+        poa = np.fromiter((_calcular_poa(h, inp) for h in horas), float, len(horas))
+
+    if temp is None:
+        temp = np.fromiter((h.temp_amb_c for h in horas), float, len(horas))
+
+    # el viento solo lo usan los modelos térmicos Faiman / PVsyst / SAPM
+    if viento is None and inp.modelo_termico != "noct":
+        viento = np.fromiter((getattr(h, "viento_ms", 1.0) for h in horas), float, len(horas))
+
+    return (
+        np.maximum(np.asarray(poa, dtype=float), 0.0),
+        np.asarray(temp, dtype=float),
+        viento,
     )
 
 
-def _calcular_array(string, inp):
-    return calcular_potencia_arreglo(
-        PotenciaArregloInput(
-            n_strings_total=inp.n_strings,
-            vmp_string_v=string.vmp_string_v,
-            voc_string_v=string.voc_string_v,
-            imp_string_a=string.imp_string_a,
-            isc_string_a=string.isc_string_a,
-            potencia_string_w=string.potencia_string_w,
-        )
+def _parametros_cadena(inp) -> ParametrosCadena:
+    return ParametrosCadena(
+        pac_nominal_kw=inp.pac_nominal_kw,
+        perdidas_dc_frac=inp.perdidas_dc_frac,
+        sombras_frac=inp.sombras_frac,
+        eficiencia_inversor=inp.eficiencia_inversor,
+        perdidas_ac_frac=inp.perdidas_ac_frac,
     )
 
 
-def _aplicar_perdidas_dc(dc_bruta, inp):
-    return aplicar_perdidas_fisicas(
-        PerdidasInput(
-            potencia_kw=dc_bruta,
-            perdidas_dc_frac=inp.perdidas_dc_frac,
-            sombras_frac=inp.sombras_frac,
-        )
-    ).potencia_kw
+def _grupos_dc(poa, inp) -> List[GrupoDC]:
+    """
+    Un grupo por zona (multizona) o un único generador.
+    """
 
+    if inp.zonas:
+        return [
+            GrupoDC(poa_wm2=z.poa_wm2, n_series=z.n_series, n_strings=z.n_strings)
+            for z in inp.zonas
+        ]
 
-def _pasar_inversor(dc_neta, inp):
-    return calcular_inversor(
-        InversorInput(
-            potencia_dc_kw=dc_neta,
-            p_ac_nominal_kw=inp.pac_nominal_kw,
-            eficiencia_nominal=inp.eficiencia_inversor,
-        )
-    )
+    return [GrupoDC(poa_wm2=poa, n_series=inp.n_series, n_strings=inp.n_strings)]
 
 
-def _calcular_ac(inv, inp):
-    ac_sin = aplicar_perdidas_ac(
-        PerdidasACInput(
-            potencia_kw=inv.potencia_ac_sin_clip_kw,
-            perdidas_ac_frac=inp.perdidas_ac_frac
-        )
-    ).potencia_kw
+def _poa_ponderada_kwh(grupos: List[GrupoDC]) -> float:
+    """
+    Irradiación anual en plano (kWh/m²) ponderada por paneles de cada grupo.
+    """
+
+    pesos = [g.n_series * g.n_strings for g in grupos]
+    total = sum(pesos)
+
+    if total <= 0:
+        return 0.0
+
+    return sum(
+        float(np.maximum(g.poa_wm2, 0.0).sum()) * w
+        for g, w in zip(grupos, pesos)
+    ) / total / 1000.0
 
-    ac_final = aplicar_perdidas_ac(
-        PerdidasACInput(
-            potencia_kw=inv.potencia_ac_kw,
-            perdidas_ac_frac=inp.perdidas_ac_frac
+
+def _simular_series(grupos, temp, viento, inp) -> SeriesEnergia:
+
+    cad = _parametros_cadena(inp)
+
+    if inp.pasos_por_hora == 1:
+        return simular_horario_grupos(
+            grupos,
+            temp,
+            inp.panel,
+            cad,
+            viento_ms=viento,
+            modelo_termico=inp.modelo_termico,
         )
-    ).potencia_kw
 
-    return ac_sin, ac_final, inv.clipping_kw
+    return simular_subhorario_grupos(
+        grupos,
+        temp,
+        inp.panel,
+        cad,
+        pasos_por_hora=inp.pasos_por_hora,
+        viento_ms=viento,
+        modelo_termico=inp.modelo_termico,
+    )
+
+
+def _meta_zonas(inp) -> List[dict]:
+
+    return [
+        {
+            "zona": z.nombre,
+            "n_series": z.n_series,
+            "n_strings": z.n_strings,
+            "tilt_deg": z.tilt_deg,
+            "azimut_deg": z.azimut_deg,
+            "poa_kwh_m2": float(np.maximum(z.poa_wm2, 0.0).sum()) / 1000.0,
+        }
+        for z in inp.zonas or []
+    ]
 
 
 # ==========================================================
@@ -187,38 +200,20 @@ def ejecutar_motor_energia(inp: EnergiaInput) -> EnergiaResultado:
         if not inp.clima or not inp.clima.horas:
             raise Exception("Clima vacío o no definido")
 
-        horas = inp.clima.horas
-
-        dc_bruta_kw: List[float] = []
-        ac_sin_clipping_kw: List[float] = []
-        ac_final_kw: List[float] = []
-
-        poa_total_kwh = 0.0
-
         # ==================================================
-        # LOOP PRINCIPAL
+        # SERIES (MOTOR VECTORIZADO)
         # ==================================================
-        for h in horas:
+        poa, temp, viento = _series_clima(inp)
 
-            poa = _calcular_poa(h, inp)
-            poa_total_kwh += poa / 1000.0
+        grupos = _grupos_dc(poa, inp)
 
-            t_cell = _calcular_temperatura(poa, h, inp)
-            panel = _calcular_panel(poa, t_cell, inp)
-            string = _calcular_string(panel, inp)
-            array = _calcular_array(string, inp)
+        poa_total_kwh = _poa_ponderada_kwh(grupos)
 
-            dc_bruta = array.potencia_array_w / 1000.0
-            dc_bruta_kw.append(dc_bruta)
+        series = _simular_series(grupos, temp, viento, inp)
 
-            dc_neta = _aplicar_perdidas_dc(dc_bruta, inp)
-
-            inv = _pasar_inversor(dc_neta, inp)
-
-            ac_sin, ac_final, _ = _calcular_ac(inv, inp)
-
-            ac_sin_clipping_kw.append(ac_sin)
-            ac_final_kw.append(ac_final)
+        dc_bruta_kw: List[float] = series.dc_bruta_kw.tolist()
+        ac_sin_clipping_kw: List[float] = series.ac_sin_clip_kw.tolist()
+        ac_final_kw: List[float] = series.ac_final_kw.tolist()
 
         # ==================================================
         # VALIDACIÓN
@@ -294,17 +289,123 @@ def ejecutar_motor_energia(inp: EnergiaInput) -> EnergiaResultado:
             meta={
                 "modelo": "8760_fisico",
                 "pipeline": "clima→solar→dc→ac",
-            }
+                "paso_min": 60 // inp.pasos_por_hora,
+                "modelo_termico": inp.modelo_termico,
+                "zonas": _meta_zonas(inp),
+            },
+
+            series=series,
+            cadena=_parametros_cadena(inp),
         )
 
     except Exception as e:
         return _resultado_error(inp, [str(e)])
 
 
+# ==========================================================
+# MULTIZONA
+# ==========================================================
+def _zonas_energia(
+    datos,
+    paneles,
+    clima_8760,
+    *,
+    modelo_cielo: str,
+    tilt_default: float,
+    azimut_default: float,
+) -> Optional[List[ZonaEnergia]]:
+    """
+    Construye las zonas de energía a partir de paneles.meta["zonas"]
+    (ejecutar_multizona). La orientación viene de la propia zona o,
+    si falta, de datos.sistema_fv["zonas"] en el mismo orden.
+
+    La geometría solar del sitio se calcula una sola vez; cada zona
+    solo paga su transposición a plano.
+    """
+
+    meta = getattr(paneles, "meta", None)
+
+    if not isinstance(meta, dict) or not meta.get("zonas"):
+        return None
+
+    geo = clima_8760.geometria
+
+    if geo is None:
+        return None
+
+    from energy.clima.simulacion_8760 import calcular_poa_8760
+
+    sf = getattr(datos, "sistema_fv", {}) or {}
+    zonas_sf = sf.get("zonas") or []
+
+    zonas: List[ZonaEnergia] = []
+    cache_poa = {}
+
+    for i, z in enumerate(meta["zonas"]):
+
+        ref = zonas_sf[i] if i < len(zonas_sf) else {}
+
+        tilt = z.get("inclinacion", ref.get("inclinacion"))
+        azimut = z.get("azimut", ref.get("azimut"))
+
+        tilt = float(tilt_default if tilt is None else tilt)
+        azimut = float(azimut_default if azimut is None else azimut)
+
+        # zonas con la misma orientación comparten la POA
+        clave = (tilt, azimut)
+
+        if clave not in cache_poa:
+            cache_poa[clave] = calcular_poa_8760(
+                geo, tilt, azimut, modelo_cielo=modelo_cielo
+            )
+
+        zonas.append(
+            ZonaEnergia(
+                nombre=str(ref.get("nombre") or f"Zona {z.get('zona', i + 1)}"),
+                n_series=int(z.get("n_series") or 0),
+                n_strings=int(z.get("strings") or 0),
+                tilt_deg=tilt,
+                azimut_deg=azimut,
+                poa_wm2=cache_poa[clave],
+            )
+        )
+
+    return zonas
+
+
+def _clima_base(datos, lat, lon):
+    """
+    ResultadoClima según datos.fuente_clima ("pvgis" | "sintetico").
+    """
+
+    if getattr(datos, "fuente_clima", "pvgis") == "sintetico":
+
+        from energy.clima.clima_sintetico import generar_clima_sintetico
+
+        return generar_clima_sintetico(lat, lon)
+
+    from energy.clima.lector_pvgis import descargar_clima_pvgis, EntradaClimaPVGIS
+
+    return descargar_clima_pvgis(EntradaClimaPVGIS(lat=lat, lon=lon))
+
+
 # ==========================================================
 # ADAPTER
 # ==========================================================
-def ejecutar_energia(datos, sizing, paneles) -> EnergiaResultado:
+def ejecutar_energia(
+    datos,
+    sizing,
+    paneles,
+    *,
+    al_iniciar_etapa: Optional[Callable[[str], None]] = None,
+) -> EnergiaResultado:
+    """
+    al_iniciar_etapa:
+        callback opcional con "clima", "solar" y "energia" al empezar
+        cada bloque (progreso / cancelación del estudio).
+    """
+
+    reportar_etapa = al_iniciar_etapa or (lambda etapa: None)
 
     if datos is None:
         return EnergiaResultado.error("datos es None")
@@ -321,26 +422,34 @@ def ejecutar_energia(datos, sizing, paneles) -> EnergiaResultado:
     if lat == 0 and lon == 0:
         return EnergiaResultado.error("Lat/Lon inválidos")
 
-    from energy.clima.lector_pvgis import descargar_clima_pvgis, EntradaClimaPVGIS
+    reportar_etapa("clima")
 
-    clima_base = descargar_clima_pvgis(
-        EntradaClimaPVGIS(lat=lat, lon=lon)
-    )
+    clima_base = _clima_base(datos, lat, lon)
 
     if clima_base is None:
         return EnergiaResultado.error("Clima PVGIS devolvió None")
 
     from energy.clima.simulacion_8760 import simular_clima_8760
+    from energy.solar.sombreado import mascara_desde_dict
 
     tilt = getattr(datos, "tilt_deg", 15)
     azimuth = getattr(datos, "azimut_deg", 180)
 
+    mascara = mascara_desde_dict(getattr(datos, "sombreado", None))
+
+    reportar_etapa("solar")
+
     clima_8760 = simular_clima_8760(
         clima_base,
         tilt=tilt,
-        azimuth=azimuth
+        azimuth=azimuth,
+        modelo_cielo=getattr(datos, "modelo_transposicion", "isotropico"),
+        mascara=mascara,
     )
 
+    # con geometría de sombras, la pérdida plana solo aplica si se pide
+    sombras_frac = getattr(datos, "sombras_frac", 0.0 if mascara is not None else 0.02)
+
     from electrical.catalogos.catalogos import get_panel
 
     if not isinstance(datos.equipos, dict):
@@ -360,6 +469,15 @@ def ejecutar_energia(datos, sizing, paneles) -> EnergiaResultado:
     n_strings = paneles.array.n_strings_total
     pdc_kw = paneles.array.potencia_dc_w / 1000
 
+    zonas = _zonas_energia(
+        datos,
+        paneles,
+        clima_8760,
+        modelo_cielo=clima_8760.modelo_cielo,
+        tilt_default=tilt,
+        azimut_default=azimuth,
+    )
+
     entrada = EnergiaInput(
         n_series=n_series,
         n_strings=n_strings,
@@ -370,9 +488,14 @@ def ejecutar_energia(datos, sizing, paneles) -> EnergiaResultado:
         tilt_deg=tilt,
         azimut_deg=azimuth,
         perdidas_dc_frac=getattr(datos, "perdidas_dc_frac", 0.05),
-        sombras_frac=getattr(datos, "sombras_frac", 0.02),
+        sombras_frac=sombras_frac,
         eficiencia_inversor=getattr(datos, "eficiencia_inversor", 0.97),
         perdidas_ac_frac=getattr(datos, "perdidas_ac_frac", 0.02),
+        pasos_por_hora=int(getattr(datos, "pasos_por_hora", 1) or 1),
+        modelo_termico=getattr(datos, "modelo_termico", "noct"),
+        zonas=zonas,
     )
 
+    reportar_etapa("energia")
+
     return ejecutar_motor_energia(entrada)
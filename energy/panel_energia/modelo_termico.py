@@ -20,9 +20,35 @@ Modelo térmico basado en NOCT:
     T_cell = T_ambient + (NOCT - 20) / 800 * G_POA
 
 Este modelo es estándar en simulaciones FV de nivel ingeniería.
+
+Modelos con viento (arrays)
+---------------------------
+`temperatura_celda_arrays` evalúa 8760 horas en una llamada con el
+modelo elegido; los coeficientes vienen del panel (PanelSpec.termico,
+data/paneles.yaml):
+
+    noct     T = Ta + (NOCT − 20)/800 · E                 (sin viento)
+    faiman   T = Ta + E / (u0 + u1·v)
+    pvsyst   T = Ta + α·E·(1 − η) / (Uc + Uv·v)
+    sapm     T = Ta + E·exp(a + b·v) + E/1000 · ΔT
+
+E = POA (W/m²), v = viento a 10 m (m/s, PVGIS WS10m).
 """
 
 from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from electrical.modelos.paneles import CoeficientesTermicos
+
+
+MODELOS_TERMICOS = ("noct", "faiman", "pvsyst", "sapm")
+
+MODELO_TERMICO_DEFECTO = "noct"
+
+# mismo valor que usa lector_pvgis cuando falta WS10m
+VIENTO_DEFECTO_MS = 1.0
 
 
 # ==========================================================
@@ -107,3 +133,58 @@ def calcular_temperatura_celda(inp: ModeloTermicoInput) -> ModeloTermicoResultad
     return ModeloTermicoResultado(
         temperatura_celda_c=t_cell
     )
+
+
+# ==========================================================
+# MODELOS VECTORIZADOS (CON VIENTO)
+# ==========================================================
+
+def temperatura_celda_arrays(
+    poa_wm2: np.ndarray,
+    temp_amb_c: np.ndarray,
+    viento_ms: Optional[np.ndarray] = None,
+    *,
+    modelo: str = MODELO_TERMICO_DEFECTO,
+    panel: Any = None,
+) -> np.ndarray:
+    """
+    Temperatura de celda (°C) por paso con el modelo elegido.
+
+    panel:
+        PanelSpec (noct_c y termico); sin panel se usan NOCT 45 °C y
+        los coeficientes por defecto.
+
+    viento_ms:
+        None → VIENTO_DEFECTO_MS constante.
+    """
+
+    if modelo not in MODELOS_TERMICOS:
+        raise ValueError(f"modelo térmico inválido: {modelo} (válidos: {MODELOS_TERMICOS})")
+
+    poa = np.asarray(poa_wm2, dtype=float)
+    tamb = np.asarray(temp_amb_c, dtype=float)
+
+    if modelo == "noct":
+
+        noct = float(getattr(panel, "noct_c", 45.0))
+
+        if noct <= 0:
+            raise ValueError("noct_c inválido")
+
+        return tamb + ((noct - 20.0) / 800.0) * poa
+
+    c = getattr(panel, "termico", None) or CoeficientesTermicos()
+
+    if viento_ms is None:
+        v = VIENTO_DEFECTO_MS
+    else:
+        v = np.maximum(np.asarray(viento_ms, dtype=float), 0.0)
+
+    if modelo == "faiman":
+        return tamb + poa / (c.faiman_u0 + c.faiman_u1 * v)
+
+    if modelo == "pvsyst":
+        return tamb + c.absorcion * (1.0 - c.eficiencia_modulo) * poa / (c.pvsyst_uc + c.pvsyst_uv * v)
+
+    # sapm: temperatura de módulo + salto módulo → celda
+    return tamb + poa * np.exp(c.sapm_a + c.sapm_b * v) + poa / 1000.0 * c.sapm_dt
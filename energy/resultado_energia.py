@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 
 @dataclass(frozen=True)
@@ -105,3 +105,20 @@ class EnergiaResultado:
         "horas": 8760
     }
     """
+
+    # ======================================================
+    # SERIES HORARIAS (motor vectorizado)
+    # ======================================================
+    series: Optional[Any] = None
+    """
+    SeriesEnergia (energy/sistema/motor_vectorizado) con las potencias
+    horarias dc_bruta / dc_neta / ac_sin_clip / ac_final en kW.
+
+    None en resultados de error.
+    """
+
+    cadena: Optional[Any] = None
+    """
+    ParametrosCadena usados (límite AC y pérdidas) para re-simular la
+    vida útil desde las series (energy/sistema/vida_util).
+    """
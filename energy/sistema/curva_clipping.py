@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+"""
+ENERGÍA AC RÁPIDA POR CANDIDATO (CLIPPING ORDENADO) — FV Engine
+===============================================================
+
+Responsabilidad
+---------------
+
+Evaluar la energía AC mensual (con clipping exacto hora a hora) de
+muchos tamaños de sistema (Pdc, Pac) a partir de UNA sola serie de
+potencia DC por kWp del sitio.
+
+Idea
+----
+
+Con la misma orientación y panel, la DC escala linealmente con Pdc:
+
+    ac_h = min(Pdc · η · x_h, Pac) · f_ac       x_h = DC neta por kWp
+
+Si los x_h de cada mes están ordenados con su suma acumulada C:
+
+    t   = Pac / (Pdc · η)                       umbral de clipping
+    i   = searchsorted(x, t)                    horas sin clipping
+    E   = (Pdc · η · C[i] + Pac · (n - i)) · f_ac
+
+→ cada candidato cuesta 12 búsquedas binarias (microsegundos),
+  sin volver a recorrer las 8760 horas.
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    serie DC por kWp (8760) + arrays de candidatos (Pdc, Pac)
+
+Salida:
+    energía AC y clipping mensuales por candidato
+
+Consumido por:
+    core.servicios.optimizador_sizing
+    core.servicios.analisis_cobertura
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from .motor_vectorizado import ParametrosCadena
+
+
+DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+DIAS_MES_BISIESTO = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class PerfilDCMensual:
+    """
+    Serie DC neta por kWp ordenada por mes (precálculo del sitio).
+
+    ordenado[m]: x_h del mes m, ascendente
+    acumulado[m]: suma acumulada con 0 inicial (len = n + 1)
+    """
+
+    ordenado: List[np.ndarray]
+    acumulado: List[np.ndarray]
+
+    @property
+    def dc_neta_12m_por_kwp(self) -> np.ndarray:
+        return np.array([c[-1] for c in self.acumulado])
+
+
+@dataclass(frozen=True)
+class EnergiaCandidatos:
+    """
+    Energías mensuales (kWh) por candidato: shape (n_candidatos, 12).
+    """
+
+    ac_12m: np.ndarray
+    clipping_12m: np.ndarray
+
+    @property
+    def ac_anual(self) -> np.ndarray:
+        return self.ac_12m.sum(axis=1)
+
+    @property
+    def clipping_anual(self) -> np.ndarray:
+        return self.clipping_12m.sum(axis=1)
+
+
+# ==========================================================
+# PRECÁLCULO
+# ==========================================================
+
+def _bloques_mensuales(n: int) -> List[int]:
+
+    if n == 8784:
+        dias = DIAS_MES_BISIESTO
+    elif n == 8760:
+        dias = DIAS_MES
+    else:
+        raise ValueError("Serie inválida: debe ser 8760 o 8784 horas")
+
+    return [d * 24 for d in dias]
+
+
+def preparar_perfil_dc(
+    dc_bruta_por_kwp_kw: np.ndarray,
+    cad: ParametrosCadena,
+) -> PerfilDCMensual:
+    """
+    Ordena la DC neta por kWp de cada mes (se hace una vez por sitio).
+
+    cad:
+        solo se usan las pérdidas DC (escalares o perfil, hora a
+        hora); el inversor se evalúa por candidato.
+    """
+
+    dc = np.maximum(np.asarray(dc_bruta_por_kwp_kw, dtype=float), 0.0)
+
+    x = dc * cad.factores_dc(len(dc))
+
+    ordenado: List[np.ndarray] = []
+    acumulado: List[np.ndarray] = []
+
+    idx = 0
+
+    for horas in _bloques_mensuales(len(x)):
+
+        bloque = np.sort(x[idx: idx + horas])
+
+        ordenado.append(bloque)
+        acumulado.append(np.concatenate(([0.0], np.cumsum(bloque))))
+
+        idx += horas
+
+    return PerfilDCMensual(ordenado=ordenado, acumulado=acumulado)
+
+
+def factores_ac_mensuales(cad: ParametrosCadena, n_horas: int) -> np.ndarray:
+    """
+    Factor AC medio de cada mes (12,).
+
+    Exacto con pérdidas AC escalares o mensuales; con un perfil
+    horario es la media del mes.
+    """
+
+    f = np.broadcast_to(np.asarray(cad.factores_ac(n_horas), dtype=float), (n_horas,))
+
+    horas = np.asarray(_bloques_mensuales(n_horas))
+
+    return np.add.reduceat(f, np.concatenate(([0], np.cumsum(horas)[:-1]))) / horas
+
+
+# ==========================================================
+# EVALUACIÓN VECTORIZADA
+# ==========================================================
+
+def evaluar_candidatos(
+    perfil: PerfilDCMensual,
+    pdc_kw: np.ndarray,
+    pac_kw: np.ndarray,
+    cad: ParametrosCadena,
+) -> EnergiaCandidatos:
+    """
+    Energía AC mensual con clipping exacto para cada par (Pdc, Pac).
+    """
+
+    pdc = np.asarray(pdc_kw, dtype=float)
+    pac = np.broadcast_to(np.asarray(pac_kw, dtype=float), pdc.shape)
+
+    if (pdc < 0).any():
+        raise ValueError("pdc_kw inválido")
+
+    if (pac <= 0).any():
+        raise ValueError("p_ac_nominal_kw inválido")
+
+    if not (0 < cad.eficiencia_inversor <= 1):
+        raise ValueError("eficiencia_nominal inválida")
+
+    k = pdc * cad.eficiencia_inversor
+
+    with np.errstate(divide="ignore"):
+        umbral = np.where(k > 0, pac / k, np.inf)
+
+    f_ac = factores_ac_mensuales(cad, sum(len(x) for x in perfil.ordenado))
+
+    ac = np.empty((len(pdc), 12))
+    sin_clip = np.empty((len(pdc), 12))
+
+    for m, (x, c) in enumerate(zip(perfil.ordenado, perfil.acumulado)):
+
+        n = len(x)
+        i = np.searchsorted(x, umbral, side="right")
+
+        ac[:, m] = (k * c[i] + pac * (n - i)) * f_ac[m]
+        sin_clip[:, m] = k * c[-1] * f_ac[m]
+
+    return EnergiaCandidatos(
+        ac_12m=ac,
+        clipping_12m=sin_clip - ac,
+    )
@@ -0,0 +1,545 @@
+from __future__ import annotations
+
+"""
+MOTOR ENERGÉTICO VECTORIZADO (ARRAYS) — FV Engine
+=================================================
+
+Responsabilidad
+---------------
+
+Ejecutar la cadena física completa del generador sobre series
+completas (NumPy) en lugar de hora por hora:
+
+    POA + T ambiente + viento
+        ↓
+    modelo térmico (NOCT / Faiman / PVsyst / SAPM)
+        ↓
+    potencia panel → string → arreglo      (DC bruta)
+        ↓
+    pérdidas DC + sombras                  (DC neta)
+        ↓
+    inversor (eficiencia + clipping)
+        ↓
+    pérdidas AC                            (AC final)
+
+Las ecuaciones son las mismas que los modelos unitarios de
+energy/panel_energia y energy/sistema; el resultado horario es
+idéntico al del loop clásico.
+
+Modo sub-horario
+----------------
+
+El clipping del inversor es no lineal: recortar la media horaria
+subestima el clipping cuando la potencia varía dentro de la hora.
+`simular_subhorario` ejecuta la cadena a 15 o 5 minutos y vuelve
+a agregar a 8760 (media de potencia en la hora = kWh), procesando
+el año por bloques para acotar la memoria.
+
+Pérdidas variables
+------------------
+
+Las pérdidas DC, sombras y AC pueden ser escalares, 12 valores
+mensuales o series horarias (suciedad estacional, sombras por hora,
+paradas programadas); se expanden con el índice de calendario y se
+aplican en la misma pasada vectorizada.
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    arrays POA / temperatura + parámetros del sistema
+
+Salida:
+    SeriesEnergia (kW por hora, 8760)
+
+Consumido por:
+    orquestador_energia.ejecutar_motor_energia
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from energy.panel_energia.modelo_termico import MODELO_TERMICO_DEFECTO, temperatura_celda_arrays
+
+from .perfil_perdidas import PerfilPerdida, es_escalar, expandir_perfil
+
+
+# ==========================================================
+# CONFIGURACIÓN
+# ==========================================================
+
+# 1 → horario; 4 → 15 min; 12 → 5 min
+PASOS_POR_HORA_VALIDOS = (1, 2, 4, 6, 12)
+
+# tamaño de bloque (horas) del modo sub-horario: ~1 mes
+HORAS_POR_BLOQUE = 744
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class ParametrosCadena:
+    """
+    Parámetros de la cadena DC → AC (después del arreglo).
+
+    perdidas_dc_frac / sombras_frac / perdidas_ac_frac:
+        escalar, 12 valores mensuales o serie horaria
+        (energy/sistema/perfil_perdidas).
+    """
+
+    pac_nominal_kw: float
+    perdidas_dc_frac: PerfilPerdida = 0.05
+    sombras_frac: PerfilPerdida = 0.0
+    eficiencia_inversor: float = 0.97
+    perdidas_ac_frac: PerfilPerdida = 0.0
+
+    @property
+    def es_escalar(self) -> bool:
+        return all(
+            es_escalar(v)
+            for v in (self.perdidas_dc_frac, self.sombras_frac, self.perdidas_ac_frac)
+        )
+
+    @property
+    def factor_dc(self) -> float:
+        if not self.es_escalar:
+            raise ValueError("Pérdidas con perfil: usar factores_dc(n_horas)")
+        return float(self.factores_dc(1))
+
+    @property
+    def factor_ac(self) -> float:
+        if not self.es_escalar:
+            raise ValueError("Pérdidas con perfil: usar factores_ac(n_horas)")
+        return float(self.factores_ac(1))
+
+    def factores_dc(self, n_horas: int):
+        """
+        Factor DC por hora (float si todas las pérdidas son escalares).
+        """
+        f = (
+            (1 - expandir_perfil(self.perdidas_dc_frac, n_horas, "perdidas_dc_frac"))
+            * (1 - expandir_perfil(self.sombras_frac, n_horas, "sombras_frac"))
+        )
+        return np.clip(f, 0.0, 1.0)
+
+    def factores_ac(self, n_horas: int):
+        f = 1.0 - expandir_perfil(self.perdidas_ac_frac, n_horas, "perdidas_ac_frac")
+        return np.clip(f, 0.0, 1.0)
+
+    def expandir(self, n_horas: int) -> "ParametrosCadena":
+        """
+        Copia con los perfiles como series de n_horas (los escalares
+        se mantienen); permite recortar por bloques sub-horarios.
+        """
+        return replace(
+            self,
+            perdidas_dc_frac=expandir_perfil(self.perdidas_dc_frac, n_horas, "perdidas_dc_frac"),
+            sombras_frac=expandir_perfil(self.sombras_frac, n_horas, "sombras_frac"),
+            perdidas_ac_frac=expandir_perfil(self.perdidas_ac_frac, n_horas, "perdidas_ac_frac"),
+        )
+
+    def bloque(self, inicio_h: int, fin_h: int, pasos_por_hora: int = 1) -> "ParametrosCadena":
+        """
+        Perfiles (ya expandidos) de [inicio_h, fin_h) repetidos a cada sub-paso.
+        """
+
+        def recortar(v):
+            if es_escalar(v):
+                return v
+            return np.repeat(np.asarray(v)[inicio_h:fin_h], pasos_por_hora)
+
+        return replace(
+            self,
+            perdidas_dc_frac=recortar(self.perdidas_dc_frac),
+            sombras_frac=recortar(self.sombras_frac),
+            perdidas_ac_frac=recortar(self.perdidas_ac_frac),
+        )
+
+
+@dataclass(frozen=True)
+class SeriesEnergia:
+    """
+    Potencias medias por paso (kW). Con paso horario = kWh por hora.
+    """
+
+    dc_bruta_kw: np.ndarray
+    dc_neta_kw: np.ndarray
+    ac_sin_clip_kw: np.ndarray
+    ac_final_kw: np.ndarray
+
+    @property
+    def clipping_kw(self) -> np.ndarray:
+        return self.ac_sin_clip_kw - self.ac_final_kw
+
+
+# ==========================================================
+# GENERADOR DC
+# ==========================================================
+
+def temperatura_celda_noct(
+    poa_wm2: np.ndarray,
+    temp_amb_c: np.ndarray,
+    noct_c: float,
+) -> np.ndarray:
+    """
+    T_cell = T_amb + (NOCT - 20)/800 · POA
+    """
+
+    if noct_c <= 0:
+        raise ValueError("noct_c inválido")
+
+    return temp_amb_c + ((noct_c - 20.0) / 800.0) * poa_wm2
+
+
+def potencia_dc_kw(
+    poa_wm2: np.ndarray,
+    t_cell_c: np.ndarray,
+    panel: Any,
+    n_series: int,
+    n_strings: int,
+) -> np.ndarray:
+    """
+    Potencia DC bruta del arreglo (kW) por paso.
+
+    panel:
+        PanelSpec (pmax_w, coef_potencia_pct_c).
+    """
+
+    if n_series <= 0:
+        raise ValueError("n_series inválido")
+
+    if n_strings <= 0:
+        raise ValueError("n_strings_total inválido")
+
+    coef = panel.coef_potencia_pct_c / 100
+
+    pmp = panel.pmax_w * (poa_wm2 / 1000.0) * (1 + coef * (t_cell_c - 25.0))
+
+    pmp = np.where(poa_wm2 > 0, np.maximum(pmp, 0.0), 0.0)
+
+    return pmp * n_series * n_strings / 1000.0
+
+
+# ==========================================================
+# CADENA DC → AC
+# ==========================================================
+
+def aplicar_cadena(dc_bruta_kw: np.ndarray, cad: ParametrosCadena) -> SeriesEnergia:
+    """
+    Pérdidas DC, inversor con clipping y pérdidas AC, paso a paso.
+
+    Los perfiles de pérdidas deben tener un valor por paso (o ser
+    mensuales sobre una serie horaria de 8760 / 8784).
+    """
+
+    if cad.pac_nominal_kw <= 0:
+        raise ValueError("p_ac_nominal_kw inválido")
+
+    if not (0 < cad.eficiencia_inversor <= 1):
+        raise ValueError("eficiencia_nominal inválida")
+
+    n = len(dc_bruta_kw)
+
+    dc_neta = np.maximum(dc_bruta_kw * cad.factores_dc(n), 0.0)
+
+    ac_raw = dc_neta * cad.eficiencia_inversor
+    ac_clip = np.minimum(ac_raw, cad.pac_nominal_kw)
+
+    f_ac = cad.factores_ac(n)
+
+    return SeriesEnergia(
+        dc_bruta_kw=dc_bruta_kw,
+        dc_neta_kw=dc_neta,
+        ac_sin_clip_kw=np.maximum(ac_raw * f_ac, 0.0),
+        ac_final_kw=np.maximum(ac_clip * f_ac, 0.0),
+    )
+
+
+# ==========================================================
+# GRUPOS DC (ZONAS / MPPT)
+# ==========================================================
+
+@dataclass(frozen=True)
+class GrupoDC:
+    """
+    Parte del generador con orientación y strings propios
+    (una zona o un grupo MPPT).
+
+    poa_subhorario_wm2:
+        serie medida de alta resolución (opcional, modo sub-horario).
+    """
+
+    poa_wm2: np.ndarray
+    n_series: int
+    n_strings: int
+
+    poa_subhorario_wm2: Optional[np.ndarray] = None
+
+
+def _dc_grupos(
+    poas: List[np.ndarray],
+    temp: np.ndarray,
+    panel: Any,
+    grupos: Sequence[GrupoDC],
+    viento: Optional[np.ndarray] = None,
+    modelo_termico: str = MODELO_TERMICO_DEFECTO,
+) -> np.ndarray:
+    """
+    Suma la DC bruta de todos los grupos (antes del inversor común).
+    """
+
+    dc = np.zeros_like(temp)
+
+    for poa, g in zip(poas, grupos):
+        t_cell = temperatura_celda_arrays(poa, temp, viento, modelo=modelo_termico, panel=panel)
+        dc += potencia_dc_kw(poa, t_cell, panel, g.n_series, g.n_strings)
+
+    return dc
+
+
+# ==========================================================
+# MOTOR HORARIO
+# ==========================================================
+
+def simular_horario_grupos(
+    grupos: Sequence[GrupoDC],
+    temp_amb_c: np.ndarray,
+    panel: Any,
+    cad: ParametrosCadena,
+    *,
+    viento_ms: Optional[np.ndarray] = None,
+    modelo_termico: str = MODELO_TERMICO_DEFECTO,
+) -> SeriesEnergia:
+    """
+    Varios grupos DC → un inversor: la DC se suma antes del clipping.
+
+    viento_ms:
+        serie horaria (m/s); solo la usan los modelos térmicos con viento.
+    """
+
+    if not grupos:
+        raise ValueError("Se requiere al menos un grupo DC")
+
+    temp = np.asarray(temp_amb_c, dtype=float)
+
+    poas = [np.maximum(np.asarray(g.poa_wm2, dtype=float), 0.0) for g in grupos]
+
+    return aplicar_cadena(_dc_grupos(poas, temp, panel, grupos, viento_ms, modelo_termico), cad)
+
+
+def simular_horario(
+    poa_wm2: np.ndarray,
+    temp_amb_c: np.ndarray,
+    panel: Any,
+    n_series: int,
+    n_strings: int,
+    cad: ParametrosCadena,
+    *,
+    viento_ms: Optional[np.ndarray] = None,
+    modelo_termico: str = MODELO_TERMICO_DEFECTO,
+) -> SeriesEnergia:
+    """
+    Cadena completa a paso horario (una pasada sobre 8760).
+    """
+
+    return simular_horario_grupos(
+        [GrupoDC(poa_wm2=poa_wm2, n_series=n_series, n_strings=n_strings)],
+        temp_amb_c,
+        panel,
+        cad,
+        viento_ms=viento_ms,
+        modelo_termico=modelo_termico,
+    )
+
+
+# ==========================================================
+# MOTOR SUB-HORARIO
+# ==========================================================
+
+def interpolar_subhorario(
+    serie_h: np.ndarray,
+    pasos_por_hora: int,
+    inicio_h: int,
+    fin_h: int,
+    *,
+    conservar_media: bool,
+) -> np.ndarray:
+    """
+    Interpola una serie horaria al paso sub-horario en [inicio_h, fin_h).
+
+    Los valores horarios se asumen centrados en cada hora. Con
+    conservar_media=True cada hora se reescala para que la media de
+    sus sub-pasos sea exactamente el valor horario (la energía del
+    bloque no cambia; solo se redistribuye dentro de la hora).
+    """
+
+    n_h = len(serie_h)
+    k = pasos_por_hora
+
+    x_h = np.arange(n_h) + 0.5
+
+    t = inicio_h + (np.arange((fin_h - inicio_h) * k) + 0.5) / k
+
+    sub = np.interp(t, x_h, serie_h).reshape(-1, k)
+
+    if conservar_media:
+
+        sub = np.maximum(sub, 0.0)
+
+        objetivo = serie_h[inicio_h:fin_h]
+        media = sub.mean(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(media > 0, objetivo / media, 0.0)
+
+        sub = sub * factor[:, None]
+
+        # hora con energía pero interpolación nula → reparto uniforme
+        sin_forma = (media <= 0) & (objetivo > 0)
+        sub[sin_forma] = objetivo[sin_forma, None]
+
+    return sub.ravel()
+
+
+def simular_subhorario_grupos(
+    grupos: Sequence[GrupoDC],
+    temp_amb_c: np.ndarray,
+    panel: Any,
+    cad: ParametrosCadena,
+    *,
+    pasos_por_hora: int = 4,
+    temp_subhorario_c: Optional[np.ndarray] = None,
+    horas_por_bloque: int = HORAS_POR_BLOQUE,
+    viento_ms: Optional[np.ndarray] = None,
+    modelo_termico: str = MODELO_TERMICO_DEFECTO,
+) -> SeriesEnergia:
+    """
+    Cadena completa a paso sub-horario, agregada de vuelta a 8760.
+
+    Cada grupo usa su poa_subhorario_wm2 si la trae; si no, se
+    interpola desde su serie horaria. La temperatura sub-horaria
+    medida es opcional del mismo modo; el viento horario se interpola.
+
+    La memoria queda acotada por bloques de `horas_por_bloque` horas.
+    """
+
+    if not grupos:
+        raise ValueError("Se requiere al menos un grupo DC")
+
+    if pasos_por_hora not in PASOS_POR_HORA_VALIDOS:
+        raise ValueError(
+            f"pasos_por_hora inválido: {pasos_por_hora} "
+            f"(válidos: {PASOS_POR_HORA_VALIDOS})"
+        )
+
+    if horas_por_bloque <= 0:
+        raise ValueError("horas_por_bloque debe ser > 0")
+
+    temp_h = np.asarray(temp_amb_c, dtype=float)
+    viento_h = None if viento_ms is None else np.asarray(viento_ms, dtype=float)
+    poas_h = [np.maximum(np.asarray(g.poa_wm2, dtype=float), 0.0) for g in grupos]
+
+    n_h = len(temp_h)
+    k = pasos_por_hora
+
+    # perfiles mensuales → horarios una vez; cada bloque toma su tramo
+    cad_h = cad.expandir(n_h)
+
+    series_sub = [("temp_subhorario_c", temp_subhorario_c)] + [
+        ("poa_subhorario_wm2", g.poa_subhorario_wm2) for g in grupos
+    ]
+
+    for nombre, serie in series_sub:
+        if serie is not None and len(serie) != n_h * k:
+            raise ValueError(f"{nombre}: se esperaban {n_h * k} pasos")
+
+    dc_bruta = np.empty(n_h)
+    dc_neta = np.empty(n_h)
+    ac_sin = np.empty(n_h)
+    ac_fin = np.empty(n_h)
+
+    for a in range(0, n_h, horas_por_bloque):
+
+        b = min(a + horas_por_bloque, n_h)
+
+        if temp_subhorario_c is not None:
+            temp = np.asarray(temp_subhorario_c[a * k:b * k], dtype=float)
+        else:
+            temp = interpolar_subhorario(temp_h, k, a, b, conservar_media=False)
+
+        viento = (
+            None if viento_h is None
+            else interpolar_subhorario(viento_h, k, a, b, conservar_media=False)
+        )
+
+        poas = [
+            np.maximum(np.asarray(g.poa_subhorario_wm2[a * k:b * k], dtype=float), 0.0)
+            if g.poa_subhorario_wm2 is not None
+            else interpolar_subhorario(poa_h, k, a, b, conservar_media=True)
+            for g, poa_h in zip(grupos, poas_h)
+        ]
+
+        s = aplicar_cadena(
+            _dc_grupos(poas, temp, panel, grupos, viento, modelo_termico),
+            cad_h.bloque(a, b, k),
+        )
+
+        # media de potencia en la hora = energía horaria (kWh)
+        dc_bruta[a:b] = s.dc_bruta_kw.reshape(-1, k).mean(axis=1)
+        dc_neta[a:b] = s.dc_neta_kw.reshape(-1, k).mean(axis=1)
+        ac_sin[a:b] = s.ac_sin_clip_kw.reshape(-1, k).mean(axis=1)
+        ac_fin[a:b] = s.ac_final_kw.reshape(-1, k).mean(axis=1)
+
+    return SeriesEnergia(
+        dc_bruta_kw=dc_bruta,
+        dc_neta_kw=dc_neta,
+        ac_sin_clip_kw=ac_sin,
+        ac_final_kw=ac_fin,
+    )
+
+
+def simular_subhorario(
+    poa_wm2: np.ndarray,
+    temp_amb_c: np.ndarray,
+    panel: Any,
+    n_series: int,
+    n_strings: int,
+    cad: ParametrosCadena,
+    *,
+    pasos_por_hora: int = 4,
+    poa_subhorario_wm2: Optional[np.ndarray] = None,
+    temp_subhorario_c: Optional[np.ndarray] = None,
+    horas_por_bloque: int = HORAS_POR_BLOQUE,
+    viento_ms: Optional[np.ndarray] = None,
+    modelo_termico: str = MODELO_TERMICO_DEFECTO,
+) -> SeriesEnergia:
+    """
+    Versión de un solo generador de simular_subhorario_grupos.
+
+    poa_subhorario_wm2 / temp_subhorario_c:
+        series medidas de alta resolución (len = 8760 · pasos_por_hora).
+        Si no se entregan, se interpolan desde las horarias.
+    """
+
+    return simular_subhorario_grupos(
+        [
+            GrupoDC(
+                poa_wm2=poa_wm2,
+                n_series=n_series,
+                n_strings=n_strings,
+                poa_subhorario_wm2=poa_subhorario_wm2,
+            )
+        ],
+        temp_amb_c,
+        panel,
+        cad,
+        pasos_por_hora=pasos_por_hora,
+        temp_subhorario_c=temp_subhorario_c,
+        horas_por_bloque=horas_por_bloque,
+        viento_ms=viento_ms,
+        modelo_termico=modelo_termico,
+    )
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+"""
+PERFILES DE PÉRDIDAS (ESCALAR / MENSUAL / HORARIO) — FV Engine
+==============================================================
+
+Responsabilidad
+---------------
+
+Aceptar cada fracción de pérdida del motor en tres formas y
+expandirla a una serie horaria con el índice de calendario:
+
+    escalar        0.02                 → constante todo el año
+    12 valores     [0.05, 0.04, ...]    → por mes (suciedad estacional)
+    n horas        array 8760 / 8784    → por hora (sombras, paradas)
+
+Así la suciedad estacional o una parada programada (pérdida AC = 1
+en esas horas) entran en una sola simulación.
+
+Reglas
+------
+
+    ✔ los escalares se mantienen escalares (sin arrays de 8760 innecesarios)
+    ✔ toda fracción debe estar en [0, 1]
+    ❌ no conoce la cadena DC → AC (solo forma y calendario)
+
+Consumido por:
+    energy.sistema.motor_vectorizado.ParametrosCadena
+    energy.contrato.EnergiaInput.validar
+"""
+
+from functools import lru_cache
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+
+PerfilPerdida = Union[float, Sequence[float], np.ndarray]
+
+_DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+# ==========================================================
+# CALENDARIO
+# ==========================================================
+
+@lru_cache(maxsize=2)
+def mes_por_hora(n_horas: int) -> np.ndarray:
+    """
+    Índice de mes (0–11) de cada hora de un año de 8760 u 8784 horas.
+    """
+
+    if n_horas not in (8760, 8784):
+        raise ValueError("Serie inválida: debe ser 8760 o 8784 horas")
+
+    dias = list(_DIAS_MES)
+
+    if n_horas == 8784:
+        dias[1] = 29
+
+    mes = np.repeat(np.arange(12), np.asarray(dias) * 24)
+    mes.setflags(write=False)
+
+    return mes
+
+
+# ==========================================================
+# PERFILES
+# ==========================================================
+
+def es_escalar(valor: PerfilPerdida) -> bool:
+    return np.ndim(valor) == 0
+
+
+def error_perfil(valor: PerfilPerdida, nombre: str, n_horas: Optional[int] = None) -> Optional[str]:
+    """
+    Mensaje de error del perfil, o None si es válido.
+    """
+
+    arr = np.asarray(valor, dtype=float)
+
+    if arr.ndim > 1:
+        return f"{nombre}: se esperaba escalar, 12 valores o una serie horaria"
+
+    if arr.ndim == 1 and len(arr) != 12 and n_horas is not None and len(arr) != n_horas:
+        return f"{nombre}: se esperaban 12 valores o {n_horas} horas (recibidos {len(arr)})"
+
+    if not np.isfinite(arr).all() or (arr < 0).any() or (arr > 1).any():
+        return f"{nombre} debe estar entre 0 y 1"
+
+    return None
+
+
+def expandir_perfil(valor: PerfilPerdida, n_horas: int, nombre: str = "perdida") -> Union[float, np.ndarray]:
+    """
+    Escalar → float; 12 valores o n_horas valores → array de n_horas.
+
+    Series de longitud n_horas se aceptan con cualquier n (bloques
+    sub-horarios); los 12 valores mensuales requieren 8760 u 8784.
+    """
+
+    error = error_perfil(valor, nombre, n_horas)
+
+    if error:
+        raise ValueError(error)
+
+    if es_escalar(valor):
+        return float(valor)
+
+    arr = np.asarray(valor, dtype=float)
+
+    if len(arr) == n_horas:
+        return arr
+
+    return arr[mes_por_hora(n_horas)]
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+"""
+ENERGÍA DE VIDA ÚTIL (AÑOS × 8760) — FV Engine
+==============================================
+
+Responsabilidad
+---------------
+
+Extender la simulación de un año a toda la vida útil del sistema
+sin volver a ejecutar el pipeline por año:
+
+    SeriesEnergia (año base, 8760)
+        ↓
+    factor de degradación por año (LID + anual)
+        ↓
+    AC sin clipping × factor               (años × 8760, float32)
+        ↓
+    re-clipping en el inversor             (límite AC de cada hora)
+        ↓
+    matriz AC final (kWh por hora y año)
+
+La degradación reduce la DC del generador, no el inversor: con
+DC/AC alto el clipping disminuye con los años y parte de la pérdida
+se recupera. Por eso se vuelve a recortar cada año en lugar de
+escalar la AC final.
+
+Modelos de degradación
+----------------------
+
+    lineal      f_a = (1 - LID) · (1 - d · a)
+    compuesto   f_a = (1 - LID) · (1 - d) ** a
+    explícito   factores por año (curva de garantía / no lineal)
+
+con a = 0 para el primer año (solo LID).
+
+Memoria
+-------
+
+La matriz es float32: 25 años × 8760 h ≈ 0.9 MB. Los agregados
+mensual y anual son reducciones sobre el eje de horas (se acumulan
+en float64).
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    SeriesEnergia + ParametrosCadena + ParametrosDegradacion
+
+Salida:
+    EnergiaVidaUtil
+
+Consumido por:
+    core.servicios.finanzas (flujos año a año)
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .motor_vectorizado import ParametrosCadena, SeriesEnergia
+
+
+VIDA_UTIL_ANIOS = 25
+
+LID_FRAC = 0.02
+
+DEGRADACION_ANUAL_FRAC = 0.005
+
+MODELOS_DEGRADACION = ("lineal", "compuesto")
+
+_DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+# ==========================================================
+# PARÁMETROS
+# ==========================================================
+
+@dataclass(frozen=True)
+class ParametrosDegradacion:
+    """
+    factores:
+        curva explícita (un valor por año, relativo al año base);
+        si se indica, ignora lid_frac / degradacion_anual_frac / modelo.
+    """
+
+    anios: int = VIDA_UTIL_ANIOS
+    lid_frac: float = LID_FRAC
+    degradacion_anual_frac: float = DEGRADACION_ANUAL_FRAC
+    modelo: str = "lineal"
+
+    factores: Optional[Tuple[float, ...]] = None
+
+    def __post_init__(self):
+
+        if self.anios <= 0:
+            raise ValueError("anios debe ser > 0")
+
+        if not (0 <= self.lid_frac < 1):
+            raise ValueError("lid_frac debe estar en [0, 1)")
+
+        if not (0 <= self.degradacion_anual_frac < 1):
+            raise ValueError("degradacion_anual_frac debe estar en [0, 1)")
+
+        if self.modelo not in MODELOS_DEGRADACION:
+            raise ValueError(f"modelo de degradación inválido: {self.modelo}")
+
+        if self.factores is not None:
+
+            if len(self.factores) != self.anios:
+                raise ValueError(f"factores: se esperaban {self.anios} valores")
+
+            if any(not (0 <= f <= 1) for f in self.factores):
+                raise ValueError("factores deben estar entre 0 y 1")
+
+
+def factores_degradacion(p: ParametrosDegradacion) -> np.ndarray:
+    """
+    Factor de producción DC de cada año respecto al año base (float64).
+    """
+
+    if p.factores is not None:
+        return np.asarray(p.factores, dtype=float)
+
+    a = np.arange(p.anios, dtype=float)
+
+    if p.modelo == "compuesto":
+        f = (1.0 - p.degradacion_anual_frac) ** a
+    else:
+        f = 1.0 - p.degradacion_anual_frac * a
+
+    return np.maximum((1.0 - p.lid_frac) * f, 0.0)
+
+
+# ==========================================================
+# RESULTADO
+# ==========================================================
+
+@dataclass(frozen=True)
+class EnergiaVidaUtil:
+    """
+    ac_kwh:
+        matriz (años × horas) float32 con la AC final de cada hora.
+    """
+
+    ac_kwh: np.ndarray
+    factores: np.ndarray
+
+    @property
+    def anios(self) -> int:
+        return int(self.ac_kwh.shape[0])
+
+    @property
+    def anual_kwh(self) -> np.ndarray:
+        """
+        (años,) kWh por año.
+        """
+        return self.ac_kwh.sum(axis=1, dtype=np.float64)
+
+    @property
+    def mensual_kwh(self) -> np.ndarray:
+        """
+        (años × 12) kWh por mes y año.
+        """
+        return np.add.reduceat(self.ac_kwh, _inicio_meses(self.ac_kwh.shape[1]), axis=1, dtype=np.float64)
+
+
+def _inicio_meses(n_horas: int) -> np.ndarray:
+
+    if n_horas not in (8760, 8784):
+        raise ValueError("Serie inválida: debe ser 8760 o 8784 horas")
+
+    dias = list(_DIAS_MES)
+
+    if n_horas == 8784:
+        dias[1] = 29
+
+    return np.concatenate(([0], np.cumsum(dias[:-1]))) * 24
+
+
+# ==========================================================
+# SIMULACIÓN
+# ==========================================================
+
+def simular_vida_util(
+    series: SeriesEnergia,
+    cad: ParametrosCadena,
+    degradacion: Optional[ParametrosDegradacion] = None,
+) -> EnergiaVidaUtil:
+    """
+    Matriz AC (años × 8760) a partir de las series del año base.
+
+    En modo sub-horario el clipping de las series ya viene agregado a
+    la hora; el re-clipping horario se corrige con el cociente
+    ac_final / min(ac_sin_clip, límite) del año base para que un año
+    sin degradación reproduzca exactamente la AC final.
+    """
+
+    deg = degradacion or ParametrosDegradacion()
+
+    f = factores_degradacion(deg)
+
+    ac_sin = np.asarray(series.ac_sin_clip_kw, dtype=np.float64)
+    ac_fin = np.asarray(series.ac_final_kw, dtype=np.float64)
+
+    _inicio_meses(len(ac_sin))
+
+    # con perfil de pérdidas AC el límite varía por hora
+    limite = cad.pac_nominal_kw * np.asarray(cad.factores_ac(len(ac_sin)), dtype=np.float64)
+
+    base = np.minimum(ac_sin, limite)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ajuste = np.where(base > 0, ac_fin / base, 0.0)
+
+    # una sola matriz float32; el resto de pasos es in-place
+    m = np.multiply.outer(f.astype(np.float32), ac_sin.astype(np.float32))
+
+    np.minimum(m, limite.astype(np.float32), out=m)
+    m *= ajuste.astype(np.float32)
+
+    return EnergiaVidaUtil(ac_kwh=m, factores=f)
+
+
+def simular_vida_util_mensual(
+    energia_12m: Sequence[float],
+    degradacion: Optional[ParametrosDegradacion] = None,
+) -> np.ndarray:
+    """
+    (años × 12) sin series horarias: escala la energía mensual del
+    año base, sin re-clipping (resultados sin SeriesEnergia).
+    """
+
+    if len(energia_12m) != 12:
+        raise ValueError("energia_12m debe tener 12 valores")
+
+    f = factores_degradacion(degradacion or ParametrosDegradacion())
+
+    return np.multiply.outer(f, np.asarray(energia_12m, dtype=float))
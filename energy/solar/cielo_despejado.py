@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+"""
+MODELOS DE CIELO DESPEJADO — FV Engine
+======================================
+
+Responsabilidad
+---------------
+
+Estimar la irradiancia con cielo despejado a partir de la posición
+solar vectorizada, sobre arrays completos.
+
+Modelos implementados
+---------------------
+
+    ✔ Haurwitz (1945): solo GHI, solo depende del cenit
+
+        GHI_cs = 1098 · cos z · exp(−0.057 / cos z)
+
+    ✔ Ineichen–Perez (2002): GHI / DNI / DHI con turbidez de Linke
+      (escalar o por mes) y altitud del sitio
+
+    ✔ índice de cielo claro kc = GHI / GHI_cs (referencia para el
+      control de calidad de series medidas)
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    zenith_deg, dia_del_anio (arrays), de calcular_posicion_solar_arrays
+
+Salida:
+    irradiancia de cielo despejado (W/m², arrays)
+
+Consumido por:
+    energy.clima.clima_sintetico
+    energy.solar.rendimiento_preliminar
+
+Este módulo NO calcula energía ni depende del clima medido.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .modelo_perez import irradiancia_extraterrestre, masa_de_aire_relativa
+
+
+# valor típico de atmósfera rural limpia / húmeda
+LINKE_DEFECTO = 3.0
+
+# por debajo de este GHI_cs el índice de cielo claro no es fiable
+GHI_CS_MIN_KC_WM2 = 50.0
+
+
+# ==========================================================
+# RESULTADO
+# ==========================================================
+
+@dataclass(frozen=True)
+class IrradianciaCieloDespejado:
+    """
+    Componentes de cielo despejado (W/m²), mismo orden que la entrada.
+    """
+
+    ghi: np.ndarray
+    dni: np.ndarray
+    dhi: np.ndarray
+
+
+# ==========================================================
+# HAURWITZ
+# ==========================================================
+
+def ghi_haurwitz(zenith_deg: np.ndarray) -> np.ndarray:
+    """
+    GHI de cielo despejado (W/m²); 0 con el sol bajo el horizonte.
+    """
+
+    cos_z = np.cos(np.radians(np.asarray(zenith_deg, dtype=float)))
+
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        ghi = 1098.0 * cos_z * np.exp(-0.057 / cos_z)
+
+    return np.where(cos_z > 0, ghi, 0.0)
+
+
+# ==========================================================
+# INEICHEN–PEREZ
+# ==========================================================
+
+def linke_por_paso(
+    linke: Union[float, Sequence[float]],
+    dia_del_anio: np.ndarray,
+) -> np.ndarray:
+    """
+    Turbidez de Linke por paso: escalar o 12 valores mensuales.
+    """
+
+    dia = np.asarray(dia_del_anio, dtype=int)
+
+    if np.ndim(linke) == 0:
+        tl = np.full(dia.shape, float(linke))
+
+    else:
+        mensual = np.asarray(linke, dtype=float)
+
+        if mensual.shape != (12,):
+            raise ValueError("linke debe ser un escalar o 12 valores mensuales")
+
+        # mes de cada día en un año no bisiesto
+        mes = (
+            np.datetime64("2019-01-01") + (dia - 1).astype("timedelta64[D]")
+        ).astype("datetime64[M]").astype(int) % 12
+
+        tl = mensual[mes]
+
+    if (tl <= 0).any():
+        raise ValueError("La turbidez de Linke debe ser > 0")
+
+    return tl
+
+
+def ineichen(
+    zenith_deg: np.ndarray,
+    dia_del_anio: np.ndarray,
+    *,
+    linke: Union[float, Sequence[float]] = LINKE_DEFECTO,
+    altitud_m: float = 0.0,
+) -> IrradianciaCieloDespejado:
+    """
+    Modelo de Ineichen–Perez (2002), con la masa de aire de Kasten &
+    Young corregida por presión. Todo 0 con el sol bajo el horizonte.
+    """
+
+    z = np.asarray(zenith_deg, dtype=float)
+
+    tl = linke_por_paso(linke, dia_del_anio)
+    i0 = irradiancia_extraterrestre(dia_del_anio)
+
+    cos_z = np.cos(np.radians(z))
+    dia_solar = cos_z > 0
+
+    am = np.nan_to_num(masa_de_aire_relativa(z), nan=0.0) * np.exp(-altitud_m / 8434.5)
+
+    fh1 = np.exp(-altitud_m / 8000.0)
+    fh2 = np.exp(-altitud_m / 1250.0)
+
+    cg1 = 5.09e-5 * altitud_m + 0.868
+    cg2 = 3.92e-5 * altitud_m + 0.0387
+
+    ghi = (
+        cg1 * i0 * cos_z
+        * np.exp(-cg2 * am * (fh1 + fh2 * (tl - 1)))
+        * np.exp(0.01 * am ** 1.8)
+    )
+    ghi = np.where(dia_solar, np.maximum(ghi, 0.0), 0.0)
+
+    b = 0.664 + 0.163 / fh1
+
+    dni_1 = b * i0 * np.exp(-0.09 * am * (tl - 1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dni_2 = ghi * (1 - (0.1 - 0.2 * np.exp(-tl)) / (0.1 + 0.882 / fh1)) / cos_z
+
+    dni = np.where(dia_solar, np.clip(np.minimum(dni_1, dni_2), 0.0, None), 0.0)
+
+    dhi = np.maximum(ghi - dni * np.where(dia_solar, cos_z, 0.0), 0.0)
+
+    return IrradianciaCieloDespejado(ghi=ghi, dni=dni, dhi=dhi)
+
+
+# ==========================================================
+# ÍNDICE DE CIELO CLARO
+# ==========================================================
+
+def indice_cielo_claro(
+    ghi: np.ndarray,
+    ghi_cs: np.ndarray,
+    *,
+    ghi_cs_min: float = GHI_CS_MIN_KC_WM2,
+) -> np.ndarray:
+    """
+    kc = GHI / GHI_cs; NaN donde GHI_cs < ghi_cs_min (noche, sol rasante).
+
+    Series medidas con kc persistentemente > ~1.2 o muchas horas
+    diurnas con kc ≈ 0 indican datos desplazados o dañados.
+    """
+
+    ghi = np.asarray(ghi, dtype=float)
+    ghi_cs = np.asarray(ghi_cs, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(ghi_cs >= ghi_cs_min, ghi / ghi_cs, np.nan)
@@ -27,26 +27,31 @@ Modelo implementado
 -------------------
 
     ✔ Modelo isotrópico (Liu & Jordan)
+    ✔ Modelo anisotrópico de Perez (solo en la versión por arrays)
 
-Este modelo es:
+El isotrópico es:
 
     • estable
     • robusto
     • adecuado para simulación inicial
 
-Limitaciones:
+Limitaciones del isotrópico:
 
     • no considera anisotropía del cielo
     • no modela circumsolar explícito
 
+Perez (modelo_perez.py) añade circunsolar y brillo de horizonte.
+
 Frontera del dominio
 --------------------
 
 Entrada:
-    IrradianciaInput
+    IrradianciaInput            (hora a hora)
+    arrays NumPy                (serie completa)
 
 Salida:
     IrradianciaPlano
+    IrradianciaPlanoArrays
 
 Consumido por:
     simulacion_8760 → energy
@@ -61,6 +66,21 @@ Reglas arquitectónicas
 
 from dataclasses import dataclass
 from math import cos, sin, radians
+from typing import Optional
+
+import numpy as np
+
+from .modelo_perez import calcular_difusa_perez
+
+
+# ==========================================================
+# MODELOS DE TRANSPOSICIÓN
+# ==========================================================
+
+MODELO_ISOTROPICO = "isotropico"
+MODELO_PEREZ = "perez"
+
+MODELOS_TRANSPOSICION = (MODELO_ISOTROPICO, MODELO_PEREZ)
 
 
 # ==========================================================
@@ -214,6 +234,150 @@ def calcular_irradiancia_plano(inp: IrradianciaInput) -> IrradianciaPlano:
     )
 
 
+# ==========================================================
+# MOTOR VECTORIZADO (SERIES COMPLETAS)
+# ==========================================================
+
+@dataclass(frozen=True)
+class IrradianciaPlanoArrays:
+    """
+    Resultado POA para una serie completa (W/m² por paso).
+
+    poa_circunsolar es la parte de poa_difusa que llega desde
+    el disco solar (0 en el modelo isotrópico).
+    """
+
+    poa_total: np.ndarray
+    poa_directa: np.ndarray
+    poa_difusa: np.ndarray
+    poa_reflejada: np.ndarray
+    poa_circunsolar: np.ndarray
+    cos_aoi: np.ndarray
+
+
+def cos_aoi_arrays(
+    zenith_deg: np.ndarray,
+    azimuth_deg: np.ndarray,
+    tilt_deg: float,
+    panel_azimuth_deg: float,
+) -> np.ndarray:
+    """
+    Coseno del ángulo de incidencia (recortado a >= 0) por paso.
+    """
+
+    zen = np.radians(zenith_deg)
+    az = np.radians(azimuth_deg)
+
+    tilt = radians(tilt_deg)
+    panel_az = radians(panel_azimuth_deg)
+
+    cos_theta = (
+        np.cos(zen) * cos(tilt)
+        + np.sin(zen) * sin(tilt) * np.cos(az - panel_az)
+    )
+
+    return np.maximum(cos_theta, 0.0)
+
+
+def calcular_irradiancia_plano_arrays(
+    dni: np.ndarray,
+    dhi: np.ndarray,
+    ghi: np.ndarray,
+    zenith_deg: np.ndarray,
+    azimuth_deg: np.ndarray,
+    tilt_deg: float,
+    panel_azimuth_deg: float,
+    *,
+    albedo: float = 0.2,
+    modelo: str = MODELO_ISOTROPICO,
+    dia_del_anio: Optional[np.ndarray] = None,
+    fraccion_sombra_directa: Optional[np.ndarray] = None,
+) -> IrradianciaPlanoArrays:
+    """
+    Calcula la POA de toda la serie en una sola pasada.
+
+    modelo:
+        "isotropico" → mismo resultado que calcular_irradiancia_plano
+        "perez"      → difusa anisotrópica (requiere dia_del_anio)
+
+    fraccion_sombra_directa:
+        fracción [0–1] de la directa bloqueada por paso (sombreado.py).
+        Se aplica a la directa y a la circunsolar.
+    """
+
+    # ------------------------------------------------------
+    # VALIDACIONES
+    # ------------------------------------------------------
+
+    if modelo not in MODELOS_TRANSPOSICION:
+        raise ValueError(f"Modelo de transposición no soportado: {modelo}")
+
+    dni = np.asarray(dni, dtype=float)
+    dhi = np.asarray(dhi, dtype=float)
+    ghi = np.asarray(ghi, dtype=float)
+    zenith_deg = np.asarray(zenith_deg, dtype=float)
+
+    if (dni < 0).any() or (dhi < 0).any() or (ghi < 0).any():
+        raise ValueError("Irradiancia negativa no válida")
+
+    if not (0 <= albedo <= 1):
+        raise ValueError("Albedo fuera de rango [0–1]")
+
+    if modelo == MODELO_PEREZ and dia_del_anio is None:
+        raise ValueError("El modelo de Perez requiere dia_del_anio")
+
+    # ------------------------------------------------------
+    # COMPONENTES
+    # ------------------------------------------------------
+
+    cos_theta = cos_aoi_arrays(
+        zenith_deg, azimuth_deg, tilt_deg, panel_azimuth_deg
+    )
+
+    tilt = radians(tilt_deg)
+
+    poa_directa = np.where(zenith_deg >= 90, 0.0, dni * cos_theta)
+
+    if modelo == MODELO_PEREZ:
+
+        difusa = calcular_difusa_perez(
+            dni, dhi, zenith_deg, cos_theta, tilt_deg, dia_del_anio
+        )
+
+        poa_difusa = difusa.total
+        poa_circunsolar = difusa.circunsolar
+
+    else:
+
+        poa_difusa = dhi * (1 + cos(tilt)) / 2
+        poa_circunsolar = np.zeros_like(poa_difusa)
+
+    poa_reflejada = ghi * albedo * (1 - cos(tilt)) / 2
+
+    # ------------------------------------------------------
+    # SOMBREADO (directa + circunsolar)
+    # ------------------------------------------------------
+
+    if fraccion_sombra_directa is not None:
+
+        pasa = 1.0 - np.clip(fraccion_sombra_directa, 0.0, 1.0)
+
+        poa_directa = poa_directa * pasa
+        poa_difusa = poa_difusa - poa_circunsolar * (1.0 - pasa)
+        poa_circunsolar = poa_circunsolar * pasa
+
+    poa_total = np.maximum(poa_directa + poa_difusa + poa_reflejada, 0.0)
+
+    return IrradianciaPlanoArrays(
+        poa_total=poa_total,
+        poa_directa=poa_directa,
+        poa_difusa=poa_difusa,
+        poa_reflejada=poa_reflejada,
+        poa_circunsolar=poa_circunsolar,
+        cos_aoi=cos_theta,
+    )
+
+
 # ==========================================================
 # ESTRUCTURA DEL DOMINIO
 # ==========================================================
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+"""
+MODELO DE CIELO ANISOTRÓPICO DE PEREZ — FV Engine
+=================================================
+
+Responsabilidad
+---------------
+
+Calcular la irradiancia difusa del cielo sobre un plano inclinado
+con el modelo de Perez (1990), separando:
+
+    • difusa isotrópica
+    • circunsolar
+    • brillo de horizonte
+
+Pipeline representado:
+
+    DHI / DNI / cenit / día del año
+            ↓
+    irradiancia extraterrestre (Spencer)
+            ↓
+    masa de aire (Kasten–Young)
+            ↓
+    claridad ε → bin (1..8)   /   brillo Δ
+            ↓
+    coeficientes F1 / F2 (allsitescomposite1990)
+            ↓
+    difusa en plano
+
+Todo el cálculo trabaja sobre arrays completos (8760 o sub-horario).
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    arrays NumPy (W/m², grados)
+
+Salida:
+    DifusaPerez
+
+Consumido por:
+    irradiancia_plano.calcular_irradiancia_plano_arrays
+
+Reglas arquitectónicas
+----------------------
+
+    ✔ solo geometría + radiación
+    ❌ no calcula energía
+    ❌ no conoce paneles ni inversores
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# ==========================================================
+# CONSTANTES DEL MODELO
+# ==========================================================
+
+CONSTANTE_SOLAR_WM2 = 1367.0
+
+# constante de la expresión de claridad (ángulo cenital en radianes)
+KAPPA = 1.041
+
+# límites superiores de los bins de claridad ε
+BINS_EPSILON = np.array([1.065, 1.230, 1.500, 1.950, 2.800, 4.500, 6.200])
+
+# coeficientes "allsitescomposite1990" — filas = bins 1..8
+# columnas = (f_1, f_2 · Δ, f_3 · z)
+F1_COEF = np.array([
+    [-0.0080,  0.5880, -0.0620],
+    [ 0.1300,  0.6830, -0.1510],
+    [ 0.3300,  0.4870, -0.2210],
+    [ 0.5680,  0.1870, -0.2950],
+    [ 0.8730, -0.3920, -0.3620],
+    [ 1.1320, -1.2370, -0.4120],
+    [ 1.0600, -1.6000, -0.3590],
+    [ 0.6780, -0.3270, -0.2500],
+])
+
+F2_COEF = np.array([
+    [-0.0600,  0.0720, -0.0220],
+    [-0.0190,  0.0660, -0.0290],
+    [ 0.0550, -0.0640, -0.0260],
+    [ 0.1090, -0.1520, -0.0140],
+    [ 0.2260, -0.4620,  0.0010],
+    [ 0.2880, -0.8230,  0.0560],
+    [ 0.2640, -1.1270,  0.1310],
+    [ 0.1560, -1.3770,  0.2510],
+])
+
+# cota inferior de cos(cenit) para el término circunsolar (85°)
+_COS_85 = float(np.cos(np.radians(85.0)))
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class DifusaPerez:
+    """
+    Difusa del cielo sobre el plano (W/m²), por componente.
+    """
+
+    total: np.ndarray
+    isotropica: np.ndarray
+    circunsolar: np.ndarray
+    horizonte: np.ndarray
+
+
+# ==========================================================
+# AUXILIARES FÍSICOS
+# ==========================================================
+
+def irradiancia_extraterrestre(dia_del_anio: np.ndarray) -> np.ndarray:
+    """
+    Irradiancia extraterrestre normal (Spencer, 1971) en W/m².
+    """
+
+    b = 2 * np.pi * np.asarray(dia_del_anio, dtype=float) / 365.0
+
+    factor = (
+        1.00011
+        + 0.034221 * np.cos(b)
+        + 0.00128 * np.sin(b)
+        + 0.000719 * np.cos(2 * b)
+        + 0.000077 * np.sin(2 * b)
+    )
+
+    return CONSTANTE_SOLAR_WM2 * factor
+
+
+def masa_de_aire_relativa(zenith_deg: np.ndarray) -> np.ndarray:
+    """
+    Masa de aire relativa (Kasten & Young, 1989).
+
+    Devuelve NaN con el sol bajo el horizonte.
+    """
+
+    z = np.asarray(zenith_deg, dtype=float)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        am = 1.0 / (
+            np.cos(np.radians(z))
+            + 0.50572 * (96.07995 - z) ** -1.6364
+        )
+
+    return np.where(z < 90, am, np.nan)
+
+
+# ==========================================================
+# MOTOR PRINCIPAL
+# ==========================================================
+
+def calcular_difusa_perez(
+    dni: np.ndarray,
+    dhi: np.ndarray,
+    zenith_deg: np.ndarray,
+    cos_aoi: np.ndarray,
+    tilt_deg: float,
+    dia_del_anio: np.ndarray,
+) -> DifusaPerez:
+    """
+    Difusa en plano con el modelo de Perez.
+
+    cos_aoi:
+        coseno del ángulo de incidencia ya recortado a >= 0.
+
+    Con el sol bajo el horizonte (o DHI nula) el modelo no está
+    definido; en esas horas se usa el término isotrópico.
+    """
+
+    dni = np.asarray(dni, dtype=float)
+    dhi = np.asarray(dhi, dtype=float)
+    z_deg = np.asarray(zenith_deg, dtype=float)
+
+    tilt = np.radians(tilt_deg)
+    iso_factor = (1 + np.cos(tilt)) / 2
+
+    valido = (z_deg < 90) & (dhi > 0)
+
+    z = np.radians(np.where(valido, z_deg, 0.0))
+    dhi_v = np.where(valido, dhi, 1.0)
+
+    # ------------------------------------------------------
+    # CLARIDAD ε Y BRILLO Δ
+    # ------------------------------------------------------
+
+    kz3 = KAPPA * z ** 3
+
+    epsilon = ((dhi_v + dni) / dhi_v + kz3) / (1 + kz3)
+
+    am = np.where(valido, masa_de_aire_relativa(z_deg), 0.0)
+
+    delta = dhi_v * am / irradiancia_extraterrestre(dia_del_anio)
+
+    idx = np.searchsorted(BINS_EPSILON, epsilon, side="left")
+
+    # ------------------------------------------------------
+    # COEFICIENTES F1 / F2
+    # ------------------------------------------------------
+
+    f1 = F1_COEF[idx]
+    f2 = F2_COEF[idx]
+
+    F1 = np.maximum(0.0, f1[:, 0] + f1[:, 1] * delta + f1[:, 2] * z)
+    F2 = f2[:, 0] + f2[:, 1] * delta + f2[:, 2] * z
+
+    # ------------------------------------------------------
+    # COMPONENTES
+    # ------------------------------------------------------
+
+    a = np.maximum(np.asarray(cos_aoi, dtype=float), 0.0)
+    b = np.maximum(_COS_85, np.cos(z))
+
+    isotropica = np.where(valido, dhi * (1 - F1) * iso_factor, dhi * iso_factor)
+    circunsolar = np.where(valido, dhi * F1 * a / b, 0.0)
+    horizonte = np.where(valido, dhi * F2 * np.sin(tilt), 0.0)
+
+    total = np.maximum(isotropica + circunsolar + horizonte, 0.0)
+
+    return DifusaPerez(
+        total=total,
+        isotropica=isotropica,
+        circunsolar=circunsolar,
+        horizonte=horizonte,
+    )
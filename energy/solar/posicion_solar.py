@@ -41,6 +41,9 @@ Este módulo NO calcula energía.
 from dataclasses import dataclass
 from datetime import datetime
 from math import sin, cos, asin, acos, radians, degrees
+from typing import Sequence
+
+import numpy as np
 
 
 # ==========================================================
@@ -183,6 +186,111 @@ def calcular_posicion_solar(inp: SolarInput) -> SolarPosition:
     )
 
 
+# ==========================================================
+# MOTOR VECTORIZADO (SERIES COMPLETAS)
+# ==========================================================
+
+@dataclass(frozen=True)
+class SolarPositionArrays:
+    """
+    Posición solar para una serie completa (mismo orden que la entrada).
+
+    Todos los campos son np.ndarray en grados.
+    """
+
+    azimuth_deg: np.ndarray
+    elevation_deg: np.ndarray
+    zenith_deg: np.ndarray
+    declination_deg: np.ndarray
+    hour_angle_deg: np.ndarray
+
+
+def calendario_desde_timestamps(
+    timestamps: Sequence[datetime],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte timestamps en (día del año, hora decimal) como arrays.
+    """
+
+    ts = np.asarray(timestamps, dtype="datetime64[s]")
+
+    dia = (
+        ts.astype("datetime64[D]") - ts.astype("datetime64[Y]")
+    ).astype(np.int64) + 1
+
+    hora = (
+        ts - ts.astype("datetime64[D]")
+    ).astype(np.int64) / 3600.0
+
+    return dia, hora
+
+
+def calcular_posicion_solar_arrays(
+    latitud_deg: float,
+    longitud_deg: float,
+    dia_del_anio: np.ndarray,
+    hora_decimal: np.ndarray,
+) -> SolarPositionArrays:
+    """
+    Versión vectorizada de calcular_posicion_solar.
+
+    Mismas ecuaciones (ecuación del tiempo + corrección por longitud)
+    evaluadas sobre arrays completos en una sola pasada.
+    """
+
+    dia = np.asarray(dia_del_anio, dtype=float)
+    hora = np.asarray(hora_decimal, dtype=float)
+
+    B = np.radians((360 / 365) * (dia - 81))
+
+    eot = 9.87 * np.sin(2 * B) - 7.53 * np.cos(B) - 1.5 * np.sin(B)
+
+    hora_solar = hora + (eot / 60) + (longitud_deg / 15)
+
+    decl = 23.45 * np.sin(np.radians(360 * (284 + dia) / 365))
+
+    hour_angle = 15 * (hora_solar - 12)
+
+    lat_r = radians(latitud_deg)
+    decl_r = np.radians(decl)
+    h_r = np.radians(hour_angle)
+
+    sin_elev = (
+        sin(lat_r) * np.sin(decl_r)
+        + cos(lat_r) * np.cos(decl_r) * np.cos(h_r)
+    )
+
+    sin_elev = np.clip(sin_elev, -1.0, 1.0)
+
+    elevation = np.arcsin(sin_elev)
+    elevation_deg = np.degrees(elevation)
+
+    zenith_deg = 90 - elevation_deg
+
+    # ------------------------------------------------------
+    # AZIMUT (sol bajo el horizonte → 0, igual que el unitario)
+    # ------------------------------------------------------
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_az = (
+            np.sin(decl_r) - sin_elev * sin(lat_r)
+        ) / (np.cos(elevation) * cos(lat_r))
+
+    cos_az = np.clip(np.nan_to_num(cos_az, nan=1.0), -1.0, 1.0)
+
+    azimuth_deg = np.degrees(np.arccos(cos_az))
+    azimuth_deg = np.where(hour_angle > 0, 360 - azimuth_deg, azimuth_deg)
+    azimuth_deg = np.where(elevation_deg <= 0, 0.0, azimuth_deg)
+
+    return SolarPositionArrays(
+        azimuth_deg=azimuth_deg,
+        elevation_deg=elevation_deg,
+        zenith_deg=zenith_deg,
+        declination_deg=decl,
+        hour_angle_deg=hour_angle,
+    )
+
+
 # ==========================================================
 # ESTRUCTURA DEL DOMINIO
 # ==========================================================
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+"""
+RENDIMIENTO PRELIMINAR (SIN CLIMA MEDIDO) — FV Engine
+=====================================================
+
+Responsabilidad
+---------------
+
+Estimar en milisegundos la producción específica (kWh/kWp) de un
+sitio antes de tener datos de PVGIS, para el dimensionamiento
+preliminar.
+
+Pipeline representado:
+
+    (lat, lon) → 8760 pasos (centro de cada hora UTC)
+        ↓
+    posición solar (arrays)
+        ↓
+    cielo despejado Ineichen–Perez (Linke escalar o mensual)
+        ↓
+    POA isotrópica en el plano
+        ↓
+    × fracción cielo real / cielo despejado × PR
+        ↓
+    kWh/kWp anual y mensual
+
+Reglas
+------
+
+    ✔ totalmente vectorizado, sin red
+    ✔ mismo modelo de transposición que el motor (isotrópico)
+    ❌ no sustituye a la simulación 8760 con clima medido
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    lat, lon, orientación, parámetros del cielo
+
+Salida:
+    RendimientoPreliminar
+
+Consumido por:
+    core.servicios.sizing (modo "cobertura")
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from .cielo_despejado import LINKE_DEFECTO, ineichen
+from .irradiancia_plano import calcular_irradiancia_plano_arrays
+from .posicion_solar import calcular_posicion_solar_arrays
+
+
+# cociente típico entre la irradiación anual real y la de cielo
+# despejado (nubosidad media); ~0.65 en climas nublados, ~0.85 en desiertos
+FRACCION_CIELO_REAL = 0.75
+
+PR_DEFECTO = 0.80
+
+
+# ==========================================================
+# RESULTADO
+# ==========================================================
+
+@dataclass(frozen=True)
+class RendimientoPreliminar:
+
+    kwh_kwp_anual: float
+    kwh_kwp_12m: Tuple[float, ...]
+
+    # irradiación en el plano con cielo despejado (kWh/m²·año)
+    poa_cielo_despejado_kwh_m2: float
+
+
+# ==========================================================
+# CALENDARIO
+# ==========================================================
+
+@lru_cache(maxsize=1)
+def _calendario_8760() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (día del año, hora UTC al centro del paso, mes 0–11) de un año no bisiesto.
+    """
+
+    h = np.arange(8760)
+
+    dia = h // 24 + 1
+    hora = (h % 24) + 0.5
+
+    mes = (
+        np.datetime64("2019-01-01") + (dia - 1).astype("timedelta64[D]")
+    ).astype("datetime64[M]").astype(int) % 12
+
+    for a in (dia, hora, mes):
+        a.setflags(write=False)
+
+    return dia, hora, mes
+
+
+# ==========================================================
+# API
+# ==========================================================
+
+def estimar_rendimiento_preliminar(
+    lat: float,
+    lon: float,
+    *,
+    tilt_deg: float = 15.0,
+    azimut_deg: float = 180.0,
+    linke: Union[float, Sequence[float]] = LINKE_DEFECTO,
+    altitud_m: float = 0.0,
+    fraccion_cielo_real: float = FRACCION_CIELO_REAL,
+    pr: float = PR_DEFECTO,
+    albedo: float = 0.2,
+) -> RendimientoPreliminar:
+    """
+    Producción específica estimada a partir del cielo despejado.
+    """
+
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("Coordenadas fuera de rango")
+
+    if not (0 < fraccion_cielo_real <= 1) or not (0 < pr <= 1):
+        raise ValueError("fraccion_cielo_real y pr deben estar en (0, 1]")
+
+    dia, hora, mes = _calendario_8760()
+
+    pos = calcular_posicion_solar_arrays(lat, lon, dia, hora)
+
+    cs = ineichen(pos.zenith_deg, dia, linke=linke, altitud_m=altitud_m)
+
+    poa = calcular_irradiancia_plano_arrays(
+        cs.dni,
+        cs.dhi,
+        cs.ghi,
+        pos.zenith_deg,
+        pos.azimuth_deg,
+        tilt_deg,
+        azimut_deg,
+        albedo=albedo,
+    ).poa_total
+
+    poa_12m = np.bincount(mes, weights=poa, minlength=12) / 1000.0
+
+    kwh_kwp_12m = poa_12m * fraccion_cielo_real * pr
+
+    return RendimientoPreliminar(
+        kwh_kwp_anual=float(kwh_kwp_12m.sum()),
+        kwh_kwp_12m=tuple(float(x) for x in kwh_kwp_12m),
+        poa_cielo_despejado_kwh_m2=float(poa_12m.sum()),
+    )
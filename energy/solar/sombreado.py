@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+"""
+MÁSCARA DE SOMBREADO (HORIZONTE + OBSTÁCULOS) — FV Engine
+=========================================================
+
+Responsabilidad
+---------------
+
+Calcular qué fracción de la componente directa (y circunsolar)
+llega bloqueada por el horizonte lejano u obstáculos cercanos,
+para cualquier posición del sol.
+
+Pipeline representado:
+
+    perfil de horizonte (azimut → elevación)
+    y/o obstáculos simples (muro, edificio, árbol)
+            ↓
+    tabla azimut × elevación → fracción de sombra directa
+    (precalculada una vez por sitio, con submuestreo por celda)
+            ↓
+    consulta vectorizada para toda la serie (8760 o sub-horaria)
+
+Convención angular
+------------------
+
+    azimut:     0 = norte, 90 = este, 180 = sur (igual que posicion_solar)
+    elevación:  grados sobre el horizonte
+
+Nota:
+    PVGIS ya aplica el horizonte del terreno lejano (usehorizon=1).
+    Esta máscara está pensada para obstrucciones locales del sitio
+    que PVGIS no conoce.
+
+Frontera del dominio
+--------------------
+
+Entrada:
+    PerfilHorizonte / Obstaculo
+
+Salida:
+    MascaraSombreado
+
+Consumido por:
+    simulacion_8760 → irradiancia_plano (arrays)
+
+Reglas arquitectónicas
+----------------------
+
+    ✔ solo geometría
+    ✔ cache por geometría del sitio (lru_cache)
+    ❌ no calcula energía
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import atan, degrees
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# ==========================================================
+# CONFIGURACIÓN
+# ==========================================================
+
+PASO_AZIMUT_DEG = 2.0
+PASO_ELEVACION_DEG = 1.0
+
+# submuestras por eje dentro de cada celda (bordes suaves)
+SUBMUESTRAS = 4
+
+
+# ==========================================================
+# MODELOS DE DATOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class PerfilHorizonte:
+    """
+    Perfil de horizonte: elevación del horizonte por azimut.
+
+    Los puntos se interpolan linealmente y de forma circular
+    (el último punto conecta con el primero a través del norte).
+    """
+
+    azimuts_deg: Tuple[float, ...]
+    elevaciones_deg: Tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class Obstaculo:
+    """
+    Obstáculo simple visto desde el generador.
+
+    Se modela como un bloque de altura relativa `altura_m`
+    (sobre el plano de los módulos) a `distancia_m`, que ocupa
+    `ancho_deg` grados de azimut centrados en `azimut_deg`.
+
+    transmitancia:
+        0 → opaco (muro, edificio)
+        >0 → semitransparente (vegetación)
+    """
+
+    azimut_deg: float
+    ancho_deg: float
+    altura_m: float
+    distancia_m: float
+    transmitancia: float = 0.0
+
+    @property
+    def elevacion_deg(self) -> float:
+        return degrees(atan(self.altura_m / self.distancia_m))
+
+
+@dataclass(frozen=True)
+class MascaraSombreado:
+    """
+    Tabla de fracción de sombra directa por celda (azimut, elevación).
+
+    tabla[i_az, i_el] ∈ [0, 1]
+    """
+
+    paso_az_deg: float
+    paso_el_deg: float
+    tabla: np.ndarray
+
+    def fraccion_sombra(
+        self,
+        azimuth_deg: np.ndarray,
+        elevation_deg: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Fracción de la directa bloqueada para cada posición solar.
+
+        Sol bajo el horizonte → 0 (no hay directa que bloquear).
+        """
+
+        az = np.mod(np.asarray(azimuth_deg, dtype=float), 360.0)
+        el = np.asarray(elevation_deg, dtype=float)
+
+        n_az, n_el = self.tabla.shape
+
+        i_az = np.minimum((az / self.paso_az_deg).astype(np.intp), n_az - 1)
+        i_el = np.clip((el / self.paso_el_deg).astype(np.intp), 0, n_el - 1)
+
+        return np.where(el > 0, self.tabla[i_az, i_el], 0.0)
+
+
+# ==========================================================
+# VALIDACIÓN
+# ==========================================================
+
+def _validar_perfil(perfil: PerfilHorizonte) -> None:
+
+    if len(perfil.azimuts_deg) != len(perfil.elevaciones_deg):
+        raise ValueError("Perfil de horizonte: longitudes distintas")
+
+    if len(perfil.azimuts_deg) < 2:
+        raise ValueError("Perfil de horizonte: se requieren al menos 2 puntos")
+
+    if any(not (0 <= e < 90) for e in perfil.elevaciones_deg):
+        raise ValueError("Perfil de horizonte: elevación fuera de [0, 90)")
+
+
+def _validar_obstaculo(o: Obstaculo) -> None:
+
+    if o.distancia_m <= 0:
+        raise ValueError("Obstáculo: distancia_m debe ser > 0")
+
+    if o.altura_m < 0:
+        raise ValueError("Obstáculo: altura_m no puede ser negativa")
+
+    if not (0 < o.ancho_deg <= 360):
+        raise ValueError("Obstáculo: ancho_deg fuera de (0, 360]")
+
+    if not (0 <= o.transmitancia <= 1):
+        raise ValueError("Obstáculo: transmitancia fuera de [0, 1]")
+
+
+# ==========================================================
+# GEOMETRÍA
+# ==========================================================
+
+def _horizonte_en(perfil: PerfilHorizonte, az: np.ndarray) -> np.ndarray:
+    """
+    Elevación del horizonte interpolada circularmente.
+    """
+
+    azs = np.mod(np.asarray(perfil.azimuts_deg, dtype=float), 360.0)
+    els = np.asarray(perfil.elevaciones_deg, dtype=float)
+
+    orden = np.argsort(azs)
+
+    return np.interp(az, azs[orden], els[orden], period=360.0)
+
+
+def _sombra_obstaculo(o: Obstaculo, az: np.ndarray, el: np.ndarray) -> np.ndarray:
+    """
+    Fracción bloqueada por un obstáculo en cada punto (az, el).
+    """
+
+    diff = np.abs((az - o.azimut_deg + 180.0) % 360.0 - 180.0)
+
+    dentro = (diff <= o.ancho_deg / 2) & (el < o.elevacion_deg)
+
+    return np.where(dentro, 1.0 - o.transmitancia, 0.0)
+
+
+# ==========================================================
+# CONSTRUCCIÓN DE LA TABLA
+# ==========================================================
+
+def construir_mascara(
+    perfil: Optional[PerfilHorizonte] = None,
+    obstaculos: Sequence[Obstaculo] = (),
+    *,
+    paso_az_deg: float = PASO_AZIMUT_DEG,
+    paso_el_deg: float = PASO_ELEVACION_DEG,
+    submuestras: int = SUBMUESTRAS,
+) -> MascaraSombreado:
+    """
+    Precalcula la tabla azimut × elevación → fracción de sombra.
+
+    Cada celda se evalúa en submuestras × submuestras puntos, así
+    los bordes del horizonte producen fracciones parciales en vez
+    de escalones de un bin completo.
+    """
+
+    if paso_az_deg <= 0 or paso_el_deg <= 0:
+        raise ValueError("Pasos de la máscara deben ser > 0")
+
+    if submuestras < 1:
+        raise ValueError("submuestras debe ser >= 1")
+
+    if perfil is not None:
+        _validar_perfil(perfil)
+
+    for o in obstaculos:
+        _validar_obstaculo(o)
+
+    n_az = int(np.ceil(360.0 / paso_az_deg))
+    n_el = int(np.ceil(90.0 / paso_el_deg))
+
+    # puntos de submuestreo (centrados dentro de cada celda)
+    off = (np.arange(submuestras) + 0.5) / submuestras
+
+    az = ((np.arange(n_az)[:, None] + off[None, :]) * paso_az_deg).ravel()
+    el = ((np.arange(n_el)[:, None] + off[None, :]) * paso_el_deg).ravel()
+
+    AZ, EL = np.meshgrid(az, el, indexing="ij")
+
+    # fracción de luz que pasa (producto de transmitancias)
+    pasa = np.ones_like(AZ)
+
+    if perfil is not None:
+        pasa *= (EL >= _horizonte_en(perfil, AZ)).astype(float)
+
+    for o in obstaculos:
+        pasa *= 1.0 - _sombra_obstaculo(o, AZ, EL)
+
+    sombra = 1.0 - pasa
+
+    tabla = sombra.reshape(n_az, submuestras, n_el, submuestras).mean(axis=(1, 3))
+
+    return MascaraSombreado(
+        paso_az_deg=paso_az_deg,
+        paso_el_deg=paso_el_deg,
+        tabla=tabla,
+    )
+
+
+# ==========================================================
+# CACHE POR SITIO
+# ==========================================================
+
+@lru_cache(maxsize=64)
+def _mascara_cacheada(
+    perfil: Optional[PerfilHorizonte],
+    obstaculos: Tuple[Obstaculo, ...],
+    paso_az_deg: float,
+    paso_el_deg: float,
+) -> MascaraSombreado:
+
+    mascara = construir_mascara(
+        perfil,
+        obstaculos,
+        paso_az_deg=paso_az_deg,
+        paso_el_deg=paso_el_deg,
+    )
+
+    # la tabla se comparte entre estudios → solo lectura
+    mascara.tabla.setflags(write=False)
+
+    return mascara
+
+
+def obtener_mascara(
+    perfil: Optional[PerfilHorizonte] = None,
+    obstaculos: Iterable[Obstaculo] = (),
+    *,
+    paso_az_deg: float = PASO_AZIMUT_DEG,
+    paso_el_deg: float = PASO_ELEVACION_DEG,
+) -> Optional[MascaraSombreado]:
+    """
+    Devuelve la máscara del sitio, construyéndola solo la primera vez.
+
+    La clave de cache es la geometría del sitio (perfil + obstáculos);
+    estudios repetidos sobre el mismo sitio solo pagan la consulta.
+
+    Retorna None si no hay ninguna obstrucción definida.
+    """
+
+    obstaculos = tuple(obstaculos)
+
+    if perfil is None and not obstaculos:
+        return None
+
+    return _mascara_cacheada(
+        perfil,
+        obstaculos,
+        float(paso_az_deg),
+        float(paso_el_deg),
+    )
+
+
+def limpiar_cache_mascaras() -> None:
+    _mascara_cacheada.cache_clear()
+
+
+# ==========================================================
+# ADAPTER (dict de proyecto → geometría)
+# ==========================================================
+
+def mascara_desde_dict(cfg: Optional[Dict[str, Any]]) -> Optional[MascaraSombreado]:
+    """
+    Construye (o recupera de cache) la máscara desde la configuración
+    de sombreado del proyecto:
+
+        {
+            "horizonte": [[az, el], ...],
+            "obstaculos": [
+                {"azimut_deg", "ancho_deg", "altura_m",
+                 "distancia_m", "transmitancia"?}, ...
+            ],
+        }
+    """
+
+    if not cfg:
+        return None
+
+    puntos = cfg.get("horizonte") or []
+
+    perfil = None
+
+    if puntos:
+        perfil = PerfilHorizonte(
+            azimuts_deg=tuple(float(p[0]) for p in puntos),
+            elevaciones_deg=tuple(float(p[1]) for p in puntos),
+        )
+
+    obstaculos = tuple(
+        Obstaculo(
+            azimut_deg=float(o["azimut_deg"]),
+            ancho_deg=float(o["ancho_deg"]),
+            altura_m=float(o["altura_m"]),
+            distancia_m=float(o["distancia_m"]),
+            transmitancia=float(o.get("transmitancia", 0.0)),
+        )
+        for o in (cfg.get("obstaculos") or [])
+    )
+
+    return obtener_mascara(perfil, obstaculos)
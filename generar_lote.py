@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+"""
+GENERACIÓN MASIVA DE PROPUESTAS (SIN UI)
+FV Engine
+
+Responsabilidad
+---------------
+
+Regenerar propuestas PDF para listas completas de clientes:
+
+    directorio de *.json  ─┐
+                           ├→ Datosproyecto por proyecto
+    CSV (una fila/proy.) ──┘
+            ↓
+    pool de procesos (un proyecto por tarea)
+            ↓
+    estudio → artefactos → PDF
+            ↓
+    <salida>/<id>/reporte_evaluacion_fv.pdf
+    <salida>/<id>/resultado.fvr          (ResultadoProyecto binario)
+    <salida>/manifiesto.json
+
+Uso
+---
+
+    python generar_lote.py proyectos/ --salida salidas_lote --workers 4
+    python generar_lote.py clientes.csv --salida salidas_lote
+    python generar_lote.py proyectos/ --almacen cache/estudios.sqlite
+
+Recursos compartidos
+--------------------
+
+    ✔ por proceso worker (inicializador):
+        dependencias del estudio, paleta y estilos PDF,
+        catálogos (lru_cache de electrical.catalogos)
+    ✔ entre procesos (disco, escritura atómica):
+        cache de clima PVGIS, cache de imágenes (cache/charts)
+
+Reanudación
+-----------
+
+Un PDF se publica con os.replace al terminar; si ya existe, el
+proyecto se omite (--forzar para regenerar). Tras una caída basta
+con relanzar el mismo comando.
+
+Formato de entrada
+------------------
+
+Cada proyecto es un dict con los campos de Datosproyecto y un "id"
+opcional (por defecto: nombre del archivo o número de fila). En CSV,
+las columnas de listas/dicts (consumo_12m, equipos, sistema_fv,
+electrico, ...) van como JSON.
+"""
+
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, fields
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.dominio.modelo import Datosproyecto
+
+
+NOMBRE_PDF = "reporte_evaluacion_fv.pdf"
+
+NOMBRE_MANIFIESTO = "manifiesto.json"
+
+# ResultadoProyecto completo (core.aplicacion.serializacion_resultado)
+NOMBRE_RESULTADO = "resultado.fvr"
+
+# estudios por transacción al volcar al almacén SQLite
+LOTE_ALMACEN = 25
+
+
+# ==========================================================
+# MODELOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class ProyectoLote:
+
+    id: str
+    campos: Dict[str, Any]
+    origen: str
+
+
+# ==========================================================
+# LECTURA DE ENTRADAS
+# ==========================================================
+
+_TIPOS_SIMPLES = {"str": str, "float": float, "int": int}
+
+
+def _id_seguro(texto: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", str(texto)).strip("_") or "proyecto"
+
+
+def _convertir_celda(valor: str, tipo: str) -> Any:
+
+    if tipo in _TIPOS_SIMPLES:
+        return _TIPOS_SIMPLES[tipo](valor)
+
+    return json.loads(valor)
+
+
+def _campos_desde_fila(fila: Dict[str, str]) -> Dict[str, Any]:
+
+    tipos = {f.name: str(f.type) for f in fields(Datosproyecto)}
+
+    campos: Dict[str, Any] = {}
+
+    for k, v in fila.items():
+
+        if k == "id" or v is None or str(v).strip() == "":
+            continue
+
+        if k not in tipos:
+            raise ValueError(f"Columna desconocida: {k}")
+
+        campos[k] = _convertir_celda(str(v).strip(), tipos[k])
+
+    return campos
+
+
+def leer_proyectos(entrada: str | Path) -> List[ProyectoLote]:
+    """
+    Directorio de *.json (uno por proyecto) o un CSV.
+    """
+
+    entrada = Path(entrada)
+
+    proyectos: List[ProyectoLote] = []
+
+    if entrada.is_dir():
+
+        for f in sorted(entrada.glob("*.json")):
+
+            campos = json.loads(f.read_text(encoding="utf-8"))
+
+            if not isinstance(campos, dict):
+                raise ValueError(f"{f.name}: se esperaba un objeto JSON")
+
+            campos = dict(campos)
+            pid = campos.pop("id", None) or f.stem
+
+            proyectos.append(ProyectoLote(_id_seguro(pid), campos, str(f)))
+
+    elif entrada.suffix.lower() == ".csv":
+
+        with entrada.open(newline="", encoding="utf-8-sig") as fh:
+
+            for i, fila in enumerate(csv.DictReader(fh), start=1):
+
+                pid = fila.get("id") or f"fila_{i:04d}"
+
+                proyectos.append(ProyectoLote(
+                    _id_seguro(pid),
+                    _campos_desde_fila(fila),
+                    f"{entrada}:{i}",
+                ))
+
+    else:
+        raise ValueError(f"Entrada no soportada: {entrada} (directorio o .csv)")
+
+    ids = [p.id for p in proyectos]
+    repetidos = sorted({x for x in ids if ids.count(x) > 1})
+
+    if repetidos:
+        raise ValueError(f"ids de proyecto repetidos: {repetidos}")
+
+    return proyectos
+
+
+# ==========================================================
+# WORKER
+# ==========================================================
+
+_recursos: Dict[str, Any] = {}
+
+
+def _inicializar_worker() -> None:
+    """
+    Recursos reutilizados por todos los proyectos del proceso.
+    """
+
+    import reportes.render_imagenes as render_imagenes
+    from core.aplicacion.dependencias import construir_dependencias
+    from reportes.styles import pdf_palette, pdf_styles
+
+    # el paralelismo ya es por proyecto: sin pool anidado de imágenes
+    render_imagenes.MAX_PROCESOS = 1
+
+    _recursos["deps"] = construir_dependencias()
+    _recursos["pal"] = pdf_palette()
+    _recursos["styles"] = pdf_styles()
+
+
+def _procesar_proyecto(proyecto: ProyectoLote, salida: str, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Estudio + artefactos + PDF de un proyecto.
+
+    Nunca lanza: el error queda en la entrada del manifiesto.
+    """
+
+    from core.aplicacion.orquestador_estudio import ejecutar_estudio
+    from core.aplicacion.serializacion_resultado import guardar_resultado
+    from reportes.generar_pdf_profesional import generar_pdf_profesional
+    from reportes.imagenes import generar_artefactos
+
+    if not _recursos:
+        _inicializar_worker()
+
+    out_dir = Path(salida) / proyecto.id
+    pdf_final = out_dir / NOMBRE_PDF
+
+    entrada: Dict[str, Any] = {
+        "id": proyecto.id,
+        "origen": proyecto.origen,
+        "estado": "error",
+        "pdf": None,
+        "error": None,
+    }
+
+    t0 = time.perf_counter()
+
+    salida_consola = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+    try:
+        with salida_consola:
+
+            datos = Datosproyecto(**proyecto.campos)
+
+            resultado = ejecutar_estudio(datos, _recursos["deps"])
+
+            if not resultado.ok:
+                raise ValueError("; ".join(map(str, resultado.errores)) or "estudio no ok")
+
+            paths = generar_artefactos(res=resultado, out_dir=out_dir)
+
+            tmp = out_dir / f"{pdf_final.stem}.{os.getpid()}.tmp.pdf"
+            paths["pdf_path"] = str(tmp)
+
+            generar_pdf_profesional(
+                resultado,
+                dict(datos.__dict__),
+                paths,
+                pal=_recursos["pal"],
+                styles=_recursos["styles"],
+            )
+
+            # antes del PDF: un PDF publicado implica resultado guardado
+            guardar_resultado(resultado, out_dir / NOMBRE_RESULTADO)
+
+            os.replace(tmp, pdf_final)
+
+        entrada.update(
+            estado="ok",
+            pdf=str(pdf_final),
+            resultado=str(out_dir / NOMBRE_RESULTADO),
+            tiempos_bloques_s=paths.get("tiempos_bloques_s"),
+        )
+
+    except Exception as e:
+        entrada["error"] = f"{type(e).__name__}: {e}"
+
+    entrada["segundos"] = round(time.perf_counter() - t0, 3)
+
+    return entrada
+
+
+# ==========================================================
+# MANIFIESTO
+# ==========================================================
+
+def _escribir_manifiesto(salida: Path, entradas: List[Dict[str, Any]]) -> None:
+
+    conteo = {
+        estado: sum(1 for e in entradas if e["estado"] == estado)
+        for estado in ("ok", "omitido", "error")
+    }
+
+    payload = {
+        "generado": datetime.now().isoformat(timespec="seconds"),
+        "total": len(entradas),
+        **conteo,
+        "proyectos": sorted(entradas, key=lambda e: e["id"]),
+    }
+
+    path = salida / NOMBRE_MANIFIESTO
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    os.replace(tmp, path)
+
+
+def _registro_almacen(proyecto: ProyectoLote, path_resultado: str):
+    """
+    RegistroEstudio de un proyecto terminado (resultado leído del .fvr).
+
+    La huella es (id, campos de entrada): relanzar con --forzar
+    reemplaza el estudio en lugar de duplicarlo.
+    """
+
+    from core.aplicacion.almacen_resultados import RegistroEstudio
+    from core.aplicacion.serializacion_resultado import cargar_resultado
+
+    campos = json.dumps([proyecto.id, proyecto.campos], sort_keys=True, ensure_ascii=False, default=str)
+
+    return RegistroEstudio(
+        datos=Datosproyecto(**proyecto.campos),
+        resultado=cargar_resultado(path_resultado),
+        proyecto_id=proyecto.id,
+        huella=hashlib.sha256(campos.encode("utf-8")).hexdigest(),
+    )
+
+
+# ==========================================================
+# API
+# ==========================================================
+
+def generar_lote(
+    entrada: str | Path,
+    salida: str | Path = "salidas_lote",
+    *,
+    workers: Optional[int] = None,
+    forzar: bool = False,
+    verbose: bool = False,
+    almacen: str | Path | None = None,
+) -> Dict[str, Any]:
+    """
+    Genera los PDFs pendientes y devuelve el manifiesto.
+
+    almacen:
+        ruta SQLite (core.aplicacion.almacen_resultados); los
+        estudios terminados se insertan por lotes de LOTE_ALMACEN.
+    """
+
+    salida = Path(salida)
+    salida.mkdir(parents=True, exist_ok=True)
+
+    proyectos = leer_proyectos(entrada)
+
+    entradas: List[Dict[str, Any]] = []
+    pendientes: List[ProyectoLote] = []
+
+    for p in proyectos:
+
+        pdf = salida / p.id / NOMBRE_PDF
+
+        if pdf.exists() and not forzar:
+            entradas.append({
+                "id": p.id,
+                "origen": p.origen,
+                "estado": "omitido",
+                "pdf": str(pdf),
+                "error": None,
+            })
+        else:
+            pendientes.append(p)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pendientes) or 1))
+
+    por_id = {p.id: p for p in pendientes}
+
+    alm = None
+    cola_almacen: List[Any] = []
+
+    if almacen:
+        from core.aplicacion.almacen_resultados import AlmacenResultados
+
+        alm = AlmacenResultados(almacen)
+
+    def _volcar_almacen() -> None:
+
+        if alm is not None and cola_almacen:
+            alm.guardar_lote(cola_almacen)
+            cola_almacen.clear()
+
+    def _registrar(e: Dict[str, Any]) -> None:
+
+        entradas.append(e)
+        _escribir_manifiesto(salida, entradas)
+
+        if alm is not None and e["estado"] == "ok":
+
+            cola_almacen.append(_registro_almacen(por_id[e["id"]], e["resultado"]))
+
+            if len(cola_almacen) >= LOTE_ALMACEN:
+                _volcar_almacen()
+
+        print(f"[{len(entradas)}/{len(proyectos)}] {e['id']}: {e['estado']}"
+              + (f" ({e['error']})" if e["error"] else ""))
+
+    _escribir_manifiesto(salida, entradas)
+
+    if workers == 1:
+
+        for p in pendientes:
+            _registrar(_procesar_proyecto(p, str(salida), verbose))
+
+    else:
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_inicializar_worker,
+        ) as ex:
+
+            futuros = {ex.submit(_procesar_proyecto, p, str(salida), verbose): p for p in pendientes}
+
+            for fut in as_completed(futuros):
+
+                p = futuros[fut]
+
+                try:
+                    _registrar(fut.result())
+                except BrokenProcessPool as e:
+                    _registrar({
+                        "id": p.id,
+                        "origen": p.origen,
+                        "estado": "error",
+                        "pdf": None,
+                        "error": f"BrokenProcessPool: {e}",
+                    })
+
+    _volcar_almacen()
+
+    return json.loads((salida / NOMBRE_MANIFIESTO).read_text(encoding="utf-8"))
+
+
+# ==========================================================
+# MAIN
+# ==========================================================
+
+def main():
+
+    ap = argparse.ArgumentParser(description="Generación masiva de propuestas PDF")
+
+    ap.add_argument("entrada", help="directorio con *.json o archivo .csv")
+    ap.add_argument("--salida", default="salidas_lote")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--forzar", action="store_true", help="regenerar PDFs existentes")
+    ap.add_argument("--verbose", action="store_true")
+    ap.add_argument("--almacen", default=None, help="base SQLite donde guardar los estudios (p. ej. cache/estudios.sqlite)")
+
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+
+    m = generar_lote(
+        args.entrada,
+        args.salida,
+        workers=args.workers,
+        forzar=args.forzar,
+        verbose=args.verbose,
+        almacen=args.almacen,
+    )
+
+    print(
+        f"Lote completo en {time.perf_counter() - t0:.1f} s: "
+        f"{m['ok']} ok, {m['omitido']} omitidos, {m['error']} con error"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+"""
+PRESUPUESTO DE TIEMPO DE IMPORTACIÓN
+FV Engine
+
+Responsabilidad
+---------------
+
+Verificar que los puntos de entrada arrancan rápido y que las
+dependencias pesadas se cargan solo cuando se usa su función:
+
+    matplotlib  → render de figuras (reportes.render_imagenes.pyplot)
+    reportlab   → construcción del PDF
+    pandas      → tablas de la UI
+    requests    → descarga PVGIS (no con cache de clima)
+
+Cada módulo se importa en un intérprete nuevo (sin caches de
+sys.modules) y se comprueba:
+
+    ✔ tiempo de import ≤ presupuesto × factor
+    ✔ ningún módulo prohibido quedó cargado
+
+Uso
+---
+
+    python presupuesto_imports.py
+    python presupuesto_imports.py --factor 2    # máquinas lentas / CI
+
+Sale con código 1 si algún módulo excede su presupuesto.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent
+
+PESADOS = ("matplotlib", "reportlab", "pandas", "requests")
+
+
+# ==========================================================
+# PRESUPUESTOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class Presupuesto:
+
+    modulo: str
+    max_s: float
+    prohibidos: Tuple[str, ...] = PESADOS
+
+
+PRESUPUESTOS: Tuple[Presupuesto, ...] = (
+    # worker por lotes / estudio sin UI
+    Presupuesto("generar_lote", 0.15, PESADOS + ("streamlit", "numpy")),
+    Presupuesto("core.aplicacion.orquestador_estudio", 0.5, PESADOS + ("streamlit",)),
+    Presupuesto("energy.clima.lector_pvgis", 0.1, PESADOS),
+
+    # reportes: importar no es renderizar
+    Presupuesto("reportes.imagenes", 0.15, PESADOS),
+    Presupuesto("reportes.generar_charts", 0.15, PESADOS),
+    Presupuesto("reportes.generar_pdf_profesional", 0.4, ("matplotlib", "pandas", "requests")),
+
+    # UI
+    Presupuesto("ui.resultados", 0.8),
+    Presupuesto("ui.ingenieria_electrica", 1.0),
+    Presupuesto("app", 1.5),
+)
+
+
+# ==========================================================
+# MEDICIÓN
+# ==========================================================
+
+_SONDA = """
+import json, sys, time
+t0 = time.perf_counter()
+import {modulo}
+dt = time.perf_counter() - t0
+print(json.dumps({{"s": dt, "modulos": sorted(m.split(".")[0] for m in sys.modules)}}))
+"""
+
+
+def medir_import(modulo: str, repeticiones: int = 3) -> Tuple[float, List[str]]:
+    """
+    (mejor tiempo en s, módulos raíz cargados) en intérpretes nuevos.
+    """
+
+    mejor = None
+    cargados: List[str] = []
+
+    for _ in range(max(1, repeticiones)):
+
+        r = subprocess.run(
+            [sys.executable, "-c", _SONDA.format(modulo=modulo)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+
+        if r.returncode != 0:
+            raise RuntimeError(f"import {modulo} falló:\n{r.stderr.strip()}")
+
+        datos = json.loads(r.stdout.strip().splitlines()[-1])
+
+        if mejor is None or datos["s"] < mejor:
+            mejor = datos["s"]
+
+        cargados = datos["modulos"]
+
+    return float(mejor), cargados
+
+
+def verificar(factor: float = 1.0, repeticiones: int = 3) -> List[str]:
+    """
+    Devuelve la lista de violaciones (vacía si todo cumple).
+    """
+
+    violaciones: List[str] = []
+
+    for p in PRESUPUESTOS:
+
+        s, cargados = medir_import(p.modulo, repeticiones)
+
+        limite = p.max_s * factor
+        prohibidos = sorted(set(p.prohibidos) & set(cargados))
+
+        ok = s <= limite and not prohibidos
+
+        print(
+            f"{'✔' if ok else '❌'} {p.modulo:<40} {s * 1000:7.1f} ms "
+            f"(≤ {limite * 1000:.0f} ms)"
+            + (f"  carga: {', '.join(prohibidos)}" if prohibidos else "")
+        )
+
+        if s > limite:
+            violaciones.append(f"{p.modulo}: {s:.3f} s > {limite:.3f} s")
+
+        if prohibidos:
+            violaciones.append(f"{p.modulo}: carga {prohibidos}")
+
+    return violaciones
+
+
+# ==========================================================
+# MAIN
+# ==========================================================
+
+def main():
+
+    ap = argparse.ArgumentParser(description="Presupuesto de tiempo de importación")
+
+    ap.add_argument("--factor", type=float, default=1.0, help="escala los presupuestos")
+    ap.add_argument("--repeticiones", type=int, default=3)
+
+    args = ap.parse_args()
+
+    violaciones = verificar(args.factor, args.repeticiones)
+
+    if violaciones:
+        print("\nPresupuesto excedido:")
+        for v in violaciones:
+            print(f"  - {v}")
+        sys.exit(1)
+
+    print("\nPresupuesto de imports OK")
+
+
+if __name__ == "__main__":
+    main()
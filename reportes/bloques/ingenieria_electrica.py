@@ -234,7 +234,7 @@ def build_ingenieria_electrica(resultado, datos, paths, pal, styles, content_w,
     try:
         if strings:
 
-            ruta = Path("outputs/string_fv.png")
+            ruta = Path(paths.get("out_dir") or "outputs") / "string_fv.png"
             ruta.parent.mkdir(parents=True, exist_ok=True)
 
             from reportes.generar_string_fv import generar_string_fv
@@ -4,10 +4,8 @@ from pathlib import Path
 from typing import List
 
 import math
-import matplotlib
-matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt
+from reportes.render_imagenes import TareaImagen, pyplot, renderizar_tareas
 
 
 # ==========================================================
@@ -83,6 +81,8 @@ def _extraer_energia(lista):
 
 def _chart_mensual(meses: List[str], energia: List[float], path: Path):
 
+    plt = pyplot()
+
     plt.figure()
     plt.bar(meses, energia)
 
@@ -98,6 +98,8 @@ def _chart_mensual(meses: List[str], energia: List[float], path: Path):
 
 def _chart_diaria(meses: List[str], energia: List[float], path: Path):
 
+    plt = pyplot()
+
     plt.figure()
     plt.bar(meses, energia)
 
@@ -113,6 +115,8 @@ def _chart_diaria(meses: List[str], energia: List[float], path: Path):
 
 def _chart_potencia_horaria(pdc_kw: float, path: Path):
 
+    plt = pyplot()
+
     horas = list(range(24))
     potencia = []
 
@@ -144,6 +148,8 @@ def _chart_potencia_horaria(pdc_kw: float, path: Path):
 
 def _chart_energia_horaria(pdc_kw: float, path: Path):
 
+    plt = pyplot()
+
     horas = list(range(24))
     energia = []
 
@@ -175,6 +181,8 @@ def _chart_energia_horaria(pdc_kw: float, path: Path):
 
 def _chart_anual(energia_anual: float, path: Path):
 
+    plt = pyplot()
+
     plt.figure()
     plt.bar(["Anual"], [energia_anual])
 
@@ -187,14 +195,10 @@ def _chart_anual(energia_anual: float, path: Path):
 
 
 # ==========================================================
-# GENERADOR PRINCIPAL (LIMPIO)
+# TAREAS (datos primitivos → render en pool / cache)
 # ==========================================================
 
-def generar_charts(
-    res,
-    out_dir=None,
-    vista_resultados=None
-):
+def tareas_charts(res, out_dir=None) -> List[TareaImagen]:
 
     base = _mkdir_charts(out_dir)
 
@@ -210,6 +214,8 @@ def generar_charts(
     else:
         energia_mensual = [0] * 12
 
+    energia_mensual = [float(e) for e in energia_mensual]
+
     meses = [
         "Ene","Feb","Mar","Abr","May","Jun",
         "Jul","Ago","Sep","Oct","Nov","Dic"
@@ -217,41 +223,49 @@ def generar_charts(
 
     energia_anual = sum(energia_mensual)
 
-    paths = {}
-
-    # ======================================================
-    # GRÁFICAS
-    # ======================================================
-
-    # mensual
-    p1 = base / "fv_energia_mensual.png"
-    _chart_mensual(meses, energia_mensual, p1)
-    paths["chart_energia_mensual"] = str(p1)
-
-    # diaria
     energia_diaria = [
         e/d if d else 0 for e, d in zip(energia_mensual, DIAS_MES)
     ]
 
-    p2 = base / "fv_energia_diaria.png"
-    _chart_diaria(meses, energia_diaria, p2)
-    paths["chart_energia_diaria"] = str(p2)
-
-    # potencia
-    pdc_kw = _leer_pdc_kw(res)
+    pdc_kw = float(_leer_pdc_kw(res))
+
+    return [
+        TareaImagen(
+            "chart_energia_mensual", _chart_mensual,
+            str(base / "fv_energia_mensual.png"),
+            {"meses": meses, "energia": energia_mensual},
+        ),
+        TareaImagen(
+            "chart_energia_diaria", _chart_diaria,
+            str(base / "fv_energia_diaria.png"),
+            {"meses": meses, "energia": energia_diaria},
+        ),
+        TareaImagen(
+            "chart_potencia_horaria", _chart_potencia_horaria,
+            str(base / "fv_potencia_horaria.png"),
+            {"pdc_kw": pdc_kw},
+        ),
+        TareaImagen(
+            "chart_energia_horaria", _chart_energia_horaria,
+            str(base / "fv_energia_horaria.png"),
+            {"pdc_kw": pdc_kw},
+        ),
+        TareaImagen(
+            "chart_anual", _chart_anual,
+            str(base / "fv_energia_anual.png"),
+            {"energia_anual": energia_anual},
+        ),
+    ]
 
-    p3 = base / "fv_potencia_horaria.png"
-    _chart_potencia_horaria(pdc_kw, p3)
-    paths["chart_potencia_horaria"] = str(p3)
 
-    # energía horaria
-    p4 = base / "fv_energia_horaria.png"
-    _chart_energia_horaria(pdc_kw, p4)
-    paths["chart_energia_horaria"] = str(p4)
+# ==========================================================
+# GENERADOR PRINCIPAL (LIMPIO)
+# ==========================================================
 
-    # anual
-    p5 = base / "fv_energia_anual.png"
-    _chart_anual(energia_anual, p5)
-    paths["chart_anual"] = str(p5)
+def generar_charts(
+    res,
+    out_dir=None,
+    vista_resultados=None
+):
 
-    return paths
+    return renderizar_tareas(tareas_charts(res, out_dir))
@@ -3,10 +3,8 @@ from __future__ import annotations
 
 from pathlib import Path
 import math
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+
+from reportes.render_imagenes import pyplot
 
 
 # =========================================================
@@ -24,6 +22,8 @@ COLOR_FONDO = "#FFFFFF"
 
 def _dibujar_grid(n, cols, rows, x0, y0, w, h, gap, start_num=1):
 
+    from matplotlib.patches import Rectangle
+
     patches = []
     labels = []
 
@@ -73,6 +73,9 @@ def generar_layout_paneles(
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    plt = pyplot()
+    from matplotlib.patches import Rectangle
+
     fig, ax = plt.subplots(figsize=(10, 4))
     ax.set_facecolor(COLOR_FONDO)
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from reportlab.platypus import SimpleDocTemplate
 from reportlab.lib.pagesizes import letter
@@ -43,6 +45,97 @@ def _ensure_pdf_path(paths: Dict[str, Any]) -> str:
     return str(p)
 
 
+# ==========================================================
+# CONSTRUCCIÓN DE BLOQUES
+# ==========================================================
+
+def _nombre_bloque(bloque: Callable) -> str:
+    return bloque.__name__.removeprefix("build_")
+
+
+def _construir_bloque(
+    bloque: Callable,
+    resultado_proyecto: Any,
+    datos: Any,
+    paths: Dict[str, Any],
+    pal: Dict[str, Any],
+    styles: Any,
+    content_w: float,
+) -> Tuple[List, Dict[str, Any], float]:
+    """
+    Ejecuta un bloque sobre su propia copia de paths.
+
+    Devuelve (flowables, paths del bloque, segundos).
+    """
+
+    paths_bloque = dict(paths)
+
+    t0 = time.perf_counter()
+
+    try:
+        flowables = bloque(
+            resultado_proyecto,
+            datos,
+            paths_bloque,
+            pal,
+            styles,
+            content_w,
+        )
+
+    except Exception as e:
+        raise Exception(f"❌ Error en bloque {bloque.__name__}: {e}")
+
+    return list(flowables), paths_bloque, time.perf_counter() - t0
+
+
+def construir_bloques(
+    resultado_proyecto: Any,
+    datos: Any,
+    paths: Dict[str, Any],
+    pal: Dict[str, Any],
+    styles: Any,
+    content_w: float,
+    *,
+    paralelo: bool = True,
+) -> Tuple[List, Dict[str, float]]:
+    """
+    Construye los BLOQUES_REPORTE y los concatena en orden.
+
+    Los bloques son funciones de los resultados: con paralelo=True
+    se ejecutan en hilos. Las claves que un bloque agrega a paths
+    se incorporan al final, en el orden de BLOQUES_REPORTE.
+
+    Devuelve (story, {bloque: segundos}).
+    """
+
+    args = (resultado_proyecto, datos, paths, pal, styles, content_w)
+
+    if paralelo and len(BLOQUES_REPORTE) > 1:
+        with ThreadPoolExecutor(
+            max_workers=len(BLOQUES_REPORTE),
+            thread_name_prefix="bloque_pdf",
+        ) as ex:
+            futuros = [ex.submit(_construir_bloque, b, *args) for b in BLOQUES_REPORTE]
+            salidas = [f.result() for f in futuros]
+    else:
+        salidas = [_construir_bloque(b, *args) for b in BLOQUES_REPORTE]
+
+    story: List = []
+    tiempos: Dict[str, float] = {}
+
+    for bloque, (flowables, paths_bloque, segundos) in zip(BLOQUES_REPORTE, salidas):
+
+        story += flowables
+
+        for k, v in paths_bloque.items():
+            if paths.get(k) != v:
+                paths[k] = v
+
+        tiempos[_nombre_bloque(bloque)] = round(segundos, 4)
+
+    return story, tiempos
+
+
 # ==========================================================
 # GENERADOR PRINCIPAL DE PDF
 # ==========================================================
@@ -51,18 +144,29 @@ def generar_pdf_profesional(
     resultado_proyecto: Any,
     datos: Any,
     paths: Dict[str, Any],
+    *,
+    paralelo: bool = True,
+    pal: Optional[Dict[str, Any]] = None,
+    styles: Any = None,
 ) -> str:
 
     """
     Genera el reporte PDF profesional del estudio FV.
+
+    pal / styles:
+        reutilizables entre reportes (generación masiva); por
+        defecto se crean con pdf_palette() / pdf_styles().
+
+    Registra en paths["tiempos_bloques_s"] el tiempo de cada bloque
+    y el de doc.build ("construccion_pdf").
     """
 
     # ======================================================
     # CONFIGURACIÓN PDF
     # ======================================================
 
-    pal = pdf_palette()
-    styles = pdf_styles()
+    pal = pdf_palette() if pal is None else pal
+    styles = pdf_styles() if styles is None else styles
 
     pdf_path = _ensure_pdf_path(paths)
 
@@ -71,8 +175,6 @@ def generar_pdf_profesional(
         pagesize=letter,
     )
 
-    story: List = []
-
     content_w = doc.width
 
     # ======================================================
@@ -93,25 +195,26 @@ def generar_pdf_profesional(
     # ENSAMBLAJE DEL REPORTE
     # ======================================================
 
-    for bloque in BLOQUES_REPORTE:
-
-        try:
-            story += bloque(
-                resultado_proyecto,
-                datos,
-                paths,
-                pal,
-                styles,
-                content_w,
-            )
-
-        except Exception as e:
-            raise Exception(f"❌ Error en bloque {bloque.__name__}: {e}")
+    story, tiempos = construir_bloques(
+        resultado_proyecto,
+        datos,
+        paths,
+        pal,
+        styles,
+        content_w,
+        paralelo=paralelo,
+    )
 
     # ======================================================
     # CONSTRUIR PDF
     # ======================================================
 
+    t0 = time.perf_counter()
+
     doc.build(story)
 
+    tiempos["construccion_pdf"] = round(time.perf_counter() - t0, 4)
+
+    paths["tiempos_bloques_s"] = tiempos
+
     return str(pdf_path)
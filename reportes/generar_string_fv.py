@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import matplotlib
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+from reportes.render_imagenes import pyplot
 
 
 def generar_string_fv(strings, out_path, *_, **__):
@@ -13,6 +9,9 @@ def generar_string_fv(strings, out_path, *_, **__):
     if not strings:
         raise ValueError("Lista vacía")
 
+    plt = pyplot()
+    from matplotlib.patches import Rectangle
+
     # ==============================
     # AGRUPAR POR MPPT
     # ==============================
@@ -2,13 +2,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-import matplotlib
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+from reportes.render_imagenes import TareaImagen, pyplot, renderizar_tareas
 
 
 # =========================================================
@@ -77,160 +73,187 @@ def inferir_n_paneles(res: Any) -> int:
 
 
 # =========================================================
-# PIPELINE PRINCIPAL
+# RENDERS DE NIVEL DE MÓDULO (pool de procesos)
 # =========================================================
 
-def generar_artefactos(
-    *,
-    res: Dict[str, Any],
-    out_dir: str | Path,
-    vista_resultados: Optional[Dict[str, Any]] = None,
-    dos_aguas: bool = True,
-    max_cols: int = 7,
-    gap_cumbrera_m: float = 0.35,
-) -> Dict[str, str]:
+def _render_layout_paneles(*, path: str, **kwargs) -> None:
 
-    from reportes.generar_charts import generar_charts
     from reportes.generar_layout_paneles import generar_layout_paneles
 
-    paths = construir_paths_salida(out_dir)
+    generar_layout_paneles(out_path=path, **kwargs)
 
-    # =====================================================
-    # CHARTS
-    # =====================================================
-    charts = generar_charts(
-        res,
-        paths["charts_dir"],
-        vista_resultados=vista_resultados or {},
-    )
 
-    if charts:
-        paths.update({k: str(v) for k, v in charts.items()})
+def _render_string_fv(*, grupos: List[List[int]], path: str) -> None:
+    """
+    grupos: [[inversor, mppt, n_series], ...] ordenados.
+    """
 
-    # =====================================================
-    # LAYOUT PANELES
-    # =====================================================
-    n_paneles = inferir_n_paneles(res)
+    plt = pyplot()
+    from matplotlib.patches import Rectangle
 
-    if n_paneles > 0:
-        generar_layout_paneles(
-            n_paneles=n_paneles,
-            out_path=paths["layout_paneles"],
-            max_cols=max_cols,
-            dos_aguas=bool(dos_aguas),
-            gap_cumbrera_m=float(gap_cumbrera_m),
-        )
+    # ---------- CONFIG ----------
+    panel_w = 0.5
+    panel_h = 1.0
+    gap = 0.15
 
-    # =====================================================
-    # STRING FV (ALINEADO)
-    # =====================================================
-    try:
-        strings = res.get("strings") if isinstance(res, dict) else getattr(res, "strings", None)
+    X_PANEL = 0
+    X_MPPT = 8
+    X_INV = 12
 
-        if not strings:
-            print("❌ No hay strings en res")
-        else:
-            print(f"✔ Strings detectados: {len(strings)}")
+    fig, ax = plt.subplots(figsize=(14, 6))
 
-            path_string = (Path(paths["out_dir"]) / "string_fv.png").resolve()
-            path_string.parent.mkdir(parents=True, exist_ok=True)
+    y_base = 0
+    conexiones = {}
 
-            # ---------- AGRUPAR ----------
-            grupos = {}
-            for s in strings:
-                inv = getattr(s, "inversor", 1)
-                mppt = getattr(s, "mppt", 1)
-                grupos.setdefault((inv, mppt), []).append(s)
+    # ---------- STRINGS ----------
+    for inv, mppt, n in grupos:
 
-            # ---------- CONFIG ----------
-            panel_w = 0.5
-            panel_h = 1.0
-            gap = 0.15
+        y = y_base
 
-            X_PANEL = 0
-            X_MPPT = 8
-            X_INV = 12
+        for i in range(n):
+            x = X_PANEL + i * (panel_w + gap)
 
-            fig, ax = plt.subplots(figsize=(14, 6))
+            ax.add_patch(Rectangle(
+                (x, y),
+                panel_w,
+                panel_h,
+                edgecolor="#0B2E4A",
+                facecolor="#1F2A37"
+            ))
 
-            y_base = 0
-            conexiones = {}
+            if i < n - 1:
+                ax.plot(
+                    [x + panel_w, x + panel_w + gap],
+                    [y + panel_h/2, y + panel_h/2],
+                    color="black"
+                )
 
-            # ---------- STRINGS ----------
-            for (inv, mppt), grupo in sorted(grupos.items()):
-                s = grupo[0]
-                n = int(getattr(s, "n_series", 0) or 0)
+        x_end = X_PANEL + n * (panel_w + gap)
 
-                y = y_base
+        y_pos = y + panel_h * 0.7
+        y_neg = y + panel_h * 0.3
 
-                for i in range(n):
-                    x = X_PANEL + i * (panel_w + gap)
+        ax.plot([x_end, X_MPPT], [y_pos, y_pos], "r", lw=2)
+        ax.plot([x_end, X_MPPT], [y_neg, y_neg], "k", lw=2)
 
-                    ax.add_patch(Rectangle(
-                        (x, y),
-                        panel_w,
-                        panel_h,
-                        edgecolor="#0B2E4A",
-                        facecolor="#1F2A37"
-                    ))
+        ax.plot(X_MPPT, y_pos, "ro")
+        ax.plot(X_MPPT, y_neg, "ko")
 
-                    if i < n - 1:
-                        ax.plot(
-                            [x + panel_w, x + panel_w + gap],
-                            [y + panel_h/2, y + panel_h/2],
-                            color="black"
-                        )
+        ax.text(X_MPPT, y + panel_h + 0.3, f"MPPT {mppt}", ha="center")
 
-                x_end = X_PANEL + n * (panel_w + gap)
+        conexiones.setdefault(inv, []).append((y_pos, y_neg))
 
-                y_pos = y + panel_h * 0.7
-                y_neg = y + panel_h * 0.3
+        y_base -= 2.5
 
-                ax.plot([x_end, X_MPPT], [y_pos, y_pos], "r", lw=2)
-                ax.plot([x_end, X_MPPT], [y_neg, y_neg], "k", lw=2)
+    # ---------- INVERSOR ----------
+    for inv, pts in conexiones.items():
+        y_vals = [yy for (yp, yn) in pts for yy in (yp, yn)]
+        y_mid = sum(y_vals) / len(y_vals)
 
-                ax.plot(X_MPPT, y_pos, "ro")
-                ax.plot(X_MPPT, y_neg, "ko")
+        ax.add_patch(Rectangle(
+            (X_INV, y_mid - 1),
+            2,
+            2,
+            edgecolor="black",
+            facecolor="#eeeeee"
+        ))
 
-                ax.text(X_MPPT, y + panel_h + 0.3, f"MPPT {mppt}", ha="center")
+        ax.text(X_INV + 1, y_mid, f"INV {inv}", ha="center")
 
-                conexiones.setdefault(inv, []).append((y_pos, y_neg))
+        for (y_pos, y_neg) in pts:
+            ax.plot([X_MPPT, X_INV], [y_pos, y_pos], "r", lw=2)
+            ax.plot([X_MPPT, X_INV], [y_neg, y_neg], "k", lw=2)
 
-                y_base -= 2.5
+            ax.plot(X_INV, y_pos, "ro")
+            ax.plot(X_INV, y_neg, "ko")
 
-            # ---------- INVERSOR ----------
-            for inv, pts in conexiones.items():
-                y_vals = [yy for (yp, yn) in pts for yy in (yp, yn)]
-                y_mid = sum(y_vals) / len(y_vals)
+    ax.axis("off")
+    plt.tight_layout()
+    plt.savefig(path, dpi=200, bbox_inches="tight")
+    plt.close()
 
-                ax.add_patch(Rectangle(
-                    (X_INV, y_mid - 1),
-                    2,
-                    2,
-                    edgecolor="black",
-                    facecolor="#eeeeee"
-                ))
 
-                ax.text(X_INV + 1, y_mid, f"INV {inv}", ha="center")
+def _grupos_string(strings) -> List[List[int]]:
 
-                for (y_pos, y_neg) in pts:
-                    ax.plot([X_MPPT, X_INV], [y_pos, y_pos], "r", lw=2)
-                    ax.plot([X_MPPT, X_INV], [y_neg, y_neg], "k", lw=2)
+    grupos = {}
+    for s in strings:
+        inv = getattr(s, "inversor", 1)
+        mppt = getattr(s, "mppt", 1)
+        grupos.setdefault((inv, mppt), []).append(s)
 
-                    ax.plot(X_INV, y_pos, "ro")
-                    ax.plot(X_INV, y_neg, "ko")
+    return [
+        [int(inv), int(mppt), int(getattr(grupo[0], "n_series", 0) or 0)]
+        for (inv, mppt), grupo in sorted(grupos.items())
+    ]
 
-            ax.axis("off")
-            plt.tight_layout()
-            plt.savefig(path_string, dpi=200, bbox_inches="tight")
-            plt.close()
 
-            if path_string.exists():
-                paths["string_fv"] = str(path_string)
-            else:
-                print("❌ No se creó string_fv.png")
+# =========================================================
+# PIPELINE PRINCIPAL
+# =========================================================
 
-    except Exception as e:
-        print("❌ ERROR STRING FV:", e)
+def generar_artefactos(
+    *,
+    res: Dict[str, Any],
+    out_dir: str | Path,
+    vista_resultados: Optional[Dict[str, Any]] = None,
+    dos_aguas: bool = True,
+    max_cols: int = 7,
+    gap_cumbrera_m: float = 0.35,
+) -> Dict[str, str]:
+    """
+    Charts + layout + diagrama de strings.
+
+    Las figuras son independientes: se renderizan juntas en el pool
+    de procesos y se reutilizan desde cache si sus datos no cambiaron
+    (ver reportes.render_imagenes).
+    """
+
+    from reportes.generar_charts import tareas_charts
+
+    paths = construir_paths_salida(out_dir)
+
+    # =====================================================
+    # CHARTS
+    # =====================================================
+    tareas: List[TareaImagen] = tareas_charts(res, paths["charts_dir"])
+
+    # =====================================================
+    # LAYOUT PANELES
+    # =====================================================
+    n_paneles = inferir_n_paneles(res)
+
+    if n_paneles > 0:
+        tareas.append(TareaImagen(
+            "layout_paneles",
+            _render_layout_paneles,
+            paths["layout_paneles"],
+            {
+                "n_paneles": n_paneles,
+                "max_cols": max_cols,
+                "dos_aguas": bool(dos_aguas),
+                "gap_cumbrera_m": float(gap_cumbrera_m),
+            },
+        ))
+
+    # =====================================================
+    # STRING FV (ALINEADO)
+    # =====================================================
+    strings = res.get("strings") if isinstance(res, dict) else getattr(res, "strings", None)
+
+    if not strings:
+        print("❌ No hay strings en res")
+    else:
+        print(f"✔ Strings detectados: {len(strings)}")
+
+        tareas.append(TareaImagen(
+            "string_fv",
+            _render_string_fv,
+            str((Path(paths["out_dir"]) / "string_fv.png").resolve()),
+            {"grupos": _grupos_string(strings)},
+            opcional=True,
+        ))
+
+    paths.update(renderizar_tareas(tareas))
 
     return paths
+
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+"""
+RENDER PARALELO Y CACHE DE IMÁGENES DEL REPORTE
+FV Engine
+
+Responsabilidad
+---------------
+
+Renderizar las figuras independientes del reporte (charts, layout,
+diagrama de strings) en un pool de procesos y reutilizar los PNG
+cuando los datos de entrada no cambiaron.
+
+    TareaImagen (función + kwargs primitivos + destino)
+            ↓
+    huella = sha256(función, kwargs, VERSION_GRAFICOS)
+            ↓
+    cache/charts/<huella>.png  ── existe → copia al destino
+            ↓ no existe
+    pool de procesos (matplotlib por proceso, backend Agg)
+            ↓
+    escritura atómica en cache → copia al destino
+
+Reglas
+------
+
+    ✔ las funciones de render son de módulo (picklables)
+    ✔ kwargs solo con tipos JSON (la huella es el contenido)
+    ✔ pool persistente con "spawn" (seguro con hilos de Streamlit)
+    ✔ si el pool falla, se renderiza en el proceso actual
+    ✔ matplotlib se importa al primer render (pyplot())
+    ❌ no decide QUÉ se grafica (eso es generar_charts / imagenes)
+
+Subir VERSION_GRAFICOS al cambiar el estilo de cualquier figura
+invalida todas las imágenes cacheadas.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+CACHE_DIR = Path("cache") / "charts"
+
+VERSION_GRAFICOS = 1
+
+MAX_PROCESOS = 4
+
+
+# ==========================================================
+# MODELOS
+# ==========================================================
+
+@dataclass(frozen=True)
+class TareaImagen:
+    """
+    Una figura a renderizar.
+
+    clave:    nombre en el dict de paths del reporte
+    funcion:  fn(**kwargs, path=str) de nivel de módulo
+    opcional: si falla, se informa y se omite (no aborta el reporte)
+    """
+
+    clave: str
+    funcion: Callable[..., Any]
+    destino: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    opcional: bool = False
+
+
+def huella_tarea(tarea: TareaImagen) -> str:
+
+    payload = {
+        "version": VERSION_GRAFICOS,
+        "funcion": f"{tarea.funcion.__module__}.{tarea.funcion.__qualname__}",
+        "kwargs": tarea.kwargs,
+    }
+
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ==========================================================
+# POOL PERSISTENTE
+# ==========================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _n_procesos() -> int:
+    return max(1, min(MAX_PROCESOS, os.cpu_count() or 1))
+
+
+def _obtener_pool() -> ProcessPoolExecutor:
+
+    global _pool
+
+    with _pool_lock:
+
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=_n_procesos(),
+                mp_context=get_context("spawn"),
+            )
+
+        return _pool
+
+
+def cerrar_pool() -> None:
+
+    global _pool
+
+    with _pool_lock:
+
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+atexit.register(cerrar_pool)
+
+
+# ==========================================================
+# MATPLOTLIB (import diferido)
+# ==========================================================
+
+def pyplot():
+    """
+    matplotlib.pyplot con backend Agg.
+
+    Los módulos de figuras lo llaman dentro de sus funciones de
+    render: importar reportes no carga matplotlib.
+    """
+
+    import matplotlib
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+# ==========================================================
+# RENDER (lado worker)
+# ==========================================================
+
+def _render_en_cache(funcion: Callable[..., Any], kwargs: Dict[str, Any], destino_cache: str) -> str:
+    """
+    Renderiza a un temporal y lo publica con os.replace.
+    """
+
+    pyplot()
+
+    final = Path(destino_cache)
+    final.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = final.with_name(f"{final.stem}.{os.getpid()}.{threading.get_ident()}.tmp.png")
+
+    try:
+        funcion(**kwargs, path=str(tmp))
+        os.replace(tmp, final)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    return str(final)
+
+
+# ==========================================================
+# API
+# ==========================================================
+
+def renderizar_tareas(
+    tareas: Sequence[TareaImagen],
+    *,
+    cache_dir: str | Path = CACHE_DIR,
+    usar_cache: bool = True,
+    paralelo: bool = True,
+) -> Dict[str, str]:
+    """
+    Renderiza (o reutiliza) todas las tareas.
+
+    Devuelve {clave: destino} de las tareas generadas.
+    """
+
+    cache_dir = Path(cache_dir)
+
+    pendientes: List[tuple] = []
+    listas: Dict[str, str] = {}
+
+    for t in tareas:
+
+        origen = cache_dir / f"{huella_tarea(t)}.png"
+
+        if usar_cache and origen.exists():
+            listas[t.clave] = str(origen)
+        else:
+            pendientes.append((t, str(origen)))
+
+    # ------------------------------------------------------
+    # RENDER DE LO QUE FALTA
+    # ------------------------------------------------------
+
+    errores: Dict[str, BaseException] = {}
+
+    futuros = {}
+
+    # con una sola CPU el pool solo añade el arranque de procesos
+    if paralelo and len(pendientes) > 1 and _n_procesos() > 1:
+
+        try:
+            pool = _obtener_pool()
+
+            for t, origen in pendientes:
+                futuros[t.clave] = pool.submit(_render_en_cache, t.funcion, t.kwargs, origen)
+
+        except (BrokenProcessPool, RuntimeError, OSError):
+            cerrar_pool()
+            futuros = {}
+
+    for t, origen in pendientes:
+
+        try:
+            if t.clave in futuros:
+                try:
+                    listas[t.clave] = futuros[t.clave].result()
+                except BrokenProcessPool:
+                    cerrar_pool()
+                    listas[t.clave] = _render_en_cache(t.funcion, t.kwargs, origen)
+            else:
+                listas[t.clave] = _render_en_cache(t.funcion, t.kwargs, origen)
+
+        except Exception as e:
+            errores[t.clave] = e
+
+    # ------------------------------------------------------
+    # COPIA A DESTINOS
+    # ------------------------------------------------------
+
+    out: Dict[str, str] = {}
+
+    for t in tareas:
+
+        if t.clave in errores:
+
+            if not t.opcional:
+                raise errores[t.clave]
+
+            print(f"❌ ERROR IMAGEN {t.clave}:", errores[t.clave])
+            continue
+
+        destino = Path(t.destino)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+
+        shutil.copyfile(listas[t.clave], destino)
+
+        out[t.clave] = str(destino)
+
+    return out
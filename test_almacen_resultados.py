@@ -0,0 +1,112 @@
+"""
+Reapertura de estudios del almacén SQLite.
+
+Un estudio guardado antes de que Datosproyecto / PanelSpec ganaran
+campos (vida útil, modelo térmico) debe reabrirse con esos campos en
+su valor por defecto; un blob ilegible es ValueError, no un objeto a
+medio construir.
+
+Uso:
+
+    python test_almacen_resultados.py
+    python -m pytest -q test_almacen_resultados.py
+"""
+
+import pprint
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from benchmarks.entradas import estudio_fijo
+from core.aplicacion.almacen_resultados import AlmacenResultados
+from core.aplicacion.serializacion_resultado import serializar_resultado
+from electrical.modelos.paneles import CoeficientesTermicos
+from test_serializacion_resultado import _editar_arbol
+
+
+CAMPOS_NUEVOS_DATOS = (
+    "vida_util_anios",
+    "lid_frac",
+    "degradacion_anual_frac",
+    "modelo_degradacion",
+    "modelo_termico",
+)
+
+
+def _quitar_campos_datos(arbol):
+    for nombre in CAMPOS_NUEVOS_DATOS:
+        del arbol["campos"][nombre]
+
+
+def _quitar_termico(arbol):
+    del arbol["campos"]["sizing"]["campos"]["panel"]["campos"]["termico"]
+
+
+def _reescribir(ruta: Path, id_estudio: int, **blobs: bytes) -> None:
+
+    con = sqlite3.connect(ruta)
+
+    with con:
+        for columna, blob in blobs.items():
+            con.execute(f"UPDATE estudios SET {columna} = ? WHERE id = ?", (blob, id_estudio))
+
+    con.close()
+
+
+def test_reabre_estudio_de_version_anterior():
+
+    datos, resultado = estudio_fijo()
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        ruta = Path(tmp) / "estudios.sqlite"
+        alm = AlmacenResultados(ruta)
+
+        id_ = alm.guardar(datos, resultado)
+
+        _reescribir(
+            ruta,
+            id_,
+            datos=_editar_arbol(serializar_resultado(datos), _quitar_campos_datos),
+            resultado=_editar_arbol(serializar_resultado(resultado), _quitar_termico),
+        )
+
+        e = alm.abrir(id_)
+
+        e.datos.validar_minimo()
+
+        assert e.datos.modelo_termico == "noct"
+        assert e.datos.vida_util_anios == 25
+        assert e.resultado.sizing.panel.termico == CoeficientesTermicos()
+
+        # expander de debug de la UI
+        pprint.pformat(e.resultado)
+
+
+def test_blob_ilegible_es_error():
+
+    datos, resultado = estudio_fijo()
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        ruta = Path(tmp) / "estudios.sqlite"
+        alm = AlmacenResultados(ruta)
+
+        id_ = alm.guardar(datos, resultado)
+
+        _reescribir(ruta, id_, resultado=b"no es un resultado")
+
+        try:
+            alm.abrir(id_)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("se esperaba ValueError")
+
+
+if __name__ == "__main__":
+
+    for nombre, fn in list(globals().items()):
+        if nombre.startswith("test_") and callable(fn):
+            fn()
+            print(f"✔ {nombre}")
@@ -0,0 +1,90 @@
+"""
+Alineación consumo ↔ FV en la curva de cobertura.
+
+Las series FV están en UTC y el perfil diario de consumo en hora
+local: una carga senoidal con pico al mediodía solar local debe
+quedar alineada con el pico de la FV una vez rotada por el desfase
+del sitio. Los tamaños sin ahorro reportan payback infinito.
+
+Uso:
+
+    python test_cobertura_alineacion.py
+    python -m pytest -q test_cobertura_alineacion.py
+"""
+
+import dataclasses
+
+import numpy as np
+
+from benchmarks.entradas import LON, estudio_fijo
+from core.servicios.analisis_cobertura import curva_cobertura_proyecto
+from core.servicios.consumo import desfase_utc_horas, perfil_consumo_horario
+from core.servicios.optimizador_sizing import dc_por_kwp_desde_energia
+
+
+# carga senoidal diurna con pico a las 12 h locales
+PERFIL_SENO = tuple(max(0.0, float(np.sin(np.pi * (h + 0.5 - 6) / 12))) for h in range(24))
+
+
+def _hora_pico(serie_8760: np.ndarray) -> int:
+    return int(np.argmax(np.asarray(serie_8760).reshape(365, 24).mean(axis=0)))
+
+
+def test_carga_senoidal_alineada_con_fv():
+
+    _, resultado = estudio_fijo()
+
+    fv = dc_por_kwp_desde_energia(resultado.energia)
+
+    carga = perfil_consumo_horario([1000.0] * 12, PERFIL_SENO, desfase_utc_h=desfase_utc_horas(LON))
+
+    diferencia = (_hora_pico(carga) - _hora_pico(fv) + 12) % 24 - 12
+
+    assert abs(diferencia) <= 1, f"pico carga {_hora_pico(carga)} h vs FV {_hora_pico(fv)} h (UTC)"
+
+
+def test_perfil_conserva_consumo_mensual():
+
+    consumo = [float(100 * (m + 1)) for m in range(12)]
+
+    carga = perfil_consumo_horario(consumo, desfase_utc_h=-6)
+
+    inicio = np.concatenate(([0], np.cumsum([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[:-1])) * 24
+
+    assert np.allclose(np.add.reduceat(carga, inicio), consumo)
+
+
+def test_curva_proyecto_usa_desfase_del_sitio():
+
+    datos, resultado = estudio_fijo()
+
+    alineada = curva_cobertura_proyecto(
+        datos, resultado.energia, potencia_panel_kw=0.55, perfil_diario=PERFIL_SENO,
+    )
+
+    sin_desfase = curva_cobertura_proyecto(
+        datos, resultado.energia, potencia_panel_kw=0.55, perfil_diario=PERFIL_SENO, desfase_utc_h=0,
+    )
+
+    # carga diurna alineada con la FV → más autoconsumo en todos los tamaños
+    assert (alineada.autoconsumo_kwh >= sin_desfase.autoconsumo_kwh - 1e-6).all()
+    assert alineada.autoconsumo_kwh.sum() > 1.2 * sin_desfase.autoconsumo_kwh.sum()
+
+
+def test_payback_sin_ahorro_es_infinito():
+
+    datos, resultado = estudio_fijo()
+
+    curva = curva_cobertura_proyecto(
+        dataclasses.replace(datos, tarifa_energia=0.0), resultado.energia, potencia_panel_kw=0.55,
+    )
+
+    assert np.isinf(curva.payback).all()
+
+
+if __name__ == "__main__":
+
+    for nombre, fn in list(globals().items()):
+        if nombre.startswith("test_") and callable(fn):
+            fn()
+            print(f"✔ {nombre}")
@@ -1,35 +1,36 @@
 from energy.orquestador_energia import ejecutar_motor_energia
 from energy.contrato import EnergiaInput
+from energy.clima.simulacion_8760 import simular_clima_8760
+
+from benchmarks.entradas import PANEL, clima_sintetico
+
+
+# clima 8760 sintético (sin red) ya transpuesto al plano
+clima_8760 = simular_clima_8760(clima_sintetico(), tilt=15, azimuth=180)
 
 
 entrada = EnergiaInput(
 
-    # potencia sistema
-    pdc_instalada_kw = 5.0,
-    pac_nominal_kw = 4.5,
+    # generador
+    n_series = 10,
+    n_strings = 1,
+    pdc_kw = 10 * PANEL.pmax_w / 1000,
 
-    # modo
-    modo_simulacion = "mensual",
+    panel = PANEL,
+    pac_nominal_kw = 4.5,
 
     # recurso solar
-    hsp_12m = [
-        5.5,5.7,6.0,6.2,6.3,6.1,
-        5.8,5.7,5.6,5.4,5.2,5.1
-    ],
-
-    dias_mes = [
-        31,28,31,30,31,30,
-        31,31,30,31,30,31
-    ],
+    clima = clima_8760,
 
     # orientación
+    tilt_deg = 15,
     azimut_deg = 180,
-    hemisferio = "norte",
 
-    # pérdidas
-    perdidas_dc_pct = 2,
-    perdidas_ac_pct = 1.5,
-    sombras_pct = 2
+    # pérdidas (fracciones 0–1)
+    perdidas_dc_frac = 0.02,
+    sombras_frac = 0.02,
+    eficiencia_inversor = 0.97,
+    perdidas_ac_frac = 0.015,
 )
 
 
@@ -37,7 +38,7 @@ resultado = ejecutar_motor_energia(entrada)
 
 print("\nRESULTADO DEL MOTOR\n")
 
-print("OK:", resultado.ok)
+print("OK:", resultado.ok, resultado.errores)
 print("Producción anual:", resultado.energia_util_anual, "kWh")
 
 print("\nProducción mensual:")
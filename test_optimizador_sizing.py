@@ -0,0 +1,118 @@
+"""
+Optimizador de sizing sobre la simulación del estudio.
+
+Comprueba el frente de Pareto, la selección del mejor payback (con
+empates resueltos hacia menor CAPEX), que los candidatos usan las
+mismas pérdidas que la simulación y que un candidato que no se
+recupera reporta payback None.
+
+Uso:
+
+    python test_optimizador_sizing.py
+    python -m pytest -q test_optimizador_sizing.py
+"""
+
+import dataclasses
+import json
+
+import numpy as np
+
+from benchmarks.entradas import estudio_fijo
+from core.servicios.optimizador_sizing import _frente_pareto, optimizar_sizing_proyecto
+
+
+COSTO_INVERSOR_USD_KW = 150.0
+
+
+def _optimizar(**kwargs):
+
+    datos, resultado = estudio_fijo()
+
+    kwargs.setdefault("costo_inversor_usd_kw", COSTO_INVERSOR_USD_KW)
+
+    return optimizar_sizing_proyecto(datos, resultado.energia, resultado.sizing.panel, **kwargs)
+
+
+def test_frente_pareto_no_dominado():
+
+    rng = np.random.default_rng(7)
+
+    capex = rng.integers(1, 20, 300).astype(float)
+    energia = rng.integers(1, 20, 300).astype(float)
+
+    frente = set(_frente_pareto(capex, energia).tolist())
+
+    for i in range(len(capex)):
+
+        dominado = bool(
+            ((capex <= capex[i]) & (energia >= energia[i]) & ((capex < capex[i]) | (energia > energia[i]))).any()
+        )
+
+        if dominado:
+            assert i not in frente
+        else:
+            # entre duplicados exactos basta con uno en el frente
+            assert any(capex[j] == capex[i] and energia[j] == energia[i] for j in frente)
+
+
+def test_frente_del_estudio_creciente():
+
+    r = _optimizar()
+
+    capex = [c.capex_L for c in r.frente_pareto]
+    energia = [c.energia_util_anual_kwh for c in r.frente_pareto]
+
+    assert len(r.frente_pareto) > 1
+    assert all(b > a for a, b in zip(energia, energia[1:]))
+    assert all(b >= a for a, b in zip(capex, capex[1:]))
+
+
+def test_mejor_payback_desempata_por_capex():
+
+    tol = 0.01
+
+    exacto = _optimizar(tolerancia_payback_frac=0.0).mejor_payback
+    mejor = _optimizar(tolerancia_payback_frac=tol).mejor_payback
+
+    assert mejor.capex_L <= exacto.capex_L
+    assert mejor.payback_anios <= exacto.payback_anios * (1 + tol)
+
+
+def test_candidato_usa_perdidas_de_la_simulacion():
+
+    datos, resultado = estudio_fijo()
+
+    # misma configuración que el estudio: 10 paneles y su inversor
+    r = _optimizar(
+        inversores_ids=[datos.equipos["inversor_id"]],
+        n_paneles=[10],
+        n_inversores_max=1,
+        dc_ac_min=0.0,
+    )
+
+    assert np.isclose(r.frente_pareto[0].energia_util_anual_kwh, resultado.energia.energia_util_anual)
+
+
+def test_sin_recuperacion_payback_none():
+
+    datos, resultado = estudio_fijo()
+
+    r = optimizar_sizing_proyecto(
+        dataclasses.replace(datos, tarifa_energia=1e-6, om_anual_pct=0.05),
+        resultado.energia,
+        resultado.sizing.panel,
+        costo_inversor_usd_kw=COSTO_INVERSOR_USD_KW,
+    )
+
+    assert r.mejor_payback is None
+    assert all(c.payback_anios is None for c in r.frente_pareto)
+
+    json.dumps(dataclasses.asdict(r.frente_pareto[0]), allow_nan=False)
+
+
+if __name__ == "__main__":
+
+    for nombre, fn in list(globals().items()):
+        if nombre.startswith("test_") and callable(fn):
+            fn()
+            print(f"✔ {nombre}")
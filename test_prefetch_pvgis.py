@@ -0,0 +1,205 @@
+"""
+Prefetch de clima PVGIS contra un servidor local.
+
+Un http.server en 127.0.0.1 sirve la respuesta seriescalc grabada en
+fixtures/pvgis_seriescalc_dia.json (un día, repetido sobre las 8760
+horas del año pedido). El servidor cuenta las peticiones por sitio y
+puede responder 503 a la primera petición de un sitio.
+
+Comprueba:
+    ✔ deduplicación de coordenadas tras el redondeo
+    ✔ reintento ante un 503
+    ✔ el cache queda lleno y una segunda pasada no descarga nada
+
+Uso:
+
+    python test_prefetch_pvgis.py
+    python -m pytest -q test_prefetch_pvgis.py
+"""
+
+import json
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from energy.clima.cache_clima import clave_clima, existe_cache_clima
+from energy.clima.prefetch_pvgis import prefetch_clima_pvgis
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "pvgis_seriescalc_dia.json"
+
+ANIO = 2019
+
+# sitios equivalentes tras redondear a 2 decimales + uno distinto
+COORDENADAS = [
+    (15.8001, -87.2002),
+    (15.79996, -87.20004),
+    (15.8, -87.2),
+    (14.1, -87.2),
+]
+
+
+# ==========================================================
+# SERVIDOR LOCAL
+# ==========================================================
+
+def _payload_anual(anio: int) -> bytes:
+    """
+    Respuesta grabada con el día repetido sobre todo el año.
+    """
+
+    grabado = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    dia = grabado["outputs"]["hourly"]
+
+    if len(dia) != 24:
+        raise ValueError("fixture: se esperaban 24 horas")
+
+    inicio = datetime(anio, 1, 1)
+
+    hourly = []
+
+    for i in range(8760):
+        h = dict(dia[i % 24])
+        h["time"] = (inicio + timedelta(hours=i)).strftime("%Y%m%d:%H10")
+        hourly.append(h)
+
+    grabado["outputs"]["hourly"] = hourly
+
+    return json.dumps(grabado).encode("utf-8")
+
+
+def _sitio(query: str) -> tuple:
+
+    q = parse_qs(query)
+
+    return float(q["lat"][0]), float(q["lon"][0])
+
+
+@contextmanager
+def servidor_pvgis(fallar_primero=()):
+    """
+    Servidor seriescalc local. Devuelve (url, peticiones por sitio).
+    """
+
+    peticiones: Counter = Counter()
+    pendientes_503 = set(fallar_primero)
+    lock = threading.Lock()
+    cuerpos = {}
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+
+            partes = urlparse(self.path)
+            sitio = _sitio(partes.query)
+            anio = int(parse_qs(partes.query)["startyear"][0])
+
+            with lock:
+                peticiones[sitio] += 1
+                fallar = sitio in pendientes_503
+                pendientes_503.discard(sitio)
+
+                if anio not in cuerpos:
+                    cuerpos[anio] = _payload_anual(anio)
+
+                cuerpo = cuerpos[anio]
+
+            if fallar:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    hilo = threading.Thread(target=srv.serve_forever, daemon=True)
+    hilo.start()
+
+    try:
+        yield f"http://127.0.0.1:{srv.server_address[1]}/api/seriescalc", peticiones
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _prefetch(url: str, cache_dir: Path, coordenadas=COORDENADAS):
+
+    return prefetch_clima_pvgis(
+        coordenadas,
+        startyear=ANIO,
+        endyear=ANIO,
+        max_concurrencia=2,
+        reintentos=2,
+        backoff_s=0.01,
+        timeout_s=10,
+        url=url,
+        cache_dir=cache_dir,
+    )
+
+
+# ==========================================================
+# PRUEBAS
+# ==========================================================
+
+def test_deduplica_tras_redondeo():
+
+    with tempfile.TemporaryDirectory() as tmp, servidor_pvgis() as (url, peticiones):
+
+        r = _prefetch(url, Path(tmp))
+
+        assert r.ok, r.errores
+        assert len(r.descargados) == 2
+        assert peticiones == Counter({(15.8, -87.2): 1, (14.1, -87.2): 1})
+
+
+def test_reintenta_ante_503():
+
+    with tempfile.TemporaryDirectory() as tmp, servidor_pvgis(fallar_primero={(15.8, -87.2)}) as (url, peticiones):
+
+        r = _prefetch(url, Path(tmp))
+
+        assert r.ok, r.errores
+        assert peticiones[(15.8, -87.2)] == 2
+        assert peticiones[(14.1, -87.2)] == 1
+
+
+def test_llena_cache():
+
+    with tempfile.TemporaryDirectory() as tmp, servidor_pvgis() as (url, peticiones):
+
+        cache_dir = Path(tmp)
+
+        primera = _prefetch(url, cache_dir)
+
+        for lat, lon in ((15.8, -87.2), (14.1, -87.2)):
+            assert existe_cache_clima(clave_clima(lat, lon, ANIO, ANIO), cache_dir)
+
+        antes = sum(peticiones.values())
+
+        segunda = _prefetch(url, cache_dir)
+
+        assert segunda.descargados == []
+        assert sorted(segunda.en_cache) == primera.descargados
+        assert sum(peticiones.values()) == antes
+
+
+if __name__ == "__main__":
+
+    for nombre, fn in list(globals().items()):
+        if nombre.startswith("test_") and callable(fn):
+            fn()
+            print(f"✔ {nombre}")
@@ -0,0 +1,146 @@
+"""
+Serialización binaria de ResultadoProyecto.
+
+Ida y vuelta de un estudio completo y lectura de blobs escritos con
+una versión anterior de las dataclasses (campos ausentes o que ya no
+existen).
+
+Uso:
+
+    python test_serializacion_resultado.py
+    python -m pytest -q test_serializacion_resultado.py
+"""
+
+import dataclasses
+import json
+
+import numpy as np
+
+from benchmarks.entradas import PANEL, estudio_fijo
+from core.aplicacion.serializacion_resultado import (
+    VERSION_FORMATO,
+    _CABECERA,
+    _relleno,
+    deserializar_resultado,
+    serializar_resultado,
+)
+from electrical.modelos.paneles import CoeficientesTermicos
+
+
+def _editar_arbol(blob: bytes, editar, version=None) -> bytes:
+    """
+    Reescribe el árbol JSON de un blob (simula un blob de otra versión).
+    """
+
+    magia, version_blob, reservado, n = _CABECERA.unpack_from(blob, 0)
+
+    if version is None:
+        version = version_blob
+
+    fin_json = _CABECERA.size + n
+
+    cab = json.loads(blob[_CABECERA.size:fin_json].decode("utf-8"))
+    binario = blob[fin_json + _relleno(fin_json):]
+
+    editar(cab["arbol"])
+
+    nuevo = json.dumps(cab, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return b"".join([
+        _CABECERA.pack(magia, version, reservado, len(nuevo)),
+        nuevo,
+        b"\0" * _relleno(_CABECERA.size + len(nuevo)),
+        binario,
+    ])
+
+
+def test_ida_y_vuelta_estudio():
+
+    _, resultado = estudio_fijo()
+
+    blob = serializar_resultado(resultado)
+
+    leido = deserializar_resultado(blob)
+
+    assert serializar_resultado(leido) == blob
+    assert leido.sizing.panel == resultado.sizing.panel
+    assert leido.financiero["payback_anios"] == resultado.financiero["payback_anios"]
+    assert np.array_equal(leido.energia.series.ac_final_kw, resultado.energia.series.ac_final_kw)
+    assert leido.energia.energia_horaria_kwh == list(resultado.energia.energia_horaria_kwh)
+
+
+def test_campo_ausente_toma_default():
+
+    _, resultado = estudio_fijo()
+
+    def quitar_termico(arbol):
+        del arbol["campos"]["sizing"]["campos"]["panel"]["campos"]["termico"]
+
+    leido = deserializar_resultado(_editar_arbol(serializar_resultado(resultado), quitar_termico))
+
+    assert leido.sizing.panel.termico == CoeficientesTermicos()
+
+    repr(leido.sizing.panel)
+
+
+def test_campo_obligatorio_ausente_es_error():
+
+    def quitar_pmax(arbol):
+        del arbol["campos"]["pmax_w"]
+
+    blob = _editar_arbol(serializar_resultado(PANEL), quitar_pmax)
+
+    try:
+        deserializar_resultado(blob)
+    except ValueError as e:
+        assert "PanelSpec.pmax_w" in str(e)
+    else:
+        raise AssertionError("se esperaba ValueError")
+
+
+def test_clave_desconocida_se_descarta():
+
+    def agregar_obsoleto(arbol):
+        arbol["campos"]["campo_obsoleto"] = 1
+
+    leido = deserializar_resultado(_editar_arbol(serializar_resultado(PANEL), agregar_obsoleto))
+
+    assert leido == PANEL
+    assert not hasattr(leido, "campo_obsoleto")
+    assert dataclasses.asdict(leido) == dataclasses.asdict(PANEL)
+
+
+def test_lee_blob_version_1():
+
+    datos, _ = estudio_fijo()
+
+    def quitar_campos_v2(arbol):
+        for nombre in ("vida_util_anios", "lid_frac", "degradacion_anual_frac", "modelo_degradacion", "modelo_termico"):
+            del arbol["campos"][nombre]
+
+    leido = deserializar_resultado(_editar_arbol(serializar_resultado(datos), quitar_campos_v2, version=1))
+
+    leido.validar_minimo()
+
+    assert leido.modelo_termico == "noct"
+    assert leido.modelo_degradacion == "lineal"
+
+
+def test_version_futura_es_error():
+
+    blob = _editar_arbol(serializar_resultado(PANEL), lambda arbol: None, version=VERSION_FORMATO + 1)
+
+    try:
+        deserializar_resultado(blob)
+    except ValueError as e:
+        assert "Versión de formato no soportada" in str(e)
+    else:
+        raise AssertionError("se esperaba ValueError")
+
+
+if __name__ == "__main__":
+
+    for nombre, fn in list(globals().items()):
+        if nombre.startswith("test_") and callable(fn):
+            fn()
+            print(f"✔ {nombre}")
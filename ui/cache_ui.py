@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+"""
+CAPA DE CACHE DE LA UI (STREAMLIT)
+FV Engine
+
+Streamlit vuelve a ejecutar el script completo en cada interacción.
+Este módulo concentra lo que NO debe repetirse entre reruns.
+
+RESPONSABILIDAD
+----------------
+
+- recursos compartidos (st.cache_resource):
+    dependencias del estudio (adapters)
+    catálogos serializados para los selectores
+    almacén SQLite de estudios guardados
+
+- resultados del estudio (st.cache_data):
+    clave = build_inputs_fingerprint(ctx)
+    entradas acotadas (MAX_ESTUDIOS_CACHEADOS)
+
+- worker de estudios en segundo plano (pool compartido)
+
+Un cambio de página del wizard no vuelve a disparar PVGIS ni la
+simulación 8760: solo un cambio en los inputs genera otra clave.
+
+Los estudios fallidos NO se cachean (un error de red de PVGIS
+debe poder reintentarse con los mismos inputs).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import streamlit as st
+
+from core.aplicacion.dependencias import DependenciasEstudio, construir_dependencias
+from core.aplicacion.ejecucion_asincrona import TrabajoEstudio, lanzar_estudio
+from core.aplicacion.orquestador_estudio import ejecutar_estudio
+from core.aplicacion.progreso import Reportero, seguimiento
+from core.dominio.contrato import ResultadoProyecto
+from core.dominio.modelo import Datosproyecto
+from electrical.catalogos import catalogo_inversores, catalogo_paneles
+from ui.state_helpers import build_inputs_fingerprint
+
+
+MAX_ESTUDIOS_CACHEADOS = 8
+
+MAX_ESTUDIOS_PARALELOS = 2
+
+
+# ==========================================================
+# RECURSOS
+# ==========================================================
+
+@st.cache_resource(show_spinner=False)
+def dependencias_estudio() -> DependenciasEstudio:
+    return construir_dependencias()
+
+
+@st.cache_resource(show_spinner=False)
+def ejecutor_estudios() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=MAX_ESTUDIOS_PARALELOS,
+        thread_name_prefix="estudio",
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def almacen_estudios():
+    """
+    AlmacenResultados local (cache/estudios.sqlite).
+    """
+
+    from core.aplicacion.almacen_resultados import AlmacenResultados
+
+    return AlmacenResultados()
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def catalogos_serializados(firma: Tuple) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    (paneles, inversores) tal como los devuelve el catálogo.
+
+    firma:
+        firma_catalogo(); al cambiar un YAML se crea otra entrada.
+    """
+
+    return catalogo_paneles(), catalogo_inversores()
+
+
+# ==========================================================
+# ESTUDIO
+# ==========================================================
+
+class _EstudioFallido(Exception):
+    """
+    Transporta un resultado no-ok fuera de la función cacheada
+    (las excepciones no se guardan en cache).
+    """
+
+    def __init__(self, resultado: ResultadoProyecto):
+        super().__init__("estudio no ok")
+        self.resultado = resultado
+
+
+@st.cache_data(show_spinner=False, max_entries=MAX_ESTUDIOS_CACHEADOS)
+def _estudio_cacheado(fingerprint: str, _datos: Datosproyecto) -> ResultadoProyecto:
+
+    resultado = ejecutar_estudio(_datos, dependencias_estudio())
+
+    if not resultado.ok:
+        raise _EstudioFallido(resultado)
+
+    return resultado
+
+
+def estudio_por_huella(fingerprint: str, datos: Datosproyecto) -> ResultadoProyecto:
+
+    try:
+        return _estudio_cacheado(fingerprint, datos)
+    except _EstudioFallido as e:
+        return e.resultado
+
+
+def ejecutar_estudio_cacheado(ctx: Any, datos: Datosproyecto) -> ResultadoProyecto:
+    """
+    ejecutar_estudio con cache por huella de inputs del wizard.
+    """
+
+    return estudio_por_huella(build_inputs_fingerprint(ctx), datos)
+
+
+def lanzar_estudio_cacheado(ctx: Any, datos: Datosproyecto) -> TrabajoEstudio:
+    """
+    Igual que ejecutar_estudio_cacheado, pero en el worker.
+
+    Un acierto de cache termina de inmediato (sin eventos de etapa).
+    """
+
+    fingerprint = build_inputs_fingerprint(ctx)
+
+    def _fn(progreso: Reportero) -> ResultadoProyecto:
+        with seguimiento(progreso):
+            return estudio_por_huella(fingerprint, datos)
+
+    return lanzar_estudio(_fn, ejecutor_estudios(), etiqueta=fingerprint)
+
+
+def limpiar_cache_estudios() -> None:
+    _estudio_cacheado.clear()
@@ -87,6 +87,9 @@ class WizardCtx:
 
     resultado_proyecto: Optional[Any] = None
 
+    # estudio en segundo plano (core.aplicacion.ejecucion_asincrona)
+    trabajo_estudio: Optional[Any] = None
+
     # ------------------------------------------------------
     # Artefactos generados
     # ------------------------------------------------------
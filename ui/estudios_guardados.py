@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+"""
+ESTUDIOS GUARDADOS (UI)
+FV Engine
+
+Responsabilidad
+---------------
+
+- guardar cada estudio terminado en el almacén SQLite local
+- listar los estudios recientes en la barra lateral
+- reabrir un estudio sin recalcular (inputs + resultado)
+
+El almacenamiento vive en core.aplicacion.almacen_resultados;
+este módulo solo lo conecta con WizardCtx.
+"""
+
+import streamlit as st
+
+from ui.cache_ui import almacen_estudios
+from ui.state_helpers import inputs_snapshot, restore_inputs, save_result_fingerprint
+
+
+MAX_LISTADOS = 15
+
+PASO_RESULTADOS = 6
+
+
+# ==========================================================
+# GUARDAR
+# ==========================================================
+
+def guardar_estudio(ctx, resultado, huella: str) -> None:
+    """
+    Best-effort: un fallo del almacén no invalida el estudio.
+    """
+
+    datos = getattr(ctx, "datos_proyecto", None)
+
+    if datos is None or not getattr(resultado, "ok", False):
+        return
+
+    try:
+        almacen_estudios().guardar(
+            datos,
+            resultado,
+            huella=huella,
+            entradas_ui=inputs_snapshot(ctx),
+        )
+
+    except Exception as ex:
+        st.warning(f"No se pudo guardar el estudio: {ex}")
+
+
+# ==========================================================
+# REABRIR
+# ==========================================================
+
+def _abrir(ctx, id_estudio: int) -> bool:
+    """
+    False si el estudio no se pudo leer (el ctx no se modifica).
+    """
+
+    try:
+        e = almacen_estudios().abrir(id_estudio)
+
+    except Exception as ex:
+        st.error(f"No se pudo abrir el estudio {id_estudio}: {ex}")
+        return False
+
+    restore_inputs(ctx, e.entradas_ui or {})
+
+    ctx.datos_proyecto = e.datos
+    ctx.resultado = e.resultado
+    ctx.resultado_proyecto = e.resultado
+    ctx.trabajo_estudio = None
+
+    st.session_state["datos_proyecto"] = e.datos
+    st.session_state["resultado_proyecto"] = e.resultado
+
+    # los inputs restaurados son los del resultado → no "desactualizado"
+    save_result_fingerprint(ctx)
+
+    ctx.artefactos.clear()
+
+    for paso in range(1, PASO_RESULTADOS + 1):
+        ctx.completado[paso] = True
+
+    ctx.paso_actual = PASO_RESULTADOS
+
+    return True
+
+
+# ==========================================================
+# SIDEBAR
+# ==========================================================
+
+def render_sidebar(ctx) -> None:
+
+    with st.sidebar.expander("📂 Estudios guardados"):
+
+        texto = st.text_input("Cliente o ubicación", key="estudios_filtro")
+        payback_max = st.number_input("Payback máx. (años)", min_value=0.0, value=0.0, step=1.0, key="estudios_payback")
+
+        try:
+            estudios = almacen_estudios().buscar(
+                texto=texto or None,
+                payback_max=payback_max or None,
+                limite=MAX_LISTADOS,
+            )
+
+        except Exception as ex:
+            st.caption(f"Almacén no disponible: {ex}")
+            return
+
+        if not estudios:
+            st.caption("Sin estudios guardados")
+            return
+
+        for e in estudios:
+
+            kwp = f"{e.kwp:.1f} kWp" if e.kwp is not None else "-"
+            payback = f" · {e.payback_anios:.1f} años" if e.payback_anios is not None else " · payback > vida útil"
+
+            st.caption(f"**{e.cliente or '(sin cliente)'}** · {e.ubicacion}\n\n{kwp}{payback} · {e.fecha[:10]}")
+
+            if st.button("Abrir", key=f"abrir_estudio_{e.id}") and _abrir(ctx, e.id):
+                st.rerun()
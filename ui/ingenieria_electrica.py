@@ -1,10 +1,12 @@
+import time
+
 import streamlit as st
-import pandas as pd
 import pprint
 
-from core.aplicacion.dependencias import construir_dependencias
-from core.aplicacion.orquestador_estudio import ejecutar_estudio
 from core.aplicacion.datos_proyecto import construir_datos_proyecto
+from core.aplicacion.progreso import EstudioCancelado
+from ui.cache_ui import lanzar_estudio_cacheado
+from ui.estudios_guardados import guardar_estudio
 
 
 # ==========================================================
@@ -50,6 +52,8 @@ def _ui_inputs_electricos(e):
 # ==========================================================
 def _render_resultado(resultado):
 
+    import pandas as pd
+
     st.markdown("## ⚡ Resultado ingeniería")
 
     if resultado is None:
@@ -191,6 +195,69 @@ def _render_resultado(resultado):
         st.code(pprint.pformat(resultado), language="python")
 
 
+# ==========================================================
+# ESTUDIO EN SEGUNDO PLANO
+# ==========================================================
+INTERVALO_SONDEO_S = 0.5
+
+_ETIQUETAS_ETAPA = {
+    "sizing": "Dimensionamiento",
+    "paneles": "Paneles y strings",
+    "clima": "Clima (PVGIS)",
+    "solar": "Geometría solar 8760",
+    "energia": "Simulación de energía",
+    "electrical": "Ingeniería eléctrica",
+    "finanzas": "Finanzas",
+    "fin": "Finalizando",
+}
+
+
+def _ui_trabajo_en_curso(ctx, trabajo):
+
+    if not trabajo.terminado:
+
+        evento = trabajo.ultimo_evento()
+
+        fraccion = evento.fraccion if evento else 0.0
+        texto = _ETIQUETAS_ETAPA.get(evento.etapa, evento.etapa) if evento else "En cola"
+
+        if trabajo.cancelado:
+            texto = f"Cancelando… ({texto})"
+
+        st.progress(fraccion, text=texto)
+
+        if st.button("Cancelar", disabled=trabajo.cancelado):
+            trabajo.cancelar()
+
+        time.sleep(INTERVALO_SONDEO_S)
+        st.rerun()
+
+    ctx.trabajo_estudio = None
+
+    try:
+        resultado = trabajo.resultado()
+
+    except EstudioCancelado:
+        st.warning("Estudio cancelado")
+        return
+
+    except Exception as ex:
+        st.error("💥 Error")
+        st.exception(ex)
+        return
+
+    setattr(ctx, "resultado", resultado)
+    setattr(ctx, "resultado_proyecto", resultado)
+    st.session_state["resultado_proyecto"] = resultado
+
+    # huella de los inputs con los que se lanzó (no los actuales)
+    setattr(ctx, "result_inputs_fingerprint", trabajo.etiqueta)
+
+    guardar_estudio(ctx, resultado, trabajo.etiqueta)
+
+    st.success("✅ Ingeniería generada")
+
+
 # ==========================================================
 # MAIN
 # ==========================================================
@@ -201,22 +268,20 @@ def render(ctx):
     e = _asegurar_dict(ctx, "electrico")
     _ui_inputs_electricos(e)
 
-    if st.button("⚡ Generar ingeniería eléctrica"):
+    trabajo = getattr(ctx, "trabajo_estudio", None)
+
+    if trabajo is not None:
+        _ui_trabajo_en_curso(ctx, trabajo)
+
+    elif st.button("⚡ Generar ingeniería eléctrica"):
 
         try:
             p = construir_datos_proyecto(ctx)
             setattr(ctx, "datos_proyecto", p)
             st.session_state["datos_proyecto"] = p
-            deps = construir_dependencias()
-            resultado = ejecutar_estudio(p, deps)
-
-            setattr(ctx, "resultado", resultado)
-            setattr(ctx, "resultado_proyecto", resultado)
-            st.session_state["resultado_proyecto"] = resultado
-
-            st.success("✅ Ingeniería generada")
 
-            _render_resultado(resultado)
+            ctx.trabajo_estudio = lanzar_estudio_cacheado(ctx, p)
+            st.rerun()
 
         except Exception as ex:
             st.error("💥 Error")
@@ -4,14 +4,10 @@ import copy
 from typing import List, Tuple
 
 import streamlit as st
-import pandas as pd
 
 from ui.state_helpers import is_result_stale
 from ui.rutas import preparar_salida
 
-from reportes.generar_pdf_profesional import generar_pdf_profesional
-from reportes.imagenes import generar_artefactos
-
 
 # ==========================================================
 # VALIDACIÓN
@@ -41,6 +37,8 @@ def _get_resultado_proyecto(ctx):
 # ==========================================================
 def _tabla(titulo: str, data: dict):
 
+    import pandas as pd
+
     st.markdown(f"### {titulo}")
 
     df = pd.DataFrame({
@@ -117,11 +115,14 @@ def _render_finanzas(rp):
         st.warning("Sin datos financieros")
         return
 
+    payback = f.get("payback_anios")
+
     _tabla("💰 Finanzas", {
-        "Inversión": f"L {getattr(f, 'inversion_total', 0):,.0f}",
-        "Ahorro anual": f"L {getattr(f, 'ahorro_anual', 0):,.0f}",
-        "Payback": f"{getattr(f, 'payback', 0):.1f} años",
-        "TIR": f"{getattr(f, 'tir', 0)*100:.1f} %",
+        "Inversión": f"L {f.get('capex_L', 0):,.0f}",
+        "Ahorro anual": f"L {f.get('ahorro_anual_L', 0):,.0f}",
+        # None = no se recupera dentro de la vida útil
+        "Payback": f"{payback:.1f} años" if payback is not None else "> vida útil",
+        "TIR": f"{f.get('tir_pct', 0):.1f} %",
     })
 
 
@@ -136,6 +137,10 @@ def _ui_boton_pdf(disabled=False):
 
 def _ejecutar_pipeline_pdf(ctx, rp):
 
+    # reportlab / matplotlib solo al generar el PDF
+    from reportes.generar_pdf_profesional import generar_pdf_profesional
+    from reportes.imagenes import generar_artefactos
+
     paths = preparar_salida("salidas")
 
     try:
@@ -32,6 +32,7 @@ from typing import Callable, List, Tuple
 import streamlit as st
 
 from ui.estado import ctx_get, ctx_set_paso
+from ui.estudios_guardados import render_sidebar as render_estudios_guardados
 
 
 # ==========================================================
@@ -159,6 +160,8 @@ def _sidebar_nav(pasos: List[PasoWizard], paso_actual: int, ctx):
 
             st.rerun()
 
+    render_estudios_guardados(ctx)
+
 
 # ==========================================================
 # Header del wizard
@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import List, Tuple, Dict, Any
+from math import ceil
+from typing import List, Optional, Tuple, Dict, Any
 import streamlit as st
 
-from electrical.catalogos import catalogo_paneles, catalogo_inversores
+from electrical.catalogos import firma_catalogo
+from electrical.paneles.compatibilidad import consultar_pares
+from ui.cache_ui import catalogos_serializados
 from ui.state_helpers import ensure_dict, merge_defaults
 
 
@@ -18,6 +21,7 @@ def _defaults(ctx) -> None:
         "sobredimension_dc_ac": 1.20,
         "tension_sistema": "2F+N_120/240",
         "strings_config": None,
+        "solo_compatibles": True,
     })
     ctx.equipos = eq
 
@@ -64,11 +68,13 @@ def _inv_to_ui(iid: str, inv: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _load_paneles():
-    return [_panel_to_ui(p["id"], p) for p in catalogo_paneles()]
+    paneles, _ = catalogos_serializados(firma_catalogo())
+    return [_panel_to_ui(p["id"], p) for p in paneles]
 
 
 def _load_inversores():
-    return [_inv_to_ui(i["id"], i) for i in catalogo_inversores()]
+    _, inversores = catalogos_serializados(firma_catalogo())
+    return [_inv_to_ui(i["id"], i) for i in inversores]
 
 
 def _map_por_id(items):
@@ -89,15 +95,78 @@ def _ui_select_panel(eq, panel_ids, panel_map):
     )
 
 
-def _ui_select_inversor(eq, inv_ids, inv_map):
+def _ui_select_inversor(eq, inv_ids, inv_map, pares=None):
+    pares = pares or {}
+
+    def _fmt(iid):
+        txt = f'{inv_map[iid]["marca"]} {inv_map[iid]["modelo"]} ({inv_map[iid]["kw_ac"]:.1f} kW)'
+        par = pares.get(iid)
+        if par is not None:
+            txt += f" · {par.n_series_min}–{par.n_series_max} en serie"
+        return txt
+
     eq["inversor_id"] = st.selectbox(
         "Inversor",
         inv_ids,
         index=_safe_index(inv_ids, eq.get("inversor_id")),
-        format_func=lambda iid:
-        f'{inv_map[iid]["marca"]} {inv_map[iid]["modelo"]} ({inv_map[iid]["kw_ac"]:.1f} kW)'
+        format_func=_fmt,
+    )
+
+
+# ==========================================================
+# COMPATIBILIDAD PANEL / INVERSOR
+# ==========================================================
+
+def _n_paneles_estimado(ctx, panel: Optional[Dict[str, Any]]) -> Optional[int]:
+    entrada = getattr(ctx, "sistema_fv", {}).get("sizing_input", {}) or {}
+
+    if entrada.get("modo") == "paneles":
+        return int(entrada.get("valor") or 0) or None
+
+    if entrada.get("modo") == "kw_objetivo" and panel and panel["pmax_w"] > 0:
+        return int(ceil(float(entrada.get("valor") or 0) * 1000 / panel["pmax_w"])) or None
+
+    return None
+
+
+def _ui_filtro_compatibilidad(ctx, eq, inv_ids, panel_map):
+    """
+    Devuelve (inversores a listar, pares por inversor) para el panel elegido.
+    """
+
+    panel_id = eq.get("panel_id")
+
+    if not panel_id:
+        return inv_ids, {}
+
+    eq["solo_compatibles"] = st.checkbox(
+        "Solo inversores compatibles con el panel",
+        value=bool(eq.get("solo_compatibles", True)),
+    )
+
+    t_min_c = float(getattr(ctx, "electrico", {}).get("t_min_c", 10.0))
+
+    pares = consultar_pares(
+        t_min_c=t_min_c,
+        panel_id=panel_id,
+        n_paneles=_n_paneles_estimado(ctx, panel_map.get(panel_id)),
+        dc_ac_objetivo=float(eq.get("sobredimension_dc_ac", 1.2)),
+        solo_validos=eq["solo_compatibles"],
     )
 
+    por_inv = {p.inversor_id: p for p in pares}
+
+    if not eq["solo_compatibles"]:
+        return inv_ids, por_inv
+
+    ordenados = [p.inversor_id for p in pares if p.inversor_id in inv_ids]
+
+    if not ordenados:
+        st.warning(f"Ningún inversor del catálogo es compatible a {t_min_c:.0f} °C")
+        return inv_ids, por_inv
+
+    return ordenados, por_inv
+
 
 def _ui_criterios(eq):
     st.markdown("### Criterios")
@@ -202,7 +271,8 @@ def render(ctx):
         _ui_select_panel(eq, panel_ids, panel_map)
 
     with col2:
-        _ui_select_inversor(eq, inv_ids, inv_map)
+        inv_ids, pares = _ui_filtro_compatibilidad(ctx, eq, inv_ids, panel_map)
+        _ui_select_inversor(eq, inv_ids, inv_map, pares)
 
     _ui_criterios(eq)
     _ui_resumen(eq, panel_map, inv_map)
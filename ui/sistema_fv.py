@@ -20,6 +20,9 @@ def _defaults_sistema_fv() -> Dict[str, Any]:
             "valor": 80.0
         },
         "zonas": [],
+        "modelo_transposicion": "isotropico",
+        "pasos_por_hora": 1,
+        "modelo_termico": "noct",
     }
 
 
@@ -138,6 +141,73 @@ def _render_dimensionamiento(sf):
                     "azimut": 180.0,
                     "inclinacion": 15.0,
                 }]
+
+# ==========================================================
+# SIMULACIÓN
+# ==========================================================
+_MODELOS_CIELO = {
+    "Isotrópico (Liu & Jordan)": "isotropico",
+    "Perez (anisotrópico)": "perez",
+}
+
+_RESOLUCIONES = {
+    "Horaria (60 min)": 1,
+    "15 min (clipping preciso)": 4,
+    "5 min (clipping preciso)": 12,
+}
+
+_MODELOS_TERMICOS = {
+    "NOCT (sin viento)": "noct",
+    "Faiman (con viento)": "faiman",
+    "PVsyst (con viento)": "pvsyst",
+    "SAPM (con viento)": "sapm",
+}
+
+
+def _render_simulacion(sf):
+
+    st.markdown("### Simulación")
+
+    etiquetas = list(_MODELOS_CIELO.keys())
+    actual = sf.get("modelo_transposicion", "isotropico")
+    idx = list(_MODELOS_CIELO.values()).index(actual) if actual in _MODELOS_CIELO.values() else 0
+
+    etiqueta = st.selectbox(
+        "Modelo de cielo (transposición a plano)",
+        etiquetas,
+        index=idx,
+        key="modelo_transposicion"
+    )
+
+    sf["modelo_transposicion"] = _MODELOS_CIELO[etiqueta]
+
+    etiquetas = list(_RESOLUCIONES.keys())
+    actual = sf.get("pasos_por_hora", 1)
+    idx = list(_RESOLUCIONES.values()).index(actual) if actual in _RESOLUCIONES.values() else 0
+
+    etiqueta = st.selectbox(
+        "Resolución de simulación",
+        etiquetas,
+        index=idx,
+        key="pasos_por_hora"
+    )
+
+    sf["pasos_por_hora"] = _RESOLUCIONES[etiqueta]
+
+    etiquetas = list(_MODELOS_TERMICOS.keys())
+    actual = sf.get("modelo_termico", "noct")
+    idx = list(_MODELOS_TERMICOS.values()).index(actual) if actual in _MODELOS_TERMICOS.values() else 0
+
+    etiqueta = st.selectbox(
+        "Modelo térmico de celda",
+        etiquetas,
+        index=idx,
+        key="modelo_termico"
+    )
+
+    sf["modelo_termico"] = _MODELOS_TERMICOS[etiqueta]
+
+
 # ==========================================================
 # ZONAS
 # ==========================================================
@@ -231,6 +301,8 @@ def render(ctx):
     if sf.get("usar_zonas"):
         _render_zonas(sf)
 
+    _render_simulacion(sf)
+
     ctx.sistema_fv = sf
     # ======================================================
     # 🔥 TRADUCCIÓN SIMPLE (NO TOCAR NADA MÁS)
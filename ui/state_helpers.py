@@ -96,6 +96,19 @@ def save_result_fingerprint(ctx: Any) -> str:
     return fp
 
 
+def inputs_snapshot(ctx: Any) -> Dict[str, Any]:
+    """
+    Copia JSON-safe de los inputs del fingerprint (para guardar un estudio).
+    """
+    return {k: _norm_value(getattr(ctx, k, None)) for k in _FINGERPRINT_KEYS}
+
+
+def restore_inputs(ctx: Any, snapshot: Dict[str, Any]) -> None:
+    for k in _FINGERPRINT_KEYS:
+        if k in snapshot:
+            setattr(ctx, k, snapshot[k])
+
+
 def is_result_stale(ctx: Any) -> bool:
     saved = getattr(ctx, "result_inputs_fingerprint", None)
     if not saved: